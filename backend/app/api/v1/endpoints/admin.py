@@ -1,27 +1,41 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
-from typing import Optional
+from typing import Literal, Optional
 from datetime import date
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from starlette.status import WS_1003_UNSUPPORTED_DATA, WS_1008_POLICY_VIOLATION
+from app.core.database import get_db, get_read_db, async_session_maker
+from app.core.unit_of_work import UnitOfWorkRoute, commit
+from app.core.config import settings
 from app.core.dependencies import get_current_admin
+from app.core.exceptions import AppException, NotFoundException
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.profiling import get_profile_store
+from app.core.responses import FastJSONResponse, PrecompressedJSONResponse
+from app.core.security import verify_token
 from app.schemas import (
     AdminOrdersResponse,
     OrderStatusUpdate, OrderStatusResponse, OrderDeleteResponse,
     TableCreate, TableResponse, SessionEndResponse,
+    BulkSessionEndRequest, BulkSessionEndResponse,
     TableHistoryResponse,
     MenuListResponse, MenuCreate, MenuUpdate, MenuResponse,
+    ProfileListResponse, ProfileDetailResponse,
 )
 from app.services import OrderService, TableService, MenuService
-from app.services.sse_service import get_sse_service
+from app.services import event_codec
+from app.services.sse_service import get_sse_service, event_generator
 from app.repositories import (
     OrderRepository, SessionRepository, MenuRepository, TableRepository,
     CategoryRepository, HistoryRepository,
 )
 import asyncio
-import json
+import logging
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=UnitOfWorkRoute)
 
 
 # 의존성 함수들
@@ -47,65 +61,30 @@ def get_menu_service(db: AsyncSession = Depends(get_db)) -> MenuService:
     return MenuService(MenuRepository(db), CategoryRepository(db))
 
 
+def get_read_order_service(db: AsyncSession = Depends(get_read_db)) -> OrderService:
+    return get_order_service(db)
+
+
+def get_read_menu_service(db: AsyncSession = Depends(get_read_db)) -> MenuService:
+    return get_menu_service(db)
+
+
 # 주문 관리
 @router.get("/orders", response_model=AdminOrdersResponse)
 async def get_orders(
     status: Optional[str] = None,
     table_id: Optional[int] = None,
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db)
+    order_service: OrderService = Depends(get_read_order_service)
 ):
     """주문 목록 조회"""
-    store_id = current_admin["store_id"]
-    order_repo = OrderRepository(db)
-    table_repo = TableRepository(db)
-    
-    # 테이블별 주문 조회
-    tables = await table_repo.get_all_by_store(store_id)
-    result_tables = []
-    
-    for table in tables:
-        if table_id and table.table_id != table_id:
-            continue
-        
-        if not table.current_session_id:
-            continue
-        
-        orders = await order_repo.get_by_session(table.current_session_id)
-        if status:
-            orders = [o for o in orders if o.status == status]
-        
-        total = sum(o.total_amount for o in orders)
-        
-        result_tables.append({
-            "table_id": table.table_id,
-            "table_number": table.table_number,
-            "session_id": table.current_session_id,
-            "total_amount": total,
-            "order_count": len(orders),
-            "orders": [
-                {
-                    "order_id": o.order_id,
-                    "total_amount": o.total_amount,
-                    "status": o.status,
-                    "order_time": o.order_time,
-                    "items": [
-                        {
-                            "order_item_id": item.order_item_id,
-                            "menu_id": item.menu_id,
-                            "menu_name": item.menu.menu_name if item.menu else "Unknown",
-                            "quantity": item.quantity,
-                            "unit_price": item.unit_price,
-                            "subtotal": item.subtotal,
-                        }
-                        for item in o.items
-                    ]
-                }
-                for o in orders
-            ]
-        })
-    
-    return {"store_id": store_id, "tables": result_tables}
+    board = await order_service.get_store_board(
+        current_admin["store_id"],
+        status,
+        table_id,
+    )
+    # 서비스가 스키마대로 만든 payload이므로 response_model 재검증 생략
+    return FastJSONResponse(board)
 
 
 @router.patch("/orders/{order_id}/status", response_model=OrderStatusResponse)
@@ -140,35 +119,26 @@ async def delete_order(
 
 
 # SSE 스트림
-async def event_generator(store_id: int, connection_id: str, queue: asyncio.Queue):
-    sse_service = get_sse_service()
-    try:
-        while True:
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                event_type = event["event"]
-                data = json.dumps(event["data"], ensure_ascii=False, default=str)
-                yield f"event: {event_type}\ndata: {data}\n\n"
-            except asyncio.TimeoutError:
-                yield ": ping\n\n"
-    except asyncio.CancelledError:
-        pass
-    finally:
-        sse_service.unregister_connection(connection_id)
+async def load_store_board(store_id: int) -> dict:
+    """SSE 초기 스냅샷 조회 (스트림 동안 DB 연결을 점유하지 않도록 별도 세션 사용)"""
+    async with async_session_maker() as db:
+        return await get_order_service(db).get_store_board(store_id)
 
 
 @router.get("/orders/sse")
 async def order_stream(
     current_admin: dict = Depends(get_current_admin),
 ):
-    """실시간 주문 업데이트 SSE"""
+    """실시간 주문 업데이트 SSE (initial 스냅샷 이후 실시간 이벤트)"""
     store_id = current_admin["store_id"]
     sse_service = get_sse_service()
     
-    connection_id, queue = await sse_service.register_connection(store_id)
+    connection_id, queue = await sse_service.open_stream(
+        store_id, lambda: load_store_board(store_id)
+    )
     
     return StreamingResponse(
-        event_generator(store_id, connection_id, queue),
+        event_generator(connection_id, queue),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -178,11 +148,184 @@ async def order_stream(
     )
 
 
+async def _send_frame(websocket: WebSocket, frame: list, encoding: str) -> None:
+    message = event_codec.encode(frame, encoding)
+    if isinstance(message, bytes):
+        await websocket.send_bytes(message)
+    else:
+        await websocket.send_text(message)
+
+
+async def _pump_events(
+    websocket: WebSocket,
+    connection_id: str,
+    queue: asyncio.Queue,
+    encoding: str,
+    send_lock: asyncio.Lock,
+) -> None:
+    """큐 이벤트를 WebSocket 프레임으로 전송"""
+    connection = get_sse_service().get_connection(connection_id)
+    while True:
+        try:
+            item = await asyncio.wait_for(
+                queue.get(), timeout=settings.sse_heartbeat_interval
+            )
+        except asyncio.TimeoutError:
+            async with send_lock:
+                await _send_frame(websocket, event_codec.ping_frame(), encoding)
+            continue
+        
+        events = item if isinstance(item, list) else [item]
+        async with send_lock:
+            for event in events:
+                await _send_frame(websocket, event_codec.event_frame(event), encoding)
+        if connection is not None:
+            connection.events_sent += len(events)
+
+
+async def _update_status_from_socket(store_id: int, order_id: int, status_value: str) -> dict:
+    """소켓 상태 변경 요청 처리 (메시지마다 단기 세션 사용)"""
+    new_status = OrderStatusUpdate(status=status_value).status
+    async with async_session_maker() as db:
+        order = await get_order_service(db).update_order_status(
+            order_id, new_status, store_id
+        )
+        await commit(db)
+    return {"order_id": order.order_id, "status": order.status}
+
+
+async def _handle_message(message: list, connection_id: str, store_id: int) -> Optional[list]:
+    """검증된 클라이언트 메시지 처리 (응답 프레임이 없으면 None)
+    
+    메시지 하나의 실패가 연결 전체를 끊지 않도록 모든 예외를 결과 프레임으로 바꾼다.
+    """
+    kind = message[0]
+    if kind == event_codec.MSG_ACK:
+        connection = get_sse_service().get_connection(connection_id)
+        if connection is not None:
+            connection.last_ack_id = message[1]
+        return None
+    
+    if kind == event_codec.MSG_PING:
+        return event_codec.ping_frame()
+    
+    _, ref, order_id, status_value = message
+    try:
+        result = await _update_status_from_socket(store_id, order_id, status_value)
+        return event_codec.result_frame(ref, True, result)
+    except AppException as e:
+        return event_codec.result_frame(
+            ref, False, {"code": e.error_code, "message": e.message}
+        )
+    except PydanticValidationError:
+        return event_codec.result_frame(
+            ref, False, {"code": "VALIDATION_ERROR", "message": "Invalid status"}
+        )
+    except Exception:
+        logger.exception("WebSocket status update failed", extra={"store_id": store_id})
+        return event_codec.result_frame(
+            ref, False, {"code": "INTERNAL_ERROR", "message": "Status update failed"}
+        )
+
+
+async def _receive_messages(
+    websocket: WebSocket,
+    connection_id: str,
+    store_id: int,
+    encoding: str,
+    send_lock: asyncio.Lock,
+) -> None:
+    """클라이언트 ack/상태 변경/ping 메시지 처리"""
+    while True:
+        # 인코딩과 다른 종류(텍스트/바이너리)의 프레임도 디코드 오류로 처리
+        received = await websocket.receive()
+        if received["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(received.get("code", 1000))
+        raw = received.get("bytes") if received.get("bytes") is not None else received.get("text")
+        
+        try:
+            message = event_codec.decode(raw, encoding)
+        except event_codec.FrameError as e:
+            if e.ref is None:
+                continue
+            frame = event_codec.result_frame(
+                e.ref, False, {"code": "INVALID_MESSAGE", "message": str(e)}
+            )
+        else:
+            frame = await _handle_message(message, connection_id, store_id)
+            if frame is None:
+                continue
+        
+        async with send_lock:
+            await _send_frame(websocket, frame, encoding)
+
+
+@router.websocket("/orders/ws")
+async def order_socket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    encoding: str = Query("msgpack"),
+):
+    """실시간 주문 WebSocket (주방 디스플레이용 압축 프레임, 상태 변경 지원)
+    
+    브라우저 WebSocket은 헤더를 지정할 수 없으므로 토큰은 쿼리 파라미터로 전달한다.
+    """
+    try:
+        current_admin = verify_token(token)
+    except ValueError:
+        await websocket.close(code=WS_1008_POLICY_VIOLATION)
+        return
+    if current_admin.get("user_type") != "admin":
+        await websocket.close(code=WS_1008_POLICY_VIOLATION)
+        return
+    if encoding not in event_codec.ENCODINGS:
+        await websocket.close(code=WS_1003_UNSUPPORTED_DATA)
+        return
+    
+    store_id = current_admin["store_id"]
+    sse_service = get_sse_service()
+    await websocket.accept()
+    
+    connection_id, queue = await sse_service.open_stream(
+        store_id, lambda: load_store_board(store_id)
+    )
+    send_lock = asyncio.Lock()
+    tasks = [
+        asyncio.create_task(
+            _pump_events(websocket, connection_id, queue, encoding, send_lock)
+        ),
+        asyncio.create_task(
+            _receive_messages(websocket, connection_id, store_id, encoding, send_lock)
+        ),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not task.cancelled() and not isinstance(task.exception(), WebSocketDisconnect):
+                task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        sse_service.unregister_connection(connection_id)
+
+
+@router.get("/orders/sse/connections")
+async def get_sse_connections(
+    current_admin: dict = Depends(get_current_admin),
+):
+    """매장 SSE 연결별 통계 조회"""
+    store_id = current_admin["store_id"]
+    return {
+        "store_id": store_id,
+        "connections": get_sse_service().get_connection_stats(store_id),
+    }
+
+
 # 테이블 관리
 @router.get("/tables")
 async def get_all_tables(
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """모든 테이블 조회"""
     store_id = current_admin["store_id"]
@@ -219,6 +362,19 @@ async def create_table(
     return table
 
 
+@router.post("/tables/end-sessions", response_model=BulkSessionEndResponse)
+async def end_table_sessions(
+    request: Optional[BulkSessionEndRequest] = None,
+    current_admin: dict = Depends(get_current_admin),
+    table_service: TableService = Depends(get_table_service)
+):
+    """테이블 세션 일괄 종료 (table_ids 미지정 시 매장 전체)"""
+    return await table_service.end_sessions(
+        current_admin["store_id"],
+        request.table_ids if request else None,
+    )
+
+
 @router.post("/tables/{table_id}/end-session", response_model=SessionEndResponse)
 async def end_table_session(
     table_id: int,
@@ -235,44 +391,65 @@ async def get_table_history(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    offset: int = Query(0, ge=0, description="cursor가 없을 때만 사용 (하위 호환)"),
+    count: Optional[Literal["exact", "none"]] = Query(
+        None, description="전체 건수 계산 여부 (기본: 첫 페이지만 exact)"
+    ),
     current_admin: dict = Depends(get_current_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """테이블 과거 내역 조회"""
+    """테이블 과거 내역 조회 (completed_time 최신순 keyset 페이지)"""
     table_repo = TableRepository(db)
     history_repo = HistoryRepository(db)
     
     table = await table_repo.get_by_id(table_id)
     if not table or table.store_id != current_admin["store_id"]:
-        from app.core.exceptions import NotFoundException
         raise NotFoundException("Table not found")
     
-    history = await history_repo.get_by_table(
-        table_id, start_date, end_date, limit, offset
+    after = decode_cursor(cursor) if cursor else None
+    if count is None:
+        count = "none" if cursor else "exact"
+    count_limit = settings.history_count_limit if count == "exact" else None
+    
+    # 페이지와 전체 건수를 한 쿼리로 조회
+    history, total_count = await history_repo.get_page_by_table(
+        table_id, start_date, end_date, limit,
+        after=after, offset=offset, count_limit=count_limit,
     )
-    total_count = await history_repo.count_by_table(table_id, start_date, end_date)
+    
+    has_more = len(history) > limit
+    history = history[:limit]
+    capped = bool(count_limit) and total_count is not None and total_count > count_limit
     
     return {
         "table_id": table_id,
         "table_number": table.table_number,
-        "total_count": total_count,
+        "total_count": count_limit if capped else total_count,
+        "total_count_capped": capped,
         "history": history,
+        "has_more": has_more,
+        "next_cursor": (
+            encode_cursor(history[-1].completed_time, history[-1].history_id)
+            if has_more else None
+        ),
     }
 
 
 # 메뉴 관리
 @router.get("/menus", response_model=MenuListResponse)
 async def get_menus(
+    http_request: Request,
     category_id: Optional[int] = None,
     current_admin: dict = Depends(get_current_admin),
-    menu_service: MenuService = Depends(get_menu_service)
+    menu_service: MenuService = Depends(get_read_menu_service)
 ):
-    """메뉴 목록 조회"""
-    return await menu_service.get_menus_by_store(
+    """메뉴 목록 조회 (캐시된 압축본 그대로 전송)"""
+    menus = await menu_service.get_menus_encoded(
         current_admin["store_id"],
         category_id,
     )
+    return PrecompressedJSONResponse(menus, http_request.headers.get("accept-encoding", ""))
 
 
 @router.post("/menus", response_model=MenuResponse, status_code=201)
@@ -314,3 +491,27 @@ async def delete_menu(
     """메뉴 삭제"""
     await menu_service.delete_menu(menu_id, current_admin["store_id"])
     return {"message": "Menu deleted successfully", "menu_id": menu_id}
+
+
+@router.get("/profiles", response_model=ProfileListResponse)
+async def get_profiles(
+    current_admin: dict = Depends(get_current_admin)
+):
+    """매장 요청 프로파일 목록 (최근 순, 현재 워커 보관분)"""
+    reports = get_profile_store().list(current_admin["store_id"])
+    return {
+        "profiles": [report.to_dict() for report in reports],
+        "total_count": len(reports),
+    }
+
+
+@router.get("/profiles/{request_id}", response_model=ProfileDetailResponse)
+async def get_profile(
+    request_id: str,
+    current_admin: dict = Depends(get_current_admin)
+):
+    """request_id로 프로파일 리포트 조회"""
+    report = get_profile_store().get(request_id)
+    if report is None or report.store_id != current_admin["store_id"]:
+        raise NotFoundException("Profile not found")
+    return report.to_dict(include_report=True)
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.core.rate_limit import get_login_throttle
 from app.schemas import (
     TableLoginRequest, TableLoginResponse,
     AdminLoginRequest, AdminLoginResponse,
@@ -8,7 +11,7 @@ from app.schemas import (
 from app.services import AuthService
 from app.repositories import StoreRepository, TableRepository, SessionRepository
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
+router = APIRouter(prefix="/auth", tags=["Auth"], route_class=UnitOfWorkRoute)
 
 
 def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
@@ -19,12 +22,29 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     )
 
 
+def _client_ip(request: Request) -> str:
+    """로그인 제한용 클라이언트 IP
+    
+    X-Forwarded-For는 여기서 직접 읽지 않는다. uvicorn이 forwarded_allow_ips에 등록된
+    프록시에서 온 요청에 한해 헤더 값으로 client를 바꿔 주므로, 그 외 클라이언트는
+    헤더를 위조해도 자신의 접속 IP로 제한된다.
+    """
+    return request.client.host if request.client else "unknown"
+
+
 @router.post("/table/login", response_model=TableLoginResponse)
 async def table_login(
     request: TableLoginRequest,
+    http_request: Request,
     auth_service: AuthService = Depends(get_auth_service)
 ):
-    """테이블 로그인"""
+    """테이블 로그인 (사용자명 버킷은 테이블 단위라 한 테이블의 반복 시도가 매장 전체를 막지 않음)"""
+    if settings.login_throttle_enabled:
+        await get_login_throttle().check(
+            ip=_client_ip(http_request),
+            store=request.store_id,
+            username=f"{request.store_id}:{request.table_number}",
+        )
     return await auth_service.authenticate_table(
         request.store_id,
         request.table_number,
@@ -35,9 +55,14 @@ async def table_login(
 @router.post("/admin/login", response_model=AdminLoginResponse)
 async def admin_login(
     request: AdminLoginRequest,
+    http_request: Request,
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """관리자 로그인"""
+    if settings.login_throttle_enabled:
+        await get_login_throttle().check(
+            ip=_client_ip(http_request), username=request.username.lower()
+        )
     return await auth_service.authenticate_admin(
         request.username,
         request.password,
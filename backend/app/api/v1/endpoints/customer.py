@@ -1,21 +1,25 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, async_session_maker
+from app.core.unit_of_work import UnitOfWorkRoute
 from app.core.dependencies import get_current_table
+from app.core.responses import FastJSONResponse, PrecompressedJSONResponse
 from app.schemas import (
     MenuListResponse,
     OrderCreate, OrderResponse,
     CustomerOrdersResponse,
 )
 from app.services import MenuService, OrderService
+from app.services.sse_service import get_sse_service, event_generator
 from app.repositories import (
     MenuRepository, CategoryRepository,
     OrderRepository, SessionRepository, TableRepository,
 )
 
-router = APIRouter(prefix="/customer", tags=["Customer"])
+router = APIRouter(prefix="/customer", tags=["Customer"], route_class=UnitOfWorkRoute)
 
 
 def get_menu_service(db: AsyncSession = Depends(get_db)) -> MenuService:
@@ -31,17 +35,27 @@ def get_order_service(db: AsyncSession = Depends(get_db)) -> OrderService:
     )
 
 
+def get_read_menu_service(db: AsyncSession = Depends(get_read_db)) -> MenuService:
+    return get_menu_service(db)
+
+
+def get_read_order_service(db: AsyncSession = Depends(get_read_db)) -> OrderService:
+    return get_order_service(db)
+
+
 @router.get("/menus", response_model=MenuListResponse)
 async def get_menus(
+    http_request: Request,
     category_id: Optional[int] = None,
     current_table: dict = Depends(get_current_table),
-    menu_service: MenuService = Depends(get_menu_service)
+    menu_service: MenuService = Depends(get_read_menu_service)
 ):
-    """메뉴 목록 조회"""
-    return await menu_service.get_menus_by_store(
+    """메뉴 목록 조회 (캐시된 압축본 그대로 전송)"""
+    menus = await menu_service.get_menus_encoded(
         current_table["store_id"],
         category_id,
     )
+    return PrecompressedJSONResponse(menus, http_request.headers.get("accept-encoding", ""))
 
 
 @router.post("/orders", response_model=OrderResponse, status_code=201)
@@ -59,9 +73,9 @@ async def create_order(
         [item.model_dump() for item in request.items],
     )
     
-    # 응답 변환
+    # 응답 변환 (스키마대로 만든 payload이므로 response_model 재검증 생략)
     table_number = current_table["table_number"]
-    return {
+    return FastJSONResponse({
         "order_id": order.order_id,
         "table_id": order.table_id,
         "table_number": table_number,
@@ -80,20 +94,10 @@ async def create_order(
             }
             for item in order.items
         ]
-    }
+    }, status_code=201)
 
 
-@router.get("/orders", response_model=CustomerOrdersResponse)
-async def get_my_orders(
-    current_table: dict = Depends(get_current_table),
-    order_service: OrderService = Depends(get_order_service)
-):
-    """내 주문 내역 조회"""
-    result = await order_service.get_orders_by_session(
-        UUID(current_table["session_id"])
-    )
-    
-    # 응답 변환
+def _format_session_orders(result: dict) -> dict:
     return {
         "session_id": result["session_id"],
         "table_number": result["table_number"],
@@ -119,3 +123,52 @@ async def get_my_orders(
             for o in result["orders"]
         ]
     }
+
+
+@router.get("/orders", response_model=CustomerOrdersResponse)
+async def get_my_orders(
+    current_table: dict = Depends(get_current_table),
+    order_service: OrderService = Depends(get_read_order_service)
+):
+    """내 주문 내역 조회"""
+    result = await order_service.get_orders_by_session(
+        UUID(current_table["session_id"])
+    )
+    
+    # 응답 변환
+    return FastJSONResponse(_format_session_orders(result))
+
+
+async def load_session_orders(session_id: UUID) -> dict:
+    """SSE 초기 스냅샷 조회 (스트림 동안 DB 연결을 점유하지 않도록 별도 세션 사용)"""
+    async with async_session_maker() as db:
+        result = await get_order_service(db).get_orders_by_session(
+            session_id, active_only=True
+        )
+    return _format_session_orders(result)
+
+
+@router.get("/orders/sse")
+async def order_stream(
+    current_table: dict = Depends(get_current_table),
+):
+    """내 주문 상태 실시간 SSE (initial 스냅샷 이후 해당 테이블 이벤트만 전달)"""
+    session_id = UUID(current_table["session_id"])
+    sse_service = get_sse_service()
+    
+    connection_id, queue = await sse_service.open_stream(
+        current_table["store_id"],
+        lambda: load_session_orders(session_id),
+        table_id=current_table["table_id"],
+        scope=session_id,
+    )
+    
+    return StreamingResponse(
+        event_generator(connection_id, queue, close_on={"session_ended"}),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
@@ -1,9 +1,16 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.core.database import get_db
+from app.core.database import get_db, engine, read_engine
+from app.core.dependencies import require_metrics_access
+from app.core.db_pool import get_pool_stats
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.core.security import get_password_hasher, get_token_cache
+from app.core.rate_limit import get_login_throttle
+from app.services.order_archiver import get_order_archiver
+from app.services.session_registry import get_session_registry
 
-router = APIRouter(tags=["Health"])
+router = APIRouter(tags=["Health"], route_class=UnitOfWorkRoute)
 
 
 @router.get("/health")
@@ -32,3 +39,42 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
 async def liveness_check():
     """생존 상태 체크"""
     return {"status": "alive"}
+
+
+@router.get("/health/password-hasher", dependencies=[Depends(require_metrics_access)])
+async def password_hasher_stats():
+    """bcrypt 스레드 풀 사용 현황 (큐 대기 시간 포함)"""
+    return get_password_hasher().get_stats()
+
+
+@router.get("/health/login-throttle", dependencies=[Depends(require_metrics_access)])
+async def login_throttle_stats():
+    """로그인 제한 판정 현황 (scope별 허용/거부 횟수)"""
+    return get_login_throttle().get_stats()
+
+
+@router.get("/health/token-cache", dependencies=[Depends(require_metrics_access)])
+async def token_cache_stats():
+    """JWT 검증 캐시 현황"""
+    return get_token_cache().get_stats()
+
+
+@router.get("/health/session-registry", dependencies=[Depends(require_metrics_access)])
+async def session_registry_stats():
+    """활성 세션 레지스트리 현황"""
+    return get_session_registry().get_stats()
+
+
+@router.get("/health/order-archiver", dependencies=[Depends(require_metrics_access)])
+async def order_archiver_stats():
+    """종료 세션 주문 아카이브 진행 현황"""
+    return get_order_archiver().get_stats()
+
+
+@router.get("/health/db-pool", dependencies=[Depends(require_metrics_access)])
+async def db_pool_stats():
+    """커넥션 풀 사용 현황 및 대기 시간 분포"""
+    stats = {"primary": get_pool_stats(engine)}
+    if read_engine is not engine:
+        stats["replica"] = get_pool_stats(read_engine)
+    return stats
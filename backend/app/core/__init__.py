@@ -1,7 +1,16 @@
 """Core modules"""
 from app.core.config import get_settings, Settings
-from app.core.database import get_db, Base, engine
-from app.core.security import hash_password, verify_password, create_access_token, verify_token
+from app.core.database import get_db, get_read_db, Base, engine
+from app.core.security import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    get_password_hasher,
+    create_access_token,
+    verify_token,
+    get_token_cache,
+)
 from app.core.exceptions import (
     AppException,
     NotFoundException,
@@ -17,12 +26,17 @@ __all__ = [
     "get_settings",
     "Settings",
     "get_db",
+    "get_read_db",
     "Base",
     "engine",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
+    "get_password_hasher",
     "create_access_token",
     "verify_token",
+    "get_token_cache",
     "AppException",
     "NotFoundException",
     "ValidationError",
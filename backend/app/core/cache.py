@@ -1,6 +1,7 @@
 from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
 import threading
+from app.core.metrics import observe_cache
 
 
 class InMemoryCacheManager:
@@ -14,11 +15,14 @@ class InMemoryCacheManager:
         """캐시에서 값 조회"""
         with self._lock:
             if key not in self._cache:
+                observe_cache(key, False)
                 return None
             entry = self._cache[key]
             if datetime.utcnow() > entry["expires_at"]:
                 del self._cache[key]
+                observe_cache(key, False)
                 return None
+            observe_cache(key, True)
             return entry["value"]
     
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
@@ -0,0 +1,69 @@
+import gzip
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from app.core.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli는 선택 의존성
+    brotli = None
+
+settings = get_settings()
+
+# 서버 선호 순서
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 협상 (q=0은 거부로 처리, 같은 q면 서버 선호 순서)"""
+    if not accept_encoding:
+        return None
+    
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def should_compress(size: int) -> bool:
+    """압축 대상 크기인지 (너무 작으면 이득이 없고, 너무 크면 CPU만 소모)
+    
+    메뉴처럼 base64 이미지가 대부분인 수 MB 본문은 거의 줄지 않으므로
+    COMPRESSION_MAX_SIZE를 넘으면 압축하지 않는다.
+    """
+    max_size = settings.compression_max_size
+    return size >= settings.compression_min_size and (not max_size or size <= max_size)
+
+
+def compress(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    """본문 압축 (precompressed=True면 캐시에 보관할 결과이므로 조금 더 높은 압축률 사용)"""
+    if encoding == "br":
+        quality = (
+            settings.compression_cached_brotli_quality if precompressed
+            else settings.compression_brotli_quality
+        )
+        return brotli.compress(body, quality=quality)
+    level = settings.compression_cached_gzip_level if precompressed else settings.compression_gzip_level
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+async def compress_async(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    """큰 본문은 스레드 풀에서 압축하여 이벤트 루프를 막지 않음 (zlib/brotli는 GIL 해제)"""
+    if len(body) < settings.compression_thread_min_size:
+        return compress(body, encoding, precompressed)
+    return await run_in_threadpool(compress, body, encoding, precompressed)
@@ -1,17 +1,35 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import math
+import time
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from app.core.config import get_settings
+from app.core.db_pool import InstrumentedQueuePool, PoolValidator, instrument_pool
+from app.core.query_stats import instrument_engine
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,
-    echo=settings.debug,
-)
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    """풀 설정/계측이 적용된 엔진 생성"""
+    new_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        # 백그라운드 검증을 사용하면 checkout마다의 pre-ping 왕복을 생략
+        pool_pre_ping=settings.db_pool_validation_interval <= 0,
+        echo=settings.debug,
+    )
+    instrument_pool(new_engine, name)
+    instrument_engine(new_engine)
+    return new_engine
+
+
+engine = _create_engine(settings.database_url, "primary")
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -21,11 +39,78 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# 읽기 전용 복제본 (미설정 시 primary 사용)
+if settings.database_read_url:
+    read_engine = _create_engine(settings.database_read_url, "replica")
+    read_session_maker = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+else:
+    read_engine = engine
+    read_session_maker = async_session_maker
+
+pool_validator = PoolValidator(
+    {"primary": engine, "replica": read_engine}, settings.db_pool_validation_interval
+)
+
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# 최근 쓰기 시각 쿠키 (복제 지연 동안 같은 클라이언트의 읽기를 primary로 보냄)
+# 워커/인스턴스 간 상태 공유 없이 클라이언트가 표식을 들고 다닌다.
+WRITE_MARKER_COOKIE = "db_written_at"
+
+
+def mark_write(response: Response) -> None:
+    """쓰기 요청 응답에 쓰기 시각 쿠키 설정 (db_read_after_write_window 동안 유지)"""
+    window = settings.db_read_after_write_window
+    if window <= 0 or read_engine is engine:
+        return
+    response.set_cookie(
+        WRITE_MARKER_COOKIE,
+        f"{time.time():.3f}",
+        max_age=max(1, math.ceil(window)),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def wrote_recently(request: Request) -> bool:
+    """쓰기 시각 쿠키가 window 이내인지 확인 (값이 이상하면 무시)"""
+    value = request.cookies.get(WRITE_MARKER_COOKIE)
+    if not value:
+        return False
+    try:
+        written_at = float(value)
+    except ValueError:
+        return False
+    # 서버 간 시계 오차를 감안해 약간 미래 값도 허용
+    return -1.0 <= time.time() - written_at <= settings.db_read_after_write_window
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """요청 단위 세션 (UnitOfWorkRoute가 응답 전에 커밋, 그 외에는 롤백)"""
     async with async_session_maker() as session:
+        request.state.db = session
+        try:
+            yield session
+        finally:
+            # UnitOfWorkRoute가 커밋 전에 닫힌 세션을 감지할 수 있도록 표시
+            session.info["closed"] = True
+            await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 세션 (복제본, 같은 클라이언트의 최근 쓰기 직후에는 primary)"""
+    if read_engine is engine or wrote_recently(request):
+        session_maker = async_session_maker
+    else:
+        session_maker = read_session_maker
+    async with session_maker() as session:
         try:
             yield session
         finally:
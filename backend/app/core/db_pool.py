@@ -0,0 +1,163 @@
+import asyncio
+import bisect
+import logging
+import time
+from typing import Dict, List, Optional
+from weakref import WeakKeyDictionary
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_PRE_PING
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 획득 대기 시간 히스토그램 경계 (ms)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """커넥션 풀 획득 대기/pre-ping/백그라운드 검증 통계
+    
+    대기/pre-ping 시간은 메트릭 레지스트리 히스토그램(pool 레이블)에도 기록한다.
+    """
+    
+    def __init__(self, pool: str = "primary"):
+        self.pool = pool
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        # 버킷별 개수 (마지막 칸은 WAIT_BUCKETS_MS 초과)
+        self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.pings = 0
+        self.ping_total = 0.0
+        self.ping_max = 0.0
+        self.validations = 0
+        self.validation_failures = 0
+    
+    def observe_wait(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.wait_total += elapsed
+        self.wait_max = max(self.wait_max, elapsed)
+        self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, elapsed * 1000)] += 1
+        DB_POOL_CHECKOUT_WAIT.observe(elapsed, (self.pool,))
+    
+    def observe_ping(self, elapsed: float) -> None:
+        self.pings += 1
+        self.ping_total += elapsed
+        self.ping_max = max(self.ping_max, elapsed)
+        DB_POOL_PRE_PING.observe(elapsed, (self.pool,))
+    
+    def to_dict(self) -> dict:
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets):
+            cumulative += count
+            histogram[f"le_{bound}ms"] = cumulative
+        histogram["le_inf"] = self.checkouts
+        return {
+            "checkouts": self.checkouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            "wait_histogram": histogram,
+            "pre_pings": self.pings,
+            "pre_ping_avg_ms": round(self.ping_total / self.pings * 1000, 3) if self.pings else 0.0,
+            "pre_ping_max_ms": round(self.ping_max * 1000, 3),
+            "validations": self.validations,
+            "validation_failures": self.validation_failures,
+        }
+
+
+# dialect -> PoolMetrics (engine.dispose()로 풀이 재생성되어도 dialect는 유지됨)
+_metrics: "WeakKeyDictionary[object, PoolMetrics]" = WeakKeyDictionary()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득 대기 시간을 기록하는 풀"""
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics = _metrics.get(self._dialect)
+            if metrics is not None:
+                metrics.observe_wait(time.perf_counter() - started)
+
+
+def instrument_pool(engine: AsyncEngine, name: str = "primary") -> PoolMetrics:
+    """엔진 풀 통계 수집 등록 (pre-ping 소요 시간 포함, name은 메트릭 pool 레이블)"""
+    dialect = engine.sync_engine.dialect
+    metrics = _metrics.setdefault(dialect, PoolMetrics(name))
+    
+    do_ping = dialect.do_ping
+    
+    def timed_ping(dbapi_connection) -> bool:
+        started = time.perf_counter()
+        try:
+            return do_ping(dbapi_connection)
+        finally:
+            metrics.observe_ping(time.perf_counter() - started)
+    
+    dialect.do_ping = timed_ping
+    return metrics
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict:
+    """풀 사용 현황 (checked-out, overflow 등) 및 누적 통계"""
+    pool = engine.sync_engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeout": pool.timeout(),
+    }
+    metrics = _metrics.get(engine.sync_engine.dialect)
+    if metrics is not None:
+        stats.update(metrics.to_dict())
+    return stats
+
+
+class PoolValidator:
+    """pre-ping 대신 유휴 커넥션을 주기적으로 검증
+    
+    풀은 FIFO이므로 유휴 커넥션 수만큼 순서대로 꺼내 SELECT 1을 실행하면
+    모든 유휴 커넥션이 한 번씩 검증된다. 끊긴 커넥션은 SQLAlchemy가 무효화한다.
+    """
+    
+    def __init__(self, engines: Dict[str, AsyncEngine], interval: float):
+        self.engines = engines
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            # 복제본 미설정 시 같은 엔진이 두 번 들어 있을 수 있음
+            for engine in {id(e): e for e in self.engines.values()}.values():
+                await self.validate(engine)
+    
+    async def validate(self, engine: AsyncEngine) -> None:
+        metrics = _metrics.get(engine.sync_engine.dialect)
+        for _ in range(engine.sync_engine.pool.checkedin()):
+            try:
+                async with engine.connect() as connection:
+                    await connection.exec_driver_sql("SELECT 1")
+                if metrics is not None:
+                    metrics.validations += 1
+            except Exception as e:
+                if metrics is not None:
+                    metrics.validation_failures += 1
+                logger.warning(f"Pool validation failed: {e}")
@@ -1,8 +1,13 @@
+import hmac
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.config import settings
 from app.core.security import verify_token
+from app.services.session_registry import get_session_registry
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -31,10 +36,43 @@ async def get_current_admin(current_user: dict = Depends(get_current_user)) -> d
 
 
 async def get_current_table(current_user: dict = Depends(get_current_user)) -> dict:
-    """테이블 권한 확인"""
+    """테이블 권한 확인 (종료된 세션의 토큰은 exp 전이라도 거부)
+    
+    종료 여부는 세션 레지스트리 기준이다 (이 워커에서 종료했거나 NOTIFY로 전달받은 세션).
+    """
     if current_user.get("user_type") != "table":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Table access required"
         )
+    session_id = current_user.get("session_id")
+    if session_id and get_session_registry().is_ended(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session has ended",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return current_user
+
+
+async def require_metrics_access(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> None:
+    """운영 지표(/metrics, /health/* 통계) 접근 확인
+    
+    metrics_token이 설정되어 있으면 같은 Bearer 토큰을 요구하고, 설정되어 있지 않으면
+    debug 모드에서만 공개한다 (그 외에는 엔드포인트가 없는 것처럼 404).
+    """
+    if not settings.metrics_token:
+        if settings.debug:
+            return
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), settings.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
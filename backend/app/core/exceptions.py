@@ -60,6 +60,19 @@ class BusinessLogicError(AppException):
         super().__init__(message, 422, "BUSINESS_LOGIC_ERROR", details)
 
 
+class TooManyRequestsError(AppException):
+    """요청 횟수 초과"""
+    
+    def __init__(
+        self,
+        message: str = "Too many requests",
+        retry_after: int = 1,
+        details: Optional[Any] = None
+    ):
+        super().__init__(message, 429, "TOO_MANY_REQUESTS", details)
+        self.headers = {"Retry-After": str(retry_after)}
+
+
 # Alias for backward compatibility
 NotFoundError = NotFoundException
 AuthorizationError = ForbiddenError
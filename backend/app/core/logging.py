@@ -1,31 +1,58 @@
+import atexit
 import logging
+import queue
 import sys
 import json
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+# 레코드마다 인코더를 새로 만들지 않도록 미리 생성
+_json_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def _encode_json(data: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return _json_encoder.encode(data)
 
 
 class JSONFormatter(logging.Formatter):
     """JSON 형식 로그 포매터"""
     
+    # extra 필드
+    EXTRA_FIELDS = (
+        "request_id", "method", "path", "status_code",
+        "process_time_ms", "error_code", "client_ip",
+        "db_query_count", "db_time_ms", "statement",
+    )
+    
     def format(self, record: logging.LogRecord) -> str:
+        # writer 스레드에서 포맷되므로 현재 시각이 아닌 레코드 생성 시각 사용
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
-        # extra 필드 추가
-        for key in ["request_id", "method", "path", "status_code", 
-                    "process_time_ms", "error_code", "client_ip"]:
-            if hasattr(record, key):
-                log_data[key] = getattr(record, key)
+        record_dict = record.__dict__
+        for key in self.EXTRA_FIELDS:
+            if key in record_dict:
+                log_data[key] = record_dict[key]
         
         # 예외 정보
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
         
-        return json.dumps(log_data, ensure_ascii=False)
+        return _encode_json(log_data)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -42,7 +69,7 @@ class ConsoleFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         color = self.COLORS.get(record.levelname, self.RESET)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
         
         # request_id가 있으면 추가
         if hasattr(record, "request_id"):
@@ -51,18 +78,43 @@ class ConsoleFormatter(logging.Formatter):
         return f"{color}[{timestamp}] {record.levelname:8}{self.RESET} {record.name}: {record.getMessage()}"
 
 
+class NonBlockingQueueHandler(QueueHandler):
+    """이벤트 루프를 막지 않는 큐 핸들러 (큐가 가득 차면 버리고 개수만 기록)"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자만 병합하고 JSON 포맷은 writer 스레드에서 수행
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+
+
 def setup_logging():
-    """로깅 설정"""
+    """로깅 설정 (QueueHandler -> 전용 writer 스레드의 stdout 핸들러)"""
     from app.core.config import settings
+    global _listener
     
     # 루트 로거 설정
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.log_level))
     
     # 기존 핸들러 제거
+    shutdown_logging()
     root_logger.handlers.clear()
     
-    # 콘솔 핸들러
+    # 콘솔 핸들러 (writer 스레드에서 실행)
     console_handler = logging.StreamHandler(sys.stdout)
     
     if settings.debug:
@@ -70,7 +122,10 @@ def setup_logging():
     else:
         console_handler.setFormatter(JSONFormatter())
     
-    root_logger.addHandler(console_handler)
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    root_logger.addHandler(NonBlockingQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
     
     # SQLAlchemy 로깅 레벨 조정
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -78,3 +133,21 @@ def setup_logging():
     
     # Uvicorn 로깅 레벨 조정
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+
+def shutdown_logging() -> None:
+    """writer 스레드 종료 (큐에 남은 로그 출력 후)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_log_queue_depth() -> int:
+    """출력 대기 중인 로그 레코드 수"""
+    if _listener is None:
+        return 0
+    return _listener.queue.qsize()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,387 @@
+import asyncio
+import bisect
+import glob
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청 처리 시간 히스토그램 경계 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 커넥션 획득 대기/pre-ping 히스토그램 경계 (초)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 요청당 쿼리 수 히스토그램 경계
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Counter:
+    """레이블별 누적 카운터
+    
+    이벤트 루프에서만 갱신하므로 잠금을 사용하지 않는다.
+    """
+    
+    type = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+    
+    def snapshot(self) -> List[list]:
+        return [[list(labels), value] for labels, value in self._values.items()]
+
+
+class Histogram:
+    """레이블별 버킷 히스토그램 (버킷은 누적이 아닌 구간 개수로 저장)"""
+    
+    type = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [구간별 개수..., +Inf 개수, 합계]
+        self._values: Dict[LabelValues, List[float]] = {}
+    
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        counts = self._values.get(labels)
+        if counts is None:
+            counts = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+    
+    def snapshot(self) -> List[list]:
+        return [[list(labels), list(counts)] for labels, counts in self._values.items()]
+
+
+class Gauge:
+    """스크랩 시점에 콜백으로 값을 수집하는 게이지"""
+    
+    type = "gauge"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._collect = collect
+    
+    def set_function(self, collect: Callable[[], Iterable[Tuple[LabelValues, float]]]) -> None:
+        self._collect = collect
+    
+    def snapshot(self) -> List[list]:
+        if self._collect is None:
+            return []
+        try:
+            return [[list(labels), value] for labels, value in self._collect()]
+        except Exception as e:
+            logger.warning(f"Gauge collection failed: {self.name}: {e}")
+            return []
+
+
+class MetricsRegistry:
+    """프로세스 내 메트릭 레지스트리
+    
+    multiproc_dir가 설정되면 워커마다 스냅샷을 <pid>.json으로 기록하고
+    /metrics 요청 시 모든 워커의 파일을 합산한다. 카운터/히스토그램은 종료된
+    워커의 값도 유지하고, 게이지는 살아 있는 워커의 값만 합산한다.
+    """
+    
+    def __init__(self, multiproc_dir: str = ""):
+        self.multiproc_dir = multiproc_dir
+        self._metrics: Dict[str, object] = {}
+    
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, collect))
+    
+    def snapshot(self) -> dict:
+        """현재 워커의 메트릭 스냅샷 (JSON 직렬화 가능)"""
+        metrics = {}
+        for metric in self._metrics.values():
+            entry = {
+                "type": metric.type,
+                "help": metric.documentation,
+                "labels": list(metric.labelnames),
+                "samples": metric.snapshot(),
+            }
+            if metric.type == "histogram":
+                entry["buckets"] = list(metric.buckets)
+            metrics[metric.name] = entry
+        return {"pid": os.getpid(), "written_at": time.time(), "metrics": metrics}
+    
+    def write_snapshot(self) -> None:
+        """공유 디렉터리에 현재 워커 스냅샷 기록 (원자적 교체)"""
+        if not self.multiproc_dir:
+            return
+        os.makedirs(self.multiproc_dir, exist_ok=True)
+        path = os.path.join(self.multiproc_dir, f"{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    
+    def collect(self) -> Dict[str, dict]:
+        """전체 워커 합산 결과 (multiproc_dir 미설정 시 현재 워커만)"""
+        if not self.multiproc_dir:
+            return _merge([self.snapshot()])
+        
+        self.write_snapshot()
+        snapshots = []
+        for path in glob.glob(os.path.join(self.multiproc_dir, "*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metrics snapshot {path}: {e}")
+        return _merge(snapshots)
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        lines: List[str] = []
+        for name, metric in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {_escape_help(metric['help'])}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            labelnames = metric["labels"]
+            
+            if metric["type"] == "histogram":
+                bounds = [_format_value(b) for b in metric["buckets"]] + ["+Inf"]
+                for labels, counts in sorted(metric["samples"].items()):
+                    cumulative = 0
+                    for bound, count in zip(bounds, counts):
+                        cumulative += count
+                        bucket_labels = _format_labels(labelnames + ["le"], labels + (bound,))
+                        lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+                    label_str = _format_labels(labelnames, labels)
+                    lines.append(f"{name}_sum{label_str} {_format_value(counts[-1])}")
+                    lines.append(f"{name}_count{label_str} {_format_value(cumulative)}")
+            else:
+                for labels, value in sorted(metric["samples"].items()):
+                    lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        
+        lines.append("")
+        return "\n".join(lines)
+    
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _merge(snapshots: List[dict]) -> Dict[str, dict]:
+    """워커 스냅샷 합산 (레이블 값이 같은 샘플끼리 더함)"""
+    merged: Dict[str, dict] = {}
+    for snapshot in snapshots:
+        alive = _pid_alive(snapshot.get("pid", 0))
+        for name, metric in snapshot["metrics"].items():
+            if metric["type"] == "gauge" and not alive:
+                continue
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = {
+                    "type": metric["type"],
+                    "help": metric["help"],
+                    "labels": metric["labels"],
+                    "buckets": metric.get("buckets"),
+                    "samples": {},
+                }
+            samples = target["samples"]
+            
+            for labels, value in metric["samples"]:
+                key = tuple(str(v) for v in labels)
+                if metric["type"] == "histogram":
+                    current = samples.get(key)
+                    # 버킷 경계가 다른(배포 도중 변경된) 스냅샷은 건너뜀
+                    if current is None:
+                        samples[key] = list(value)
+                    elif len(current) == len(value):
+                        samples[key] = [a + b for a, b in zip(current, value)]
+                else:
+                    samples[key] = samples.get(key, 0.0) + value
+    return merged
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: List[str], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsFlusher:
+    """워커 스냅샷을 주기적으로 공유 디렉터리에 기록"""
+    
+    def __init__(self, registry: MetricsRegistry, interval: float):
+        self.registry = registry
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        if self.registry.multiproc_dir and self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 종료 직전 누적값 기록 (카운터는 워커 종료 후에도 합산됨)
+        self._flush()
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._flush()
+    
+    def _flush(self) -> None:
+        try:
+            self.registry.write_snapshot()
+        except OSError as e:
+            logger.warning(f"Metrics snapshot write failed: {e}")
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry(settings.metrics_multiproc_dir)
+    return _registry
+
+
+registry = get_metrics_registry()
+metrics_flusher = MetricsFlusher(registry, settings.metrics_flush_interval)
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request", "DB queries executed per HTTP request", ("route",), QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = registry.histogram(
+    "db_time_per_request_seconds", "DB time spent per HTTP request", ("route",)
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by key prefix and result", ("prefix", "result")
+)
+PASSWORD_HASH_QUEUE_WAIT = registry.histogram(
+    "password_hash_queue_wait_seconds", "Time bcrypt jobs wait for an executor thread"
+)
+LOGIN_THROTTLE_DECISIONS = registry.counter(
+    "login_throttle_decisions_total", "Login throttle decisions by scope", ("scope", "decision")
+)
+LOGIN_THROTTLE_BACKEND_ERRORS = registry.counter(
+    "login_throttle_backend_errors_total", "Login throttle checks skipped because the backend failed"
+)
+ARCHIVED_ROWS = registry.counter(
+    "order_archive_rows_total", "Rows moved out of the live order tables", ("table",)
+)
+QUEUE_DEPTH = registry.gauge("queue_depth", "Items waiting in internal queues", ("queue",))
+SSE_CONNECTIONS = registry.gauge("sse_connections", "Open SSE connections by store", ("store_id",))
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection", ("pool",),
+    POOL_WAIT_BUCKETS,
+)
+DB_POOL_PRE_PING = registry.histogram(
+    "db_pool_pre_ping_seconds", "Pre-ping round trip on DB connection checkout", ("pool",),
+    POOL_WAIT_BUCKETS,
+)
+DB_POOL_CONNECTIONS = registry.gauge(
+    "db_pool_connections", "DB pool connections by state", ("pool", "state")
+)
+
+
+def route_label(scope) -> str:
+    """요청의 라우트 템플릿 (실제 경로 값은 쓰지 않고, 미매칭 요청은 하나로 묶어 레이블 폭증 방지)"""
+    return getattr(scope.get("route"), "path", None) or "<unmatched>"
+
+
+def observe_request(
+    method: str, route: str, status_code: int, elapsed: float, query_count: int, db_time: float
+) -> None:
+    """요청 완료 메트릭 기록"""
+    HTTP_REQUESTS.inc((method, route, str(status_code)))
+    HTTP_REQUEST_DURATION.observe(elapsed, (method, route))
+    DB_QUERIES_PER_REQUEST.observe(query_count, (route,))
+    DB_TIME_PER_REQUEST.observe(db_time, (route,))
+
+
+def observe_cache(key: str, hit: bool) -> None:
+    """캐시 조회 결과 기록 (키의 첫 ':' 앞부분을 prefix로 사용)"""
+    CACHE_REQUESTS.inc((key.split(":", 1)[0], "hit" if hit else "miss"))
@@ -0,0 +1,27 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+from app.core.exceptions import ValidationError
+
+# history_id 컬럼(INTEGER) 최대값
+MAX_ROW_ID = 2 ** 31 - 1
+
+
+def encode_cursor(completed_at: datetime, row_id: int) -> str:
+    """keyset 커서 인코딩 (클라이언트에는 불투명한 문자열)"""
+    raw = f"{completed_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """keyset 커서 디코딩 (형식이 잘못되면 ValidationError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        completed_at, _, row_id = raw.partition("|")
+        row_id = int(row_id)
+        if not 0 < row_id <= MAX_ROW_ID:
+            raise ValueError("row_id out of range")
+        return datetime.fromisoformat(completed_at), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid cursor")
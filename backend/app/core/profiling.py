@@ -0,0 +1,147 @@
+import cProfile
+import io
+import pstats
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+from app.core.config import get_settings
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler
+except ImportError:  # pragma: no cover - pyinstrument는 선택 의존성
+    SamplingProfiler = None
+
+settings = get_settings()
+
+
+class ProfileReport:
+    """요청 1건의 프로파일 결과"""
+    
+    __slots__ = (
+        "request_id", "method", "path", "status_code", "store_id",
+        "trigger", "backend", "duration_ms", "created_at", "report",
+    )
+    
+    def __init__(
+        self,
+        request_id: str,
+        method: str,
+        path: str,
+        status_code: int,
+        store_id: Optional[int],
+        trigger: str,
+        backend: str,
+        duration_ms: float,
+        report: str,
+    ):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.status_code = status_code
+        self.store_id = store_id
+        self.trigger = trigger
+        self.backend = backend
+        self.duration_ms = duration_ms
+        self.created_at = datetime.utcnow()
+        self.report = report
+    
+    def to_dict(self, include_report: bool = False) -> dict:
+        data = {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "trigger": self.trigger,
+            "backend": self.backend,
+            "duration_ms": self.duration_ms,
+            "created_at": self.created_at,
+        }
+        if include_report:
+            data["report"] = self.report
+        return data
+
+
+class ProfileStore:
+    """request_id별 프로파일 보관 (최근 max_reports개, 워커 로컬)"""
+    
+    def __init__(self, max_reports: int):
+        self.max_reports = max_reports
+        self._reports: "OrderedDict[str, ProfileReport]" = OrderedDict()
+    
+    def add(self, report: ProfileReport) -> None:
+        self._reports[report.request_id] = report
+        self._reports.move_to_end(report.request_id)
+        while len(self._reports) > self.max_reports:
+            self._reports.popitem(last=False)
+    
+    def get(self, request_id: str) -> Optional[ProfileReport]:
+        return self._reports.get(request_id)
+    
+    def list(self, store_id: Optional[int] = None) -> List[ProfileReport]:
+        """최근 순 목록 (store_id 지정 시 해당 매장 요청만)"""
+        return [
+            report for report in reversed(self._reports.values())
+            if store_id is None or report.store_id == store_id
+        ]
+
+
+class RequestProfiler:
+    """요청 단위 프로파일러 (cProfile 또는 pyinstrument 샘플링 프로파일러)
+    
+    프로파일러는 스레드 전역이므로 동시에 한 요청만 프로파일링하며, 이미
+    실행 중이면 건너뛴다. cProfile은 같은 이벤트 루프에서 함께 실행된 다른
+    요청의 호출도 포함하므로 부하가 낮을 때 사용하는 것이 좋다.
+    """
+    
+    def __init__(self, backend: str, top_n: int):
+        if backend == "pyinstrument" and SamplingProfiler is None:
+            raise RuntimeError("PROFILING_BACKEND=pyinstrument requires the pyinstrument package")
+        self.backend = backend
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._active = False
+    
+    def start(self):
+        """프로파일 시작 (다른 요청을 프로파일링 중이면 None)"""
+        with self._lock:
+            if self._active:
+                return None
+            self._active = True
+        
+        try:
+            if self.backend == "pyinstrument":
+                profiler = SamplingProfiler(async_mode="enabled")
+                profiler.start()
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+        except Exception:
+            self._active = False
+            raise
+        return profiler
+    
+    def stop(self, profiler) -> str:
+        """프로파일 종료 후 텍스트 리포트 반환"""
+        try:
+            if self.backend == "pyinstrument":
+                profiler.stop()
+                return profiler.output_text(unicode=True)
+            
+            profiler.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+            return stream.getvalue()
+        finally:
+            self._active = False
+
+
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore(settings.profiling_max_reports)
+    return _profile_store
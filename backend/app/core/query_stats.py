@@ -0,0 +1,106 @@
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# asyncpg는 $1::INTEGER, $2::TIMESTAMP WITHOUT TIME ZONE처럼 타입 캐스트를 붙여 렌더링
+_PARAM_RE = re.compile(
+    r"\$\d+(?:::\w+(?:\s+WITH(?:OUT)?\s+TIME\s+ZONE)?(?:\[\])?)?|%\(\w+\)s|\?"
+)
+_PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+# IN 목록은 길이 1도 같은 모양으로 (selectinload 배치 크기가 달라도 같은 쿼리)
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\.\.\.)?\s*\)", re.IGNORECASE)
+
+
+class QueryStats:
+    """요청 단위 DB 쿼리 통계"""
+    
+    __slots__ = ("request_id", "count", "duration", "shapes")
+    
+    def __init__(self, request_id: str = ""):
+        self.request_id = request_id
+        self.count = 0
+        self.duration = 0.0
+        # 정규화된 SQL -> 실행 횟수
+        self.shapes: Dict[str, int] = {}
+    
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+    
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        
+        shape = statement_shape(statement)
+        repeats = self.shapes.get(shape, 0) + 1
+        self.shapes[shape] = repeats
+        
+        threshold = settings.db_n_plus_one_threshold
+        if threshold and repeats == threshold + 1:
+            logger.warning(
+                f"Possible N+1 query: same statement executed more than {threshold} times",
+                extra={
+                    "request_id": self.request_id,
+                    "statement": shape[:300],
+                },
+            )
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(request_id: str = "") -> QueryStats:
+    """현재 컨텍스트(요청)의 쿼리 통계 수집 시작"""
+    stats = QueryStats(request_id)
+    _current_stats.set(stats)
+    return stats
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 자리와 IN 목록 길이를 정규화한 SQL"""
+    shape = _PARAM_RE.sub("?", statement)
+    shape = _PARAM_LIST_RE.sub("?...", shape)
+    shape = _IN_LIST_RE.sub("IN (?...)", shape)
+    return " ".join(shape.split())
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 쿼리 수/시간 측정 이벤트 등록"""
+    sync_engine = engine.sync_engine
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn, statement)
+    
+    # 실패한 쿼리도 시작 시각을 꺼내야 이후 같은 커넥션의 측정이 어긋나지 않음
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and exception_context.statement is not None:
+            _finish(conn, exception_context.statement)
+
+
+def _finish(conn, statement: str) -> None:
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    started = starts.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
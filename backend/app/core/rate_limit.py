@@ -0,0 +1,178 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.core.config import get_settings
+from app.core.exceptions import TooManyRequestsError
+from app.core.metrics import LOGIN_THROTTLE_BACKEND_ERRORS, LOGIN_THROTTLE_DECISIONS
+
+settings = get_settings()
+
+# 여러 토큰 버킷 원자적 소비 (KEYS=버킷 키, ARGV=now, capacity1, refill1, capacity2, refill2, ...)
+# 모든 버킷에 토큰이 있을 때만 각각 1개씩 소비하고, 하나라도 부족하면 아무것도 소비하지 않는다.
+# 반환: {거부한 버킷 번호(1부터, 허용이면 0), 거부한 버킷의 남은 토큰}
+TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local refill = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local current = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    current = math.min(capacity, current + math.max(0, now - updated_at) * refill)
+    if current < 1 then
+        return {i, tostring(current)}
+    end
+    tokens[i] = current
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local refill = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', tokens[i] - 1, 'updated_at', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / refill * 1000))
+end
+return {0, '0'}
+"""
+
+# (버킷 키, capacity, 초당 충전량)
+BucketSpec = Tuple[str, int, float]
+
+
+class InMemoryTokenBucket:
+    """인메모리 토큰 버킷 (워커 단위, 키 수 제한 LRU)"""
+    
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> [tokens, updated_at]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+    
+    async def consume(self, buckets: Sequence[BucketSpec]) -> Tuple[int, float]:
+        """모든 버킷에서 토큰 1개씩 소비 시도 (거부한 버킷 index와 남은 토큰, 허용이면 -1)
+        
+        하나라도 토큰이 부족하면 어느 버킷에서도 소비하지 않는다.
+        """
+        now = time.monotonic()
+        states = []
+        for index, (key, capacity, refill_per_sec) in enumerate(buckets):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(capacity), now]
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_sec)
+                bucket[1] = now
+            if bucket[0] < 1:
+                return index, bucket[0]
+            states.append(bucket)
+        
+        for bucket in states:
+            bucket[0] -= 1
+        return -1, 0.0
+
+
+class RedisTokenBucket:
+    """Redis 토큰 버킷 (워커/인스턴스 간 공유)"""
+    
+    def __init__(self, url: str, prefix: str = "login_throttle:"):
+        import redis.asyncio as redis
+        
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(TOKEN_BUCKET_LUA)
+    
+    async def consume(self, buckets: Sequence[BucketSpec]) -> Tuple[int, float]:
+        """모든 버킷에서 토큰 1개씩 소비 시도 (거부한 버킷 index와 남은 토큰, 허용이면 -1)"""
+        args: List[float] = [time.time()]
+        for _, capacity, refill_per_sec in buckets:
+            args.extend((capacity, refill_per_sec))
+        rejected, tokens = await self._script(
+            keys=[self.prefix + key for key, _, _ in buckets], args=args
+        )
+        return int(rejected) - 1, float(tokens)
+
+
+class LoginThrottle:
+    """로그인 시도 제한 (IP/매장/사용자명 별 토큰 버킷)"""
+    
+    def __init__(self, backend, limits: Dict[str, int]):
+        self.backend = backend
+        # scope -> 분당 허용 시도 수 (버스트 크기와 동일)
+        self.limits = limits
+        self._allowed: Dict[str, int] = {scope: 0 for scope in limits}
+        self._rejected: Dict[str, int] = {scope: 0 for scope in limits}
+        self._backend_errors = 0
+    
+    async def check(self, **keys: Optional[object]) -> None:
+        """모든 버킷에서 토큰 소비, 초과 시 TooManyRequestsError
+        
+        예: check(ip="10.0.0.1", store=1). 값이 None인 scope는 건너뛴다.
+        한 scope라도 초과하면 다른 scope의 토큰도 소비하지 않는다.
+        """
+        scopes = [
+            scope for scope, value in keys.items()
+            if value is not None and scope in self.limits
+        ]
+        if not scopes:
+            return
+        
+        buckets = [
+            (f"{scope}:{keys[scope]}", self.limits[scope], self.limits[scope] / 60)
+            for scope in scopes
+        ]
+        try:
+            rejected, tokens = await self.backend.consume(buckets)
+        except Exception:
+            # 공유 백엔드 장애 시 로그인 자체를 막지 않음
+            self._backend_errors += 1
+            LOGIN_THROTTLE_BACKEND_ERRORS.inc()
+            return
+        
+        if rejected >= 0:
+            scope = scopes[rejected]
+            self._rejected[scope] += 1
+            LOGIN_THROTTLE_DECISIONS.inc((scope, "rejected"))
+            refill_per_sec = buckets[rejected][2]
+            retry_after = max(1, math.ceil((1 - tokens) / refill_per_sec))
+            raise TooManyRequestsError(
+                "Too many login attempts",
+                retry_after=retry_after,
+                details={"scope": scope, "retry_after": retry_after},
+            )
+        
+        for scope in scopes:
+            self._allowed[scope] += 1
+            LOGIN_THROTTLE_DECISIONS.inc((scope, "allowed"))
+    
+    def get_stats(self) -> dict:
+        """scope별 허용/거부 횟수"""
+        return {
+            "backend": type(self.backend).__name__,
+            "limits_per_minute": dict(self.limits),
+            "allowed": dict(self._allowed),
+            "rejected": dict(self._rejected),
+            "backend_errors": self._backend_errors,
+        }
+
+
+_login_throttle: Optional[LoginThrottle] = None
+
+
+def get_login_throttle() -> LoginThrottle:
+    global _login_throttle
+    if _login_throttle is None:
+        if settings.login_throttle_backend == "redis":
+            backend = RedisTokenBucket(settings.login_throttle_redis_url)
+        else:
+            backend = InMemoryTokenBucket()
+        _login_throttle = LoginThrottle(
+            backend,
+            {
+                "ip": settings.login_rate_per_ip,
+                "store": settings.login_rate_per_store,
+                "username": settings.login_rate_per_username,
+            },
+        )
+    return _login_throttle
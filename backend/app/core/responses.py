@@ -0,0 +1,97 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+from fastapi.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+from app.core.compression import choose_encoding, compress_async, should_compress
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# starlette JSONResponse와 같은 출력 형식
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+)
+
+
+def render_json(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default)
+    return _json_encoder.encode(content).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """서비스에서 만든 payload를 검증 없이 바로 직렬화하는 JSON 응답
+    
+    엔드포인트가 Response를 반환하면 FastAPI는 response_model 검증/직렬화를
+    건너뛴다. response_model은 OpenAPI 스키마에만 사용되므로 payload가 스키마와
+    일치하도록 만드는 것은 호출하는 쪽의 책임이다.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+class EncodedJSON:
+    """캐시용 직렬화 JSON 본문과 인코딩별 압축본
+    
+    압축본은 인코딩별로 처음 요청될 때 한 번만 (스레드 풀에서) 만들어 함께 보관한다.
+    """
+    
+    __slots__ = ("body", "_variants")
+    
+    def __init__(self, content: Any):
+        self.body = render_json(content)
+        self._variants: dict = {}
+    
+    async def encoded(self, encoding: str) -> bytes:
+        variant = self._variants.get(encoding)
+        if variant is None:
+            variant = await compress_async(self.body, encoding, precompressed=True)
+            self._variants[encoding] = variant
+        return variant
+
+
+class PrecompressedJSONResponse(Response):
+    """EncodedJSON을 Accept-Encoding에 맞는 압축본으로 그대로 전송하는 응답
+    
+    압축본이 아직 없으면 전송 시점에 만든다 (이벤트 루프 밖에서 압축).
+    """
+    
+    media_type = "application/json"
+    
+    def __init__(self, payload: EncodedJSON, accept_encoding: str = "", status_code: int = 200):
+        self.payload = payload
+        self.encoding: Optional[str] = None
+        if should_compress(len(payload.body)):
+            self.encoding = choose_encoding(accept_encoding)
+        
+        super().__init__(
+            b"" if self.encoding else payload.body,
+            status_code=status_code,
+            headers={"Vary": "Accept-Encoding"},
+        )
+        if self.encoding:
+            self.headers["Content-Encoding"] = self.encoding
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.encoding:
+            self.body = await self.payload.encoded(self.encoding)
+            self.headers["Content-Length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
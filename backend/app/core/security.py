@@ -1,11 +1,20 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Dict, Optional, Set, Tuple, TypeVar
 from jose import JWTError, jwt
 import bcrypt
 from app.core.config import get_settings
+from app.core.metrics import PASSWORD_HASH_QUEUE_WAIT, observe_cache
 
 settings = get_settings()
 
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """비밀번호 해싱"""
@@ -21,6 +30,94 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+class PasswordHasherPool:
+    """bcrypt 전용 크기 제한 스레드 풀 (이벤트 루프 블로킹 방지, 대기 시간 측정)"""
+    
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._run_time_total = 0.0
+    
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """풀에서 실행하고 결과 대기 (풀이 가득 차면 큐에서 대기)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        
+        submitted_at = time.perf_counter()
+        queue_wait = 0.0
+        with self._lock:
+            self._submitted += 1
+        
+        def task() -> T:
+            nonlocal queue_wait
+            started_at = time.perf_counter()
+            with self._lock:
+                self._started += 1
+                wait = queue_wait = started_at - submitted_at
+                self._queue_wait_total += wait
+                self._queue_wait_max = max(self._queue_wait_max, wait)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._completed += 1
+                    self._run_time_total += time.perf_counter() - started_at
+        
+        result = await asyncio.get_running_loop().run_in_executor(self._executor, task)
+        # 히스토그램은 이벤트 루프에서만 갱신
+        PASSWORD_HASH_QUEUE_WAIT.observe(queue_wait)
+        return result
+    
+    def get_stats(self) -> dict:
+        """풀 사용 현황 및 큐 대기 시간 통계"""
+        with self._lock:
+            started = self._started
+            return {
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "queued": self._submitted - started,
+                "running": started - self._completed,
+                "queue_wait_avg_ms": round(self._queue_wait_total / started * 1000, 3) if started else 0.0,
+                "queue_wait_max_ms": round(self._queue_wait_max * 1000, 3),
+                "run_time_avg_ms": round(self._run_time_total / self._completed * 1000, 3) if self._completed else 0.0,
+            }
+    
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_password_hasher: Optional[PasswordHasherPool] = None
+
+
+def get_password_hasher() -> PasswordHasherPool:
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasherPool(settings.password_hash_workers)
+    return _password_hasher
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (전용 스레드 풀)"""
+    return await get_password_hasher().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (전용 스레드 풀)"""
+    return await get_password_hasher().run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성"""
     to_encode = data.copy()
@@ -34,14 +131,118 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
+class TokenCache:
+    """검증된 JWT 페이로드 LRU 캐시 (토큰 digest 키, exp까지 유효)
+    
+    이벤트 루프에서만 접근하므로 잠금을 사용하지 않는다.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # digest -> (payload, exp)
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        # session_id -> {digest} (세션 종료 시 캐시 정리용)
+        self._by_session: Dict[str, Set[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+    
+    def get(self, digest: bytes) -> Optional[dict]:
+        """캐시된 페이로드 조회 (만료 시 제거)"""
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            observe_cache("jwt", False)
+            return None
+        payload, exp = entry
+        if exp <= time.time():
+            self._remove(digest)
+            self.misses += 1
+            observe_cache("jwt", False)
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        observe_cache("jwt", True)
+        return payload
+    
+    def put(self, digest: bytes, payload: dict) -> None:
+        """검증된 페이로드 저장 (exp 없는 토큰은 저장하지 않음)"""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or self.max_size <= 0:
+            return
+        self._entries[digest] = (payload, float(exp))
+        self._entries.move_to_end(digest)
+        session_id = payload.get("session_id")
+        if session_id:
+            self._by_session.setdefault(session_id, set()).add(digest)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    def invalidate_session(self, session_id: str) -> int:
+        """세션에 속한 토큰 캐시 제거 (메모리 정리용)
+        
+        토큰을 무효화하지는 않는다. 종료된 세션 토큰은 get_current_table이
+        세션 레지스트리로 거부한다.
+        """
+        digests = self._by_session.pop(str(session_id), ())
+        for digest in digests:
+            self._entries.pop(digest, None)
+        return len(digests)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_session.clear()
+    
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+    
+    def _remove(self, digest: bytes) -> None:
+        payload, _ = self._entries.pop(digest)
+        session_id = payload.get("session_id")
+        if session_id and session_id in self._by_session:
+            digests = self._by_session[session_id]
+            digests.discard(digest)
+            if not digests:
+                del self._by_session[session_id]
+
+
+_token_cache: Optional[TokenCache] = None
+
+
+def get_token_cache() -> TokenCache:
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(settings.jwt_cache_size)
+    return _token_cache
+
+
 def verify_token(token: str) -> dict:
-    """JWT 토큰 검증"""
+    """JWT 토큰 검증 (검증된 페이로드는 만료 시각까지 캐시)"""
+    cache = get_token_cache()
+    digest = cache.digest(token)
+    payload = cache.get(digest)
+    if payload is not None:
+        return dict(payload)
+    
     try:
         payload = jwt.decode(
             token,
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm]
         )
-        return payload
     except JWTError as e:
         raise ValueError(f"Invalid token: {str(e)}")
+    
+    cache.put(digest, payload)
+    return dict(payload)
@@ -0,0 +1,74 @@
+import inspect
+import logging
+from typing import Any, Callable
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import mark_write
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+logger = logging.getLogger(__name__)
+
+
+def after_commit(db: AsyncSession, callback: Callable[..., Any], *args: Any) -> None:
+    """커밋 이후 실행할 작업 등록 (SSE 브로드캐스트, 캐시 무효화 등)
+    
+    롤백되거나 커밋 없이 세션이 닫히면 실행되지 않는다.
+    """
+    db.info.setdefault("after_commit", []).append((callback, args))
+
+
+async def commit(db: AsyncSession) -> None:
+    """트랜잭션 커밋 후 등록된 after_commit 작업 실행
+    
+    커밋할 트랜잭션이 없으면 (세션이 이미 닫혔거나 롤백됨) 작업을 실행하지 않는다.
+    커밋이 실패하면 예외가 그대로 전파되고 작업은 버려진다.
+    """
+    callbacks = db.info.pop("after_commit", [])
+    if not db.in_transaction():
+        if callbacks:
+            logger.warning(
+                f"Dropped {len(callbacks)} after_commit callbacks: no transaction to commit"
+            )
+        return
+    
+    await db.commit()
+    
+    for callback, args in callbacks:
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            # 이미 커밋된 요청을 실패시키지 않음
+            logger.exception("after_commit callback failed")
+
+
+class UnitOfWorkRoute(APIRoute):
+    """요청 단위 트랜잭션 라우트
+    
+    엔드포인트가 정상 반환하면 응답 전송 전에 get_db 세션을 한 번 커밋한다.
+    예외가 발생하면 커밋하지 않으며 세션 종료 시 롤백된다.
+    쓰기 요청 응답에는 read-your-writes를 위한 쓰기 시각 쿠키를 설정한다.
+    
+    FastAPI 0.118 미만은 yield 의존성을 핸들러 안에서 정리하므로 커밋 시점에
+    세션이 이미 닫혀 있다. 이 경우 쓰기가 조용히 버려지지 않도록 오류를 낸다.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def unit_of_work_handler(request: Request) -> Response:
+            response = await handler(request)
+            db = getattr(request.state, "db", None)
+            if db is not None:
+                if db.info.get("closed"):
+                    raise RuntimeError("get_db session closed before commit (requires FastAPI >= 0.118)")
+                await commit(db)
+            if request.method not in SAFE_METHODS:
+                # 이후 같은 클라이언트의 읽기는 복제 지연 동안 primary 사용
+                mark_write(response)
+            return response
+        
+        return unit_of_work_handler
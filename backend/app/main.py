@@ -1,14 +1,32 @@
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import engine
-from app.core.logging import setup_logging
+from app.core.database import engine, read_engine, pool_validator
+from app.core.db_pool import get_pool_stats
+from app.core.dependencies import require_metrics_access
+from app.core.metrics import (
+    CONTENT_TYPE,
+    DB_POOL_CONNECTIONS,
+    QUEUE_DEPTH,
+    SSE_CONNECTIONS,
+    get_metrics_registry,
+    metrics_flusher,
+)
+from app.core.security import get_password_hasher
+from app.services.history_maintenance import get_history_partition_maintainer
+from app.services.order_archiver import get_order_archiver
+from app.services.session_registry import get_session_registry
+from app.services.sse_service import get_sse_service
+from app.core.logging import get_log_queue_depth, setup_logging
 from app.api.v1.router import api_router
 from app.middleware import (
+    CompressionMiddleware,
     RequestLoggingMiddleware,
+    RequestProfilingMiddleware,
     app_exception_handler,
     generic_exception_handler,
 )
@@ -19,6 +37,34 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def _collect_queue_depths():
+    yield ("log",), get_log_queue_depth()
+    yield ("sse",), get_sse_service().get_queued_event_count()
+    yield ("password_hasher",), get_password_hasher().get_stats()["queued"]
+
+
+def _collect_sse_connections():
+    for store_id, count in get_sse_service().get_connection_counts_by_store().items():
+        yield (str(store_id),), count
+
+
+def _collect_pool_connections():
+    pools = {"primary": engine}
+    if read_engine is not engine:
+        pools["replica"] = read_engine
+    for name, pool_engine in pools.items():
+        stats = get_pool_stats(pool_engine)
+        yield (name, "checked_out"), stats["checked_out"]
+        yield (name, "checked_in"), stats["checked_in"]
+        # overflow()는 pool_size 미만일 때 음수
+        yield (name, "overflow"), max(stats["overflow"], 0)
+
+
+QUEUE_DEPTH.set_function(_collect_queue_depths)
+SSE_CONNECTIONS.set_function(_collect_sse_connections)
+DB_POOL_CONNECTIONS.set_function(_collect_pool_connections)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
@@ -31,12 +77,25 @@ async def lifespan(app: FastAPI):
             "debug": settings.debug,
         }
     )
+    await get_session_registry().start_listener()
+    pool_validator.start()
+    get_history_partition_maintainer().start()
+    get_order_archiver().start()
+    metrics_flusher.start()
     
     yield
     
     # Shutdown
     logger.info("Application shutting down")
+    await get_session_registry().stop_listener()
+    await pool_validator.stop()
+    await get_history_partition_maintainer().stop()
+    await get_order_archiver().stop()
+    await metrics_flusher.stop()
+    get_password_hasher().shutdown()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
 def create_application() -> FastAPI:
@@ -59,9 +118,16 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["*"],
-        expose_headers=["X-Request-ID", "X-Process-Time"],
+        expose_headers=["X-Request-ID", "X-Process-Time", "X-DB-Query-Count", "X-DB-Time", "X-Profiled"],
     )
     
+    # 응답 압축 미들웨어 (SSE/스트리밍 응답 제외)
+    app.add_middleware(CompressionMiddleware)
+    
+    # 요청 프로파일링 미들웨어 (로깅 미들웨어의 request_id를 사용하므로 안쪽에 등록)
+    if settings.profiling_enabled:
+        app.add_middleware(RequestProfilingMiddleware)
+    
     # 요청 로깅 미들웨어
     app.add_middleware(RequestLoggingMiddleware)
     
@@ -88,3 +154,10 @@ async def root():
         "version": "1.0.0",
         "docs": "/docs" if settings.debug else None,
     }
+
+
+# Prometheus 메트릭
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_access)])
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭 (멀티 워커 합산)"""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
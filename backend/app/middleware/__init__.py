@@ -1,11 +1,15 @@
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.logging import RequestLoggingMiddleware
+from app.middleware.profiling import RequestProfilingMiddleware
 from app.middleware.error_handler import (
     app_exception_handler,
     generic_exception_handler,
 )
 
 __all__ = [
+    "CompressionMiddleware",
     "RequestLoggingMiddleware",
+    "RequestProfilingMiddleware",
     "app_exception_handler",
     "generic_exception_handler",
 ]
@@ -0,0 +1,62 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.compression import choose_encoding, compress_async, should_compress
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def _compressible(content_type: str) -> bool:
+    # SSE는 이벤트 단위로 즉시 전달되어야 하므로 압축하지 않음
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """gzip/brotli 응답 압축 미들웨어 (순수 ASGI)
+    
+    본문이 한 번에 전달되는 응답 중 COMPRESSION_MIN_SIZE ~ COMPRESSION_MAX_SIZE인
+    JSON/텍스트만 압축하며, 큰 본문은 스레드 풀에서 압축한다. 스트리밍 응답(SSE 포함)과 이미 Content-Encoding이 있는 응답
+    (미리 압축된 캐시 응답)은 그대로 전달한다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if _compressible(headers.get("content-type", "")) and "content-encoding" not in headers:
+                    # 첫 body를 보고 압축 여부를 정할 때까지 헤더 전송 보류
+                    headers.add_vary_header("Accept-Encoding")
+                    start_message = message
+                    return
+            
+            elif message["type"] == "http.response.body" and start_message is not None:
+                start, start_message = start_message, None
+                body = message.get("body", b"")
+                if not message.get("more_body", False) and should_compress(len(body)):
+                    compressed = await compress_async(body, encoding)
+                    if len(compressed) < len(body):
+                        headers = MutableHeaders(scope=start)
+                        headers["Content-Encoding"] = encoding
+                        headers["Content-Length"] = str(len(compressed))
+                        message = {**message, "body": compressed}
+                await send(start)
+            
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
@@ -29,7 +29,8 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
                 "details": exc.details,
             },
             "request_id": request_id,
-        }
+        },
+        headers=getattr(exc, "headers", None),
     )
 
 
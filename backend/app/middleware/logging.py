@@ -1,58 +1,110 @@
+import random
 import time
 import uuid
 import logging
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.metrics import observe_request, route_label
+from app.core.query_stats import start_query_stats
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """요청/응답 로깅 미들웨어"""
+class RequestLoggingMiddleware:
+    """요청/응답 로깅 미들웨어 (순수 ASGI)
+    
+    응답을 별도 태스크/스트림으로 감싸지 않으므로 SSE 같은 스트리밍 응답도
+    그대로 전달된다. 처리 시간 헤더는 응답 시작 시점, 완료 로그는 마지막
+    body 전송 시점 기준이다.
+    """
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # 요청 ID 생성
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # 요청 ID 생성 (request.state.request_id)
         request_id = str(uuid.uuid4())[:8]
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        query_stats = start_query_stats(request_id)
         
-        # 시작 시간
-        start_time = time.time()
+        method = scope["method"]
+        path = scope["path"]
+        start_time = time.perf_counter()
+        status_code = 500
+        completed = False
         
-        # 요청 로깅
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client_ip": request.client.host if request.client else "unknown",
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            client = scope.get("client")
+            logger.debug(
+                f"Request started: {method} {path}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "client_ip": client[0] if client else "unknown",
+                }
+            )
         
-        # 요청 처리
-        response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, completed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                
+                # 응답 헤더에 요청 ID/처리 시간 추가
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = str(process_time_ms)
+                headers["X-DB-Query-Count"] = str(query_stats.count)
+                headers["X-DB-Time"] = str(query_stats.duration_ms)
+            
+            await send(message)
+            
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                completed = True
+                self._log_completed(scope, request_id, status_code, start_time, query_stats)
         
-        # 처리 시간 계산
-        process_time = time.time() - start_time
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 예외 또는 스트리밍 중 연결 종료
+            if not completed:
+                self._log_completed(scope, request_id, status_code, start_time, query_stats)
+    
+    @staticmethod
+    def _log_completed(scope, request_id, status_code, start_time, query_stats) -> None:
+        elapsed = time.perf_counter() - start_time
+        process_time_ms = round(elapsed * 1000, 2)
+        method = scope["method"]
+        path = scope["path"]
+        
+        # 메트릭은 샘플링과 무관하게 모든 요청을 기록
+        observe_request(
+            method, route_label(scope), status_code, elapsed, query_stats.count, query_stats.duration
+        )
+        
+        # 성공 요청은 샘플링, 오류/느린 요청은 항상 기록
+        if (
+            status_code < 400
+            and process_time_ms < settings.log_slow_request_ms
+            and random.random() >= settings.log_success_sample_rate
+        ):
+            return
         
-        # 응답 로깅
         logger.info(
-            f"Request completed: {response.status_code} in {round(process_time * 1000, 2)}ms",
+            f"Request completed: {status_code} in {process_time_ms}ms",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "process_time_ms": round(process_time * 1000, 2),
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "process_time_ms": process_time_ms,
+                "db_query_count": query_stats.count,
+                "db_time_ms": query_stats.duration_ms,
             }
         )
-        
-        # 응답 헤더에 요청 ID 추가
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
-        
-        return response
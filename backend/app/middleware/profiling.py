@@ -0,0 +1,102 @@
+import logging
+import random
+import time
+from typing import Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.profiling import ProfileReport, RequestProfiler, get_profile_store
+from app.core.security import verify_token
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+
+class RequestProfilingMiddleware:
+    """요청 프로파일링 미들웨어 (순수 ASGI)
+    
+    PROFILING_ENABLED일 때만 등록된다. 관리자 토큰과 X-Profile: 1 헤더가
+    함께 온 요청, 또는 PROFILING_SAMPLE_RATE 비율로 뽑힌 요청을 프로파일링하고
+    결과를 request_id로 보관한다. RequestLoggingMiddleware 안쪽에 등록해야 한다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.profiler = RequestProfiler(settings.profiling_backend, settings.profiling_top_n)
+        self.store = get_profile_store()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        trigger, store_id = self._select(scope)
+        profiler = self.profiler.start() if trigger else None
+        if profiler is None:
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        start_time = time.perf_counter()
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Profiled"] = "1"
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            report = self.profiler.stop(profiler)
+            request_id = scope.get("state", {}).get("request_id", "")
+            self.store.add(ProfileReport(
+                request_id=request_id,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                store_id=store_id,
+                trigger=trigger,
+                backend=self.profiler.backend,
+                duration_ms=duration_ms,
+                report=report,
+            ))
+            logger.info(
+                f"Request profiled: {scope['method']} {scope['path']} ({trigger})",
+                extra={"request_id": request_id, "path": scope["path"]},
+            )
+    
+    def _select(self, scope: Scope) -> Tuple[Optional[str], Optional[int]]:
+        """프로파일링 여부(trigger)와 요청 토큰의 매장 ID"""
+        headers = Headers(scope=scope)
+        # 장시간 유지되는 SSE 스트림은 제외
+        if "text/event-stream" in headers.get("accept", ""):
+            return None, None
+        requested = headers.get(PROFILE_HEADER) == "1"
+        rate = settings.profiling_sample_rate
+        sampled = rate > 0 and random.random() < rate
+        if not (requested or sampled):
+            return None, None
+        
+        # 대상 요청만 토큰 확인 (헤더 요청은 관리자만 허용)
+        payload = _token_payload(headers)
+        store_id = payload.get("store_id") if payload else None
+        if requested and payload and payload.get("user_type") == "admin":
+            return "header", store_id
+        if sampled:
+            return "sampled", store_id
+        return None, None
+
+
+def _token_payload(headers: Headers) -> Optional[dict]:
+    authorization = headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return verify_token(token)
+    except ValueError:
+        return None
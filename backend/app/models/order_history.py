@@ -11,5 +11,5 @@ class OrderHistory(Base):
     session_id = Column(UUID(as_uuid=True), nullable=False)
     table_id = Column(Integer, nullable=False)
     store_id = Column(Integer, nullable=False)
-    completed_time = Column(DateTime, server_default=func.now())
+    completed_time = Column(DateTime, nullable=False, server_default=func.now())  # 파티션 키
     archived_order_data = Column(JSONB, nullable=False)
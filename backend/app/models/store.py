@@ -6,6 +6,8 @@ from app.core.database import Base
 
 class Store(Base):
     __tablename__ = "stores"
+    # flush 시 RETURNING으로 server default/onupdate 값을 함께 로드
+    __mapper_args__ = {"eager_defaults": True}
     
     store_id = Column(Integer, primary_key=True, autoincrement=True)
     store_name = Column(String(100), nullable=False)
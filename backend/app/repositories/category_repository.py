@@ -24,20 +24,18 @@ class CategoryRepository:
     
     async def create(self, category: Category) -> Category:
         self.db.add(category)
-        await self.db.commit()
-        await self.db.refresh(category)
+        await self.db.flush()
         return category
     
     async def update(self, category: Category) -> Category:
-        await self.db.commit()
-        await self.db.refresh(category)
+        await self.db.flush()
         return category
     
     async def delete(self, category_id: int) -> bool:
         category = await self.get_by_id(category_id)
         if category:
             await self.db.delete(category)
-            await self.db.commit()
+            await self.db.flush()
             return True
         return False
     
@@ -1,9 +1,80 @@
-from typing import Optional, List
-from datetime import date
-from sqlalchemy import select, func
+from typing import Optional, List, Tuple
+from datetime import date, datetime
+from uuid import UUID
+from sqlalchemy import select, func, text, true, tuple_
+from sqlalchemy.orm import aliased
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import OrderHistory
 
+# 세션 주문을 DB 안에서 JSONB로 집계하여 order_history에 저장 (세션 목록 단위)
+ARCHIVE_SESSIONS_SQL = text("""
+    WITH target AS (
+        SELECT s.session_id, s.table_id, t.store_id
+        FROM table_sessions s
+        JOIN tables t ON t.table_id = s.table_id
+        WHERE s.session_id = ANY(CAST(:session_ids AS uuid[]))
+    ),
+    target_orders AS (
+        SELECT ord.order_id, ord.session_id, ord.order_time, ord.total_amount, ord.status
+        FROM orders ord
+        WHERE ord.session_id IN (SELECT session_id FROM target)
+    ),
+    item_docs AS (
+        SELECT
+            item.order_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'menu_id', item.menu_id,
+                    'quantity', item.quantity,
+                    'unit_price', item.unit_price
+                )
+                ORDER BY item.order_item_id
+            ) AS items
+        FROM order_items item
+        WHERE item.order_id IN (SELECT order_id FROM target_orders)
+        GROUP BY item.order_id
+    ),
+    order_docs AS (
+        SELECT
+            o.session_id,
+            o.order_id,
+            o.order_time,
+            o.total_amount,
+            jsonb_build_object(
+                'order_id', o.order_id,
+                'order_time', o.order_time,
+                'total_amount', o.total_amount,
+                'status', o.status,
+                'items', COALESCE(i.items, '[]'::jsonb)
+            ) AS order_doc
+        FROM target_orders o
+        LEFT JOIN item_docs i ON i.order_id = o.order_id
+    )
+    INSERT INTO order_history (session_id, table_id, store_id, archived_order_data)
+    SELECT
+        target.session_id,
+        target.table_id,
+        target.store_id,
+        jsonb_build_object(
+            'orders', COALESCE(
+                jsonb_agg(d.order_doc ORDER BY d.order_time DESC, d.order_id DESC)
+                    FILTER (WHERE d.order_id IS NOT NULL),
+                '[]'::jsonb
+            ),
+            'session_total', COALESCE(SUM(d.total_amount), 0)
+        )
+    FROM target
+    LEFT JOIN order_docs d ON d.session_id = target.session_id
+    GROUP BY target.session_id, target.table_id, target.store_id
+    RETURNING
+        history_id,
+        session_id,
+        table_id,
+        (archived_order_data->>'session_total')::int AS session_total,
+        jsonb_array_length(archived_order_data->'orders') AS order_count
+""")
+
 
 class HistoryRepository:
     def __init__(self, db: AsyncSession):
@@ -15,47 +86,87 @@ class HistoryRepository:
         )
         return result.scalar_one_or_none()
     
-    async def get_by_table(
+    async def get_page_by_table(
         self,
         table_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         limit: int = 20,
-        offset: int = 0
-    ) -> List[OrderHistory]:
-        query = select(OrderHistory).where(OrderHistory.table_id == table_id)
+        after: Optional[Tuple[datetime, int]] = None,
+        offset: int = 0,
+        count_limit: Optional[int] = None,
+    ) -> Tuple[List[OrderHistory], Optional[int]]:
+        """테이블 이력 한 페이지 (completed_time, history_id 내림차순 keyset)
         
+        order_history는 completed_time 월별 파티션이므로 start_date/end_date와
+        커서 시각 범위 밖의 파티션은 스캔하지 않는다.
+        limit + 1건까지 조회하므로 호출 측에서 다음 페이지 여부를 판단할 수 있다.
+        count_limit이 주어지면 같은 쿼리에서 전체 건수를 count_limit + 1건까지 센다
+        (0이면 제한 없음).
+        """
+        filters = [OrderHistory.table_id == table_id]
         if start_date:
-            query = query.where(OrderHistory.completed_time >= start_date)
+            filters.append(OrderHistory.completed_time >= start_date)
         if end_date:
-            query = query.where(OrderHistory.completed_time <= end_date)
+            filters.append(OrderHistory.completed_time <= end_date)
         
-        query = query.order_by(OrderHistory.completed_time.desc())
-        query = query.limit(limit).offset(offset)
+        page_query = select(OrderHistory).where(*filters)
+        if after is not None:
+            # 행 비교만으로는 파티션 프루닝이 안 되므로 completed_time 조건을 함께 건다
+            page_query = page_query.where(
+                OrderHistory.completed_time <= after[0],
+                tuple_(OrderHistory.completed_time, OrderHistory.history_id) < after,
+            )
+        elif offset:
+            page_query = page_query.offset(offset)
+        page_query = page_query.order_by(
+            OrderHistory.completed_time.desc(), OrderHistory.history_id.desc()
+        ).limit(limit + 1)
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        if count_limit is None:
+            result = await self.db.execute(page_query)
+            return list(result.scalars().all()), None
+        
+        # 빈 페이지여도 건수가 나오도록 건수 쪽에 페이지를 LEFT JOIN
+        counted = select(OrderHistory.history_id).where(*filters)
+        if count_limit:
+            counted = counted.limit(count_limit + 1)
+        total = select(func.count().label("total_count")).select_from(counted.subquery()).subquery()
+        page = page_query.subquery()
+        history = aliased(OrderHistory, page)
+        query = (
+            select(total.c.total_count, history)
+            .select_from(total)
+            .outerjoin(page, true())
+            .order_by(page.c.completed_time.desc(), page.c.history_id.desc())
+        )
+        rows = (await self.db.execute(query)).all()
+        total_count = rows[0].total_count if rows else 0
+        return [row[1] for row in rows if row[1] is not None], total_count
     
-    async def count_by_table(
-        self,
-        table_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None
-    ) -> int:
-        query = select(func.count(OrderHistory.history_id)).where(
-            OrderHistory.table_id == table_id
+    async def ensure_partitions(self, months_ahead: int) -> int:
+        """현재 월부터 months_ahead개월 뒤까지 월 파티션 생성 (새로 만든 개수 반환)"""
+        result = await self.db.execute(
+            text("SELECT ensure_order_history_partitions(CURRENT_DATE, :months_ahead)"),
+            {"months_ahead": months_ahead},
         )
-        
-        if start_date:
-            query = query.where(OrderHistory.completed_time >= start_date)
-        if end_date:
-            query = query.where(OrderHistory.completed_time <= end_date)
-        
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+        return result.scalar_one()
     
     async def create(self, history: OrderHistory) -> OrderHistory:
         self.db.add(history)
-        await self.db.commit()
-        await self.db.refresh(history)
+        await self.db.flush()
         return history
+    
+    async def archive_sessions(self, session_ids: List[UUID]) -> List[Row]:
+        """세션별 주문 아카이브 (세션마다 history_id, session_total, order_count 반환)"""
+        if not session_ids:
+            return []
+        result = await self.db.execute(
+            ARCHIVE_SESSIONS_SQL, {"session_ids": list(session_ids)}
+        )
+        return list(result.all())
+    
+    async def archive_session(self, session_id: UUID) -> Row:
+        """단일 세션 주문 아카이브"""
+        rows = await self.archive_sessions([session_id])
+        return rows[0]
@@ -32,19 +32,17 @@ class MenuRepository:
     
     async def create(self, menu: Menu) -> Menu:
         self.db.add(menu)
-        await self.db.commit()
-        await self.db.refresh(menu)
+        await self.db.flush()
         return menu
     
     async def update(self, menu: Menu) -> Menu:
-        await self.db.commit()
-        await self.db.refresh(menu)
+        await self.db.flush()
         return menu
     
     async def delete(self, menu_id: int) -> bool:
         menu = await self.get_by_id(menu_id)
         if menu:
             await self.db.delete(menu)
-            await self.db.commit()
+            await self.db.flush()
             return True
         return False
@@ -1,9 +1,55 @@
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, func, and_, text
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import Order, OrderItem, TableSession
+from app.models import Order, OrderItem, TableSession, Table, Menu
+
+# 종료된 세션(종료 시 order_history에 보관됨)의 주문/항목을 한 배치만큼 라이브 테이블에서 제거.
+# {cold}에는 콜드 테이블로 옮기는 CTE가 들어간다 (삭제 모드는 빈 문자열).
+_ARCHIVE_BATCH_SQL = """
+    WITH batch AS (
+        SELECT o.order_id
+        FROM orders o
+        JOIN table_sessions s ON s.session_id = o.session_id
+        WHERE s.is_active = FALSE AND s.end_time < :cutoff
+        ORDER BY o.order_id
+        LIMIT :batch_size
+        FOR UPDATE OF o SKIP LOCKED
+    ),
+    moved_items AS (
+        DELETE FROM order_items i
+        USING batch b
+        WHERE i.order_id = b.order_id
+        RETURNING i.order_item_id, i.order_id, i.menu_id, i.quantity, i.unit_price
+    ),
+    moved_orders AS (
+        DELETE FROM orders o
+        USING batch b
+        WHERE o.order_id = b.order_id
+        RETURNING o.order_id, o.session_id, o.table_id, o.store_id,
+                  o.order_time, o.total_amount, o.status
+    ){cold}
+    SELECT
+        (SELECT count(*) FROM moved_orders) AS order_count,
+        (SELECT count(*) FROM moved_items) AS item_count
+"""
+
+MOVE_CLOSED_ORDERS_SQL = text(_ARCHIVE_BATCH_SQL.format(cold=""",
+    cold_items AS (
+        INSERT INTO order_items_archive (order_item_id, order_id, menu_id, quantity, unit_price)
+        SELECT * FROM moved_items
+    ),
+    cold_orders AS (
+        INSERT INTO orders_archive (
+            order_id, session_id, table_id, store_id, order_time, total_amount, status
+        )
+        SELECT * FROM moved_orders
+    )"""))
+
+DELETE_CLOSED_ORDERS_SQL = text(_ARCHIVE_BATCH_SQL.format(cold=""))
 
 
 class OrderRepository:
@@ -49,23 +95,69 @@ class OrderRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_board_rows(
+        self,
+        store_id: int,
+        status: Optional[str] = None,
+        table_id: Optional[int] = None
+    ) -> List[Row]:
+        """활성 세션 테이블의 주문/항목을 단일 쿼리로 평탄화하여 조회"""
+        order_join = Order.session_id == Table.current_session_id
+        if status:
+            order_join = and_(order_join, Order.status == status)
+        
+        query = (
+            select(
+                Table.table_id,
+                Table.table_number,
+                Table.current_session_id,
+                Order.order_id,
+                Order.total_amount,
+                Order.status,
+                Order.order_time,
+                OrderItem.order_item_id,
+                OrderItem.menu_id,
+                Menu.menu_name,
+                OrderItem.quantity,
+                OrderItem.unit_price,
+            )
+            .select_from(Table)
+            .outerjoin(Order, order_join)
+            .outerjoin(OrderItem, OrderItem.order_id == Order.order_id)
+            .outerjoin(Menu, Menu.menu_id == OrderItem.menu_id)
+            .where(
+                Table.store_id == store_id,
+                Table.current_session_id.isnot(None),
+            )
+        )
+        
+        if table_id:
+            query = query.where(Table.table_id == table_id)
+        
+        query = query.order_by(
+            Table.table_number,
+            Order.order_time.desc(),
+            Order.order_id.desc(),
+            OrderItem.order_item_id,
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+    
     async def create(self, order: Order) -> Order:
         self.db.add(order)
-        await self.db.commit()
-        await self.db.refresh(order)
+        await self.db.flush()
         # Reload with relationships
         return await self.get_by_id(order.order_id)
     
     async def update(self, order: Order) -> Order:
-        await self.db.commit()
-        await self.db.refresh(order)
+        await self.db.flush()
         return order
     
     async def delete(self, order_id: int) -> bool:
         order = await self.get_by_id(order_id)
         if order:
             await self.db.delete(order)
-            await self.db.commit()
+            await self.db.flush()
             return True
         return False
     
@@ -75,3 +167,17 @@ class OrderRepository:
             .where(Order.session_id == session_id)
         )
         return result.scalar() or 0
+    
+    async def archive_closed_orders(
+        self, cutoff: datetime, batch_size: int, keep_cold: bool = True
+    ) -> Row:
+        """cutoff 이전에 종료된 세션의 주문을 최대 batch_size건 라이브 테이블에서 제거
+        
+        keep_cold이면 orders_archive/order_items_archive로 옮기고, 아니면 삭제한다.
+        다른 워커가 잠근 주문은 건너뛴다. (order_count, item_count) 반환.
+        """
+        result = await self.db.execute(
+            MOVE_CLOSED_ORDERS_SQL if keep_cold else DELETE_CLOSED_ORDERS_SQL,
+            {"cutoff": cutoff, "batch_size": batch_size},
+        )
+        return result.one()
@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import Optional, List
+from datetime import datetime
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update, text
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import TableSession
+from app.core.config import get_settings
+from app.models import TableSession, Table
+
+settings = get_settings()
 
 
 class SessionRepository:
@@ -15,6 +20,32 @@ class SessionRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_with_table(self, session_id: UUID) -> Optional[Row]:
+        """세션 상태와 테이블 번호 조회"""
+        result = await self.db.execute(
+            select(
+                TableSession.session_id,
+                TableSession.table_id,
+                TableSession.is_active,
+                Table.table_number,
+            )
+            .join(Table, Table.table_id == TableSession.table_id)
+            .where(TableSession.session_id == session_id)
+        )
+        return result.one_or_none()
+    
+    async def notify_ended(self, session_ids: List[UUID]) -> None:
+        """세션 종료를 다른 워커에 알림 (NOTIFY는 커밋 시점에 전달됨)"""
+        if self.db.bind.dialect.name != "postgresql":
+            return
+        await self.db.execute(
+            text("SELECT pg_notify(:channel, sid) FROM unnest(CAST(:session_ids AS text[])) AS sid"),
+            {
+                "channel": settings.session_invalidation_channel,
+                "session_ids": [str(session_id) for session_id in session_ids],
+            }
+        )
+    
     async def get_active_by_table(self, table_id: int) -> Optional[TableSession]:
         result = await self.db.execute(
             select(TableSession).where(
@@ -24,13 +55,44 @@ class SessionRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_active_by_store(
+        self, store_id: int, table_ids: Optional[List[int]] = None
+    ) -> List[Row]:
+        """매장의 활성 세션 조회 (종료 처리를 위해 행 잠금)"""
+        query = (
+            select(TableSession.session_id, Table.table_id, Table.table_number)
+            .join(Table, Table.table_id == TableSession.table_id)
+            .where(
+                Table.store_id == store_id,
+                TableSession.is_active == True,
+            )
+            .order_by(Table.table_number)
+            .with_for_update(of=TableSession)
+        )
+        if table_ids is not None:
+            query = query.where(Table.table_id.in_(table_ids))
+        
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def end_sessions(self, session_ids: List[UUID]) -> int:
+        """세션 일괄 종료 (트리거가 table.current_session_id 자동 초기화)"""
+        result = await self.db.execute(
+            update(TableSession)
+            .where(
+                TableSession.session_id.in_(session_ids),
+                TableSession.is_active == True,
+            )
+            .values(is_active=False, end_time=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
     async def create(self, session: TableSession) -> TableSession:
         self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
+        await self.db.flush()
         return session
     
     async def update(self, session: TableSession) -> TableSession:
-        await self.db.commit()
-        await self.db.refresh(session)
+        await self.db.flush()
         return session
@@ -22,6 +22,5 @@ class StoreRepository:
     
     async def create(self, store: Store) -> Store:
         self.db.add(store)
-        await self.db.commit()
-        await self.db.refresh(store)
+        await self.db.flush()
         return store
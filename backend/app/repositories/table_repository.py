@@ -35,11 +35,9 @@ class TableRepository:
     
     async def create(self, table: Table) -> Table:
         self.db.add(table)
-        await self.db.commit()
-        await self.db.refresh(table)
+        await self.db.flush()
         return table
     
     async def update(self, table: Table) -> Table:
-        await self.db.commit()
-        await self.db.refresh(table)
+        await self.db.flush()
         return table
@@ -17,6 +17,10 @@ from app.schemas.order import (
 from app.schemas.table import (
     TableCreate, TableResponse,
     SessionEndResponse, OrderHistoryItem, TableHistoryResponse,
+    BulkSessionEndRequest, SessionEndSummary, BulkSessionEndResponse,
+)
+from app.schemas.profile import (
+    ProfileSummary, ProfileListResponse, ProfileDetailResponse,
 )
 
 __all__ = [
@@ -37,4 +41,7 @@ __all__ = [
     # Table
     "TableCreate", "TableResponse",
     "SessionEndResponse", "OrderHistoryItem", "TableHistoryResponse",
+    "BulkSessionEndRequest", "SessionEndSummary", "BulkSessionEndResponse",
+    # Profile
+    "ProfileSummary", "ProfileListResponse", "ProfileDetailResponse",
 ]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+
+
+class ProfileSummary(BaseModel):
+    request_id: str
+    method: str
+    path: str
+    status_code: int
+    trigger: str
+    backend: str
+    duration_ms: float
+    created_at: datetime
+
+
+class ProfileListResponse(BaseModel):
+    profiles: List[ProfileSummary]
+    total_count: int
+
+
+class ProfileDetailResponse(ProfileSummary):
+    report: str
@@ -28,6 +28,25 @@ class SessionEndResponse(BaseModel):
     order_count: int
 
 
+class BulkSessionEndRequest(BaseModel):
+    table_ids: Optional[List[int]] = Field(None, description="종료할 테이블 ID (없으면 전체)")
+
+
+class SessionEndSummary(BaseModel):
+    table_id: int
+    table_number: int
+    session_id: UUID
+    total_session_amount: int
+    order_count: int
+
+
+class BulkSessionEndResponse(BaseModel):
+    message: str
+    closed_count: int
+    total_amount: int
+    sessions: List[SessionEndSummary]
+
+
 class OrderHistoryItem(BaseModel):
     history_id: int
     session_id: UUID
@@ -41,5 +60,8 @@ class OrderHistoryItem(BaseModel):
 class TableHistoryResponse(BaseModel):
     table_id: int
     table_number: int
-    total_count: int
+    total_count: Optional[int] = Field(None, description="전체 건수 (count=none이면 생략)")
+    total_count_capped: bool = Field(False, description="HISTORY_COUNT_LIMIT에서 세기를 멈춘 경우 true")
     history: List[OrderHistoryItem]
+    has_more: bool = False
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 요청 시 cursor로 전달")
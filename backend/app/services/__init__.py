@@ -3,6 +3,11 @@ from app.services.menu_service import MenuService
 from app.services.order_service import OrderService
 from app.services.table_service import TableService
 from app.services.sse_service import SSEService, get_sse_service
+from app.services.session_registry import SessionRegistry, get_session_registry
+from app.services.history_maintenance import (
+    HistoryPartitionMaintainer, get_history_partition_maintainer,
+)
+from app.services.order_archiver import OrderArchiver, get_order_archiver
 
 __all__ = [
     "AuthService",
@@ -11,4 +16,10 @@ __all__ = [
     "TableService",
     "SSEService",
     "get_sse_service",
+    "SessionRegistry",
+    "get_session_registry",
+    "HistoryPartitionMaintainer",
+    "get_history_partition_maintainer",
+    "OrderArchiver",
+    "get_order_archiver",
 ]
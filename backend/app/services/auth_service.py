@@ -1,7 +1,9 @@
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password_async, create_access_token
+from app.core.unit_of_work import after_commit
 from app.core.exceptions import NotFoundException, AuthenticationError
 from app.repositories import StoreRepository, TableRepository, SessionRepository
 from app.models import TableSession
+from app.services.session_registry import get_session_registry
 
 
 class AuthService:
@@ -29,7 +31,7 @@ class AuthService:
             raise NotFoundException("Table not found")
         
         # 3. 비밀번호 검증
-        if not verify_password(table_password, table.table_password_hash):
+        if not await verify_password_async(table_password, table.table_password_hash):
             raise AuthenticationError("Invalid credentials")
         
         # 4. 세션 확인/생성
@@ -46,6 +48,14 @@ class AuthService:
             table.current_session_id = session.session_id
             await self.table_repo.update(table)
         
+        after_commit(
+            self.session_repo.db,
+            get_session_registry().mark_active,
+            session.session_id,
+            table.table_id,
+            table.table_number,
+        )
+        
         # 5. JWT 토큰 생성
         token_data = {
             "sub": f"table_{table.table_id}",
@@ -75,7 +85,7 @@ class AuthService:
             raise AuthenticationError("Invalid credentials")
         
         # 2. 비밀번호 검증
-        if not verify_password(password, store.admin_password_hash):
+        if not await verify_password_async(password, store.admin_password_hash):
             raise AuthenticationError("Invalid credentials")
         
         # 3. JWT 토큰 생성
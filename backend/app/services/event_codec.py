@@ -0,0 +1,145 @@
+import json
+from datetime import datetime
+from typing import Any, Union
+from uuid import UUID
+import msgpack
+
+# 서버 -> 클라이언트 프레임: [FRAME_EVENT, id, event, data] / [FRAME_RESULT, ref, ok, data] / [FRAME_PING]
+FRAME_EVENT = 0
+FRAME_RESULT = 1
+FRAME_PING = 2
+
+# 클라이언트 -> 서버 메시지: [MSG_ACK, id] / [MSG_STATUS, ref, order_id, status] / [MSG_PING]
+MSG_ACK = 0
+MSG_STATUS = 1
+MSG_PING = 2
+
+ENCODINGS = ("msgpack", "json")
+
+# order_id 컬럼(INTEGER) 최대값
+MAX_ORDER_ID = 2 ** 31 - 1
+
+FIELD_CODES = {
+    "store_id": "S",
+    "tables": "T",
+    "table_id": "t",
+    "table_number": "n",
+    "session_id": "ss",
+    "total_amount": "a",
+    "total_session_amount": "ta",
+    "order_count": "c",
+    "orders": "O",
+    "order_id": "o",
+    "status": "s",
+    "order_time": "tm",
+    "items": "I",
+    "order_item_id": "oi",
+    "menu_id": "m",
+    "menu_name": "mn",
+    "quantity": "q",
+    "unit_price": "p",
+    "subtotal": "st",
+    "code": "xc",
+    "message": "xm",
+    "sessions": "SS",
+}
+
+STATUS_CODES = {"대기중": 0, "준비중": 1, "완료": 2}
+
+EVENT_CODES = {
+    "initial": 0,
+    "order_created": 1,
+    "order_updated": 2,
+    "order_deleted": 3,
+    "session_ended": 4,
+    "sessions_ended": 5,
+}
+
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+
+def compact(value: Any) -> Any:
+    """필드명/상태값을 짧은 코드로 치환하고 직렬화 가능한 값으로 변환"""
+    if isinstance(value, dict):
+        return {
+            FIELD_CODES.get(key, key): (
+                STATUS_CODES.get(item, item) if key == "status" else compact(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def event_frame(event: dict) -> list:
+    return [
+        FRAME_EVENT,
+        event["id"],
+        EVENT_CODES.get(event["event"], event["event"]),
+        compact(event["data"]),
+    ]
+
+
+def result_frame(ref: Any, ok: bool, data: dict) -> list:
+    return [FRAME_RESULT, ref, ok, compact(data)]
+
+
+def ping_frame() -> list:
+    return [FRAME_PING]
+
+
+def encode(frame: list, encoding: str) -> Union[bytes, str]:
+    """msgpack은 바이너리, json은 텍스트 프레임"""
+    if encoding == "msgpack":
+        return msgpack.packb(frame, use_bin_type=True)
+    return json.dumps(frame, ensure_ascii=False, separators=(",", ":"))
+
+
+class FrameError(ValueError):
+    """잘못된 클라이언트 메시지 (ref를 알 수 있으면 실패 결과 프레임으로 응답)"""
+    
+    def __init__(self, message: str, ref: Any = None):
+        super().__init__(message)
+        self.ref = ref
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_ref(value: Any) -> bool:
+    return value is None or _is_int(value) or (isinstance(value, str) and len(value) <= 64)
+
+
+def decode(raw: Union[bytes, str], encoding: str) -> list:
+    """클라이언트 메시지 디코드 및 형식 검증 (잘못된 메시지는 FrameError)"""
+    try:
+        message = msgpack.unpackb(raw, raw=False) if encoding == "msgpack" else json.loads(raw)
+    except Exception as e:
+        raise FrameError("Malformed message") from e
+    if not isinstance(message, list) or not message:
+        raise FrameError("Message must be a non-empty array")
+    
+    kind = message[0]
+    if kind == MSG_ACK and len(message) == 2 and _is_int(message[1]):
+        return message
+    if kind == MSG_PING and len(message) == 1:
+        return message
+    if kind == MSG_STATUS and len(message) >= 2 and _is_ref(message[1]):
+        ref = message[1]
+        if len(message) != 4:
+            raise FrameError("Status message must be [1, ref, order_id, status]", ref)
+        order_id, status = message[2], message[3]
+        if not _is_int(order_id) or not 0 < order_id <= MAX_ORDER_ID:
+            raise FrameError("order_id must be a positive integer", ref)
+        if _is_int(status):
+            status = STATUS_NAMES.get(status)
+        if status not in STATUS_CODES:
+            raise FrameError("Invalid status", ref)
+        return [MSG_STATUS, ref, order_id, status]
+    raise FrameError("Unknown message")
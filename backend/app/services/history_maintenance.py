@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import Optional
+from app.core.config import get_settings
+from app.core.database import async_session_maker
+from app.core.unit_of_work import commit
+from app.repositories import HistoryRepository
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class HistoryPartitionMaintainer:
+    """order_history 월 파티션 사전 생성
+    
+    시작 시 한 번, 이후 interval마다 현재 월 + months_ahead까지 파티션을 만든다.
+    DB 함수가 advisory lock을 잡으므로 여러 워커가 동시에 실행해도 안전하다.
+    """
+    
+    def __init__(self, months_ahead: int, interval: float):
+        self.months_ahead = months_ahead
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await self.ensure_partitions()
+            if self.interval <= 0:
+                return
+            await asyncio.sleep(self.interval)
+    
+    async def ensure_partitions(self) -> int:
+        """파티션 생성 (실패는 로그만 남기고 다음 주기에 재시도)"""
+        try:
+            async with async_session_maker() as db:
+                created = await HistoryRepository(db).ensure_partitions(self.months_ahead)
+                await commit(db)
+        except Exception as e:
+            logger.warning(f"Order history partition maintenance failed: {e}")
+            return 0
+        
+        if created:
+            logger.info(f"Order history partitions created: {created}")
+        return created
+
+
+_partition_maintainer: Optional[HistoryPartitionMaintainer] = None
+
+
+def get_history_partition_maintainer() -> HistoryPartitionMaintainer:
+    global _partition_maintainer
+    if _partition_maintainer is None:
+        _partition_maintainer = HistoryPartitionMaintainer(
+            settings.history_partition_months_ahead,
+            settings.history_partition_check_interval,
+        )
+    return _partition_maintainer
@@ -1,5 +1,10 @@
+import asyncio
 from typing import Optional
 from app.core.cache import get_cache_manager
+from app.core.config import settings
+from app.core.database import engine, read_engine
+from app.core.responses import EncodedJSON
+from app.core.unit_of_work import after_commit
 from app.core.exceptions import NotFoundException, ForbiddenError
 from app.repositories import MenuRepository, CategoryRepository
 from app.models import Menu
@@ -55,6 +60,19 @@ class MenuService:
         self.cache.set(cache_key, result, ttl=3600)
         return result
     
+    async def get_menus_encoded(
+        self, store_id: int, category_id: Optional[int] = None
+    ) -> EncodedJSON:
+        """직렬화/압축 결과까지 캐시한 메뉴 목록 (같은 키 접두사로 함께 무효화)"""
+        cache_key = f"menu:{store_id}:encoded" if not category_id else f"menu:{store_id}:{category_id}:encoded"
+        cached = self.cache.get(cache_key)
+        if cached:
+            return cached
+        
+        encoded = EncodedJSON(await self.get_menus_by_store(store_id, category_id))
+        self.cache.set(cache_key, encoded, ttl=3600)
+        return encoded
+    
     async def create_menu(self, store_id: int, menu_data: dict) -> Menu:
         # 카테고리 확인
         category = await self.category_repo.get_by_id(menu_data["category_id"])
@@ -75,8 +93,8 @@ class MenuService:
         )
         menu = await self.menu_repo.create(menu)
         
-        # 캐시 무효화
-        self.cache.invalidate_pattern(f"menu:{store_id}*")
+        # 캐시 무효화 (커밋 이후)
+        after_commit(self.menu_repo.db, self._invalidate_menus, store_id)
         return menu
     
     async def update_menu(self, menu_id: int, store_id: int, menu_data: dict) -> Menu:
@@ -92,7 +110,7 @@ class MenuService:
                 setattr(menu, key, value)
         
         menu = await self.menu_repo.update(menu)
-        self.cache.invalidate_pattern(f"menu:{store_id}*")
+        after_commit(self.menu_repo.db, self._invalidate_menus, store_id)
         return menu
     
     async def delete_menu(self, menu_id: int, store_id: int) -> bool:
@@ -103,5 +121,18 @@ class MenuService:
             raise ForbiddenError("Menu does not belong to this store")
         
         await self.menu_repo.delete(menu_id)
-        self.cache.invalidate_pattern(f"menu:{store_id}*")
+        after_commit(self.menu_repo.db, self._invalidate_menus, store_id)
         return True
+    
+    def _invalidate_menus(self, store_id: int) -> None:
+        """메뉴 캐시 무효화
+        
+        읽기 복제본 사용 시 지연된 복제본으로 다시 채워진 캐시를 지우기 위해
+        복제 지연 시간 이후 한 번 더 무효화한다.
+        """
+        pattern = f"menu:{store_id}*"
+        self.cache.invalidate_pattern(pattern)
+        if read_engine is not engine:
+            asyncio.get_running_loop().call_later(
+                settings.db_read_after_write_window, self.cache.invalidate_pattern, pattern
+            )
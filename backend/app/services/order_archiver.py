@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from sqlalchemy import text
+from app.core.config import get_settings
+from app.core.database import async_session_maker
+from app.core.metrics import ARCHIVED_ROWS
+from app.core.unit_of_work import commit
+from app.repositories import OrderRepository
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 진행 상황 로그 간격 (배치 수)
+PROGRESS_LOG_EVERY = 20
+
+# 실행 중에는 세션 수준 advisory lock을 잡아 여러 워커/작업 중 하나만 실행
+LOCK_SQL = text("SELECT pg_try_advisory_lock(hashtext('order_archiver'))")
+UNLOCK_SQL = text("SELECT pg_advisory_unlock(hashtext('order_archiver'))")
+
+
+class ArchiveRun:
+    """아카이브 실행 1회의 진행 상황"""
+    
+    __slots__ = ("started_at", "started", "batches", "orders", "items", "finished", "caught_up")
+    
+    def __init__(self):
+        self.started_at = datetime.utcnow()
+        self.started = time.perf_counter()
+        self.batches = 0
+        self.orders = 0
+        self.items = 0
+        self.finished: Optional[float] = None
+        self.caught_up = False
+    
+    @property
+    def duration(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+    
+    def to_dict(self) -> dict:
+        duration = self.duration
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_s": round(duration, 2),
+            "batches": self.batches,
+            "orders": self.orders,
+            "items": self.items,
+            "orders_per_s": round(self.orders / duration, 1) if duration else 0.0,
+            "caught_up": self.caught_up,
+        }
+
+
+class OrderArchiver:
+    """종료된 세션의 주문/항목을 라이브 테이블에서 콜드 테이블로 이동 (또는 삭제)
+    
+    세션 종료 시 주문은 같은 트랜잭션에서 order_history에 보관되므로, grace_period가
+    지난 종료 세션의 orders/order_items 행은 라이브 쿼리에 필요 없다. batch_size건씩
+    별도 트랜잭션으로 옮기고 배치 사이에는 batch_delay와 직전 배치 실행 시간 중 긴
+    만큼 쉬어 라이브 트래픽과 잠금/IO를 나눠 쓴다. 실행 전체 동안 advisory lock을
+    잡으므로 여러 워커가 주기 실행을 켜 두어도 한 번에 하나만 실행되고, 나머지는
+    그 주기를 건너뛴다. 주기 실행은 기본으로 꺼져 있으며, 워커 대신 별도 작업으로
+    실행하려면 `python archive_orders.py`를 사용한다.
+    """
+    
+    def __init__(
+        self,
+        interval: float,
+        grace_period: float,
+        batch_size: int,
+        batch_delay: float,
+        max_batches: int = 0,
+        keep_cold: bool = True,
+    ):
+        self.interval = interval
+        self.grace_period = grace_period
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_batches = max_batches
+        self.keep_cold = keep_cold
+        self.runs = 0
+        self.total_orders = 0
+        self.total_items = 0
+        self.failures = 0
+        self.skipped = 0
+        self.current: Optional[ArchiveRun] = None
+        self.last_run: Optional[ArchiveRun] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Order archive run failed: {e}")
+    
+    async def run_once(self) -> Optional[ArchiveRun]:
+        """다른 실행이 없으면 아카이브 실행 (이미 실행 중이면 None)"""
+        async with async_session_maker() as lock_db:
+            locked = (await lock_db.execute(LOCK_SQL)).scalar()
+            # 세션 수준 잠금은 커밋 후에도 유지됨 (idle in transaction 방지)
+            await commit(lock_db)
+            if not locked:
+                self.skipped += 1
+                return None
+            try:
+                return await self._run_batches()
+            finally:
+                await lock_db.execute(UNLOCK_SQL)
+                await commit(lock_db)
+    
+    async def _run_batches(self) -> ArchiveRun:
+        """남은 주문이 없거나 max_batches에 도달할 때까지 배치 반복"""
+        run = self.current = ArchiveRun()
+        cutoff = datetime.utcnow() - timedelta(seconds=self.grace_period)
+        try:
+            while not self.max_batches or run.batches < self.max_batches:
+                batch_started = time.perf_counter()
+                order_count, item_count = await self._archive_batch(cutoff)
+                run.batches += 1
+                run.orders += order_count
+                run.items += item_count
+                if order_count < self.batch_size:
+                    run.caught_up = True
+                    break
+                
+                if run.batches % PROGRESS_LOG_EVERY == 0:
+                    logger.info(
+                        f"Order archive progress: {run.orders} orders, {run.items} items "
+                        f"in {run.batches} batches ({run.duration:.1f}s)"
+                    )
+                await asyncio.sleep(max(self.batch_delay, time.perf_counter() - batch_started))
+        finally:
+            run.finished = time.perf_counter()
+            self.current = None
+            self.last_run = run
+            self.runs += 1
+        
+        if run.orders:
+            logger.info(
+                f"Order archive run finished: {run.orders} orders, {run.items} items "
+                f"in {run.batches} batches ({run.duration:.1f}s)"
+            )
+        return run
+    
+    async def _archive_batch(self, cutoff: datetime) -> Tuple[int, int]:
+        async with async_session_maker() as db:
+            row = await OrderRepository(db).archive_closed_orders(
+                cutoff, self.batch_size, keep_cold=self.keep_cold
+            )
+            await commit(db)
+        
+        self.total_orders += row.order_count
+        self.total_items += row.item_count
+        ARCHIVED_ROWS.inc(("orders",), row.order_count)
+        ARCHIVED_ROWS.inc(("order_items",), row.item_count)
+        return row.order_count, row.item_count
+    
+    def get_stats(self) -> dict:
+        return {
+            "enabled": self.interval > 0,
+            "mode": "move" if self.keep_cold else "delete",
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "total_orders": self.total_orders,
+            "total_items": self.total_items,
+            "current_run": self.current.to_dict() if self.current else None,
+            "last_run": self.last_run.to_dict() if self.last_run else None,
+        }
+
+
+_order_archiver: Optional[OrderArchiver] = None
+
+
+def get_order_archiver() -> OrderArchiver:
+    global _order_archiver
+    if _order_archiver is None:
+        _order_archiver = OrderArchiver(
+            settings.order_archive_interval,
+            settings.order_archive_grace_period,
+            settings.order_archive_batch_size,
+            settings.order_archive_batch_delay,
+            settings.order_archive_max_batches,
+            settings.order_archive_keep_cold,
+        )
+    return _order_archiver
+
@@ -1,9 +1,11 @@
-from typing import List
+from typing import Dict, List, Optional
 from uuid import UUID
+from app.core.unit_of_work import after_commit
 from app.core.exceptions import NotFoundException, ValidationError, ConflictError, ForbiddenError
 from app.repositories import OrderRepository, SessionRepository, MenuRepository, TableRepository
 from app.models import Order, OrderItem
 from app.services.sse_service import get_sse_service
+from app.services.session_registry import ActiveSession, get_session_registry
 
 
 class OrderService:
@@ -19,6 +21,7 @@ class OrderService:
         self.menu_repo = menu_repo
         self.table_repo = table_repo
         self.sse_service = get_sse_service()
+        self.session_registry = get_session_registry()
     
     async def create_order(
         self,
@@ -27,12 +30,8 @@ class OrderService:
         store_id: int,
         items: List[dict]
     ) -> Order:
-        # 1. 세션 유효성 검증
-        session = await self.session_repo.get_by_id(session_id)
-        if not session:
-            raise NotFoundException("Session not found")
-        if not session.is_active:
-            raise ConflictError("Session has ended")
+        # 1. 세션 유효성 검증 (레지스트리 우선)
+        session = await self._get_active_session(session_id)
         
         # 2. 메뉴 검증 및 가격 조회
         order_items = []
@@ -72,15 +71,16 @@ class OrderService:
         
         order = await self.order_repo.create(order)
         
-        # 4. SSE 브로드캐스트
-        table = await self.table_repo.get_by_id(table_id)
-        await self.sse_service.broadcast_order_update(
+        # 4. SSE 브로드캐스트 (커밋 이후)
+        after_commit(
+            self.order_repo.db,
+            self.sse_service.broadcast_order_update,
             store_id,
             "order_created",
             {
                 "order_id": order.order_id,
                 "table_id": table_id,
-                "table_number": table.table_number,
+                "table_number": session.table_number,
                 "total_amount": total_amount,
                 "status": "대기중",
                 "order_time": order.order_time.isoformat(),
@@ -99,20 +99,83 @@ class OrderService:
         
         return order
     
-    async def get_orders_by_session(self, session_id: UUID) -> dict:
+    async def get_orders_by_session(
+        self, session_id: UUID, active_only: bool = False
+    ) -> dict:
+        if active_only:
+            table_number = (await self._get_active_session(session_id)).table_number
+        else:
+            session = self.session_registry.get(session_id)
+            if session is None:
+                row = await self.session_repo.get_with_table(session_id)
+                if not row:
+                    raise NotFoundException("Session not found")
+                self._remember(row)
+                table_number = row.table_number
+            else:
+                table_number = session.table_number
+        
         orders = await self.order_repo.get_by_session(session_id)
-        session = await self.session_repo.get_by_id(session_id)
-        table = await self.table_repo.get_by_id(session.table_id)
         
         total = sum(o.total_amount for o in orders)
         
         return {
             "session_id": session_id,
-            "table_number": table.table_number,
+            "table_number": table_number,
             "total_session_amount": total,
             "orders": orders,
         }
     
+    async def get_store_board(
+        self,
+        store_id: int,
+        status: Optional[str] = None,
+        table_id: Optional[int] = None
+    ) -> dict:
+        """매장 전체 테이블별 주문 현황 (단일 쿼리)"""
+        rows = await self.order_repo.get_board_rows(store_id, status, table_id)
+        
+        tables: Dict[int, dict] = {}
+        orders: Dict[int, dict] = {}
+        for row in rows:
+            table = tables.get(row.table_id)
+            if table is None:
+                table = tables[row.table_id] = {
+                    "table_id": row.table_id,
+                    "table_number": row.table_number,
+                    "session_id": row.current_session_id,
+                    "total_amount": 0,
+                    "order_count": 0,
+                    "orders": [],
+                }
+            if row.order_id is None:
+                continue
+            
+            order = orders.get(row.order_id)
+            if order is None:
+                order = orders[row.order_id] = {
+                    "order_id": row.order_id,
+                    "total_amount": row.total_amount,
+                    "status": row.status,
+                    "order_time": row.order_time,
+                    "items": [],
+                }
+                table["orders"].append(order)
+                table["total_amount"] += row.total_amount
+                table["order_count"] += 1
+            
+            if row.order_item_id is not None:
+                order["items"].append({
+                    "order_item_id": row.order_item_id,
+                    "menu_id": row.menu_id,
+                    "menu_name": row.menu_name or "Unknown",
+                    "quantity": row.quantity,
+                    "unit_price": row.unit_price,
+                    "subtotal": row.quantity * row.unit_price,
+                })
+        
+        return {"store_id": store_id, "tables": list(tables.values())}
+    
     async def update_order_status(
         self, order_id: int, new_status: str, store_id: int
     ) -> Order:
@@ -128,8 +191,10 @@ class OrderService:
         order.status = new_status
         order = await self.order_repo.update(order)
         
-        # SSE 브로드캐스트
-        await self.sse_service.broadcast_order_update(
+        # SSE 브로드캐스트 (커밋 이후)
+        after_commit(
+            self.order_repo.db,
+            self.sse_service.broadcast_order_update,
             store_id,
             "order_updated",
             {
@@ -151,11 +216,37 @@ class OrderService:
         table_id = order.table_id
         await self.order_repo.delete(order_id)
         
-        # SSE 브로드캐스트
-        await self.sse_service.broadcast_order_update(
+        # SSE 브로드캐스트 (커밋 이후)
+        after_commit(
+            self.order_repo.db,
+            self.sse_service.broadcast_order_update,
             store_id,
             "order_deleted",
             {"order_id": order_id, "table_id": table_id}
         )
         
         return {"order_id": order_id, "table_id": table_id}
+    
+    async def _get_active_session(self, session_id: UUID) -> ActiveSession:
+        """활성 세션 확인 (레지스트리 미스 시에만 DB 조회)"""
+        if self.session_registry.is_ended(session_id):
+            raise ConflictError("Session has ended")
+        
+        session = self.session_registry.get(session_id)
+        if session is None:
+            row = await self.session_repo.get_with_table(session_id)
+            if not row:
+                raise NotFoundException("Session not found")
+            session = self._remember(row)
+            if session is None:
+                raise ConflictError("Session has ended")
+        return session
+    
+    def _remember(self, row) -> Optional[ActiveSession]:
+        """조회한 세션 상태를 레지스트리에 반영"""
+        if not row.is_active:
+            self.session_registry.mark_ended(row.session_id)
+            return None
+        return self.session_registry.mark_active(
+            row.session_id, row.table_id, row.table_number
+        )
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+from uuid import UUID
+from app.core.config import get_settings
+from app.core.database import engine
+from app.core.security import get_token_cache
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+SessionKey = Union[str, UUID]
+
+
+class ActiveSession:
+    """활성 세션 캐시 항목"""
+    
+    __slots__ = ("session_id", "table_id", "table_number", "cached_at")
+    
+    def __init__(self, session_id: str, table_id: int, table_number: int):
+        self.session_id = session_id
+        self.table_id = table_id
+        self.table_number = table_number
+        self.cached_at = time.monotonic()
+
+
+class SessionRegistry:
+    """인메모리 활성 세션 레지스트리
+    
+    로그인/첫 조회 시 채워지고 세션 종료 시 무효화된다. 다른 워커의 종료는
+    Postgres NOTIFY로 전달되며, 알림 유실에 대비해 활성 항목은 TTL 이후 재조회한다.
+    """
+    
+    def __init__(self, ttl: float, max_ended: int = 10000):
+        self.ttl = ttl
+        self.max_ended = max_ended
+        self._active: Dict[str, ActiveSession] = {}
+        # 종료된 세션 (다시 활성화되지 않으므로 TTL 없이 크기만 제한)
+        self._ended: "OrderedDict[str, None]" = OrderedDict()
+        self._listener_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, session_id: SessionKey) -> Optional[ActiveSession]:
+        """캐시된 활성 세션 조회 (없거나 TTL 경과 시 None)"""
+        key = str(session_id)
+        active = self._active.get(key)
+        if active is None or time.monotonic() - active.cached_at > self.ttl:
+            if active is not None:
+                del self._active[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return active
+    
+    def is_ended(self, session_id: SessionKey) -> bool:
+        """종료된 세션으로 알려져 있는지 여부"""
+        return str(session_id) in self._ended
+    
+    def mark_active(
+        self, session_id: SessionKey, table_id: int, table_number: int
+    ) -> Optional[ActiveSession]:
+        """활성 세션 등록 (이미 종료된 세션은 복제 지연된 조회라도 되살리지 않음)"""
+        key = str(session_id)
+        if key in self._ended:
+            return None
+        active = self._active[key] = ActiveSession(key, table_id, table_number)
+        return active
+    
+    def mark_ended(self, session_id: SessionKey) -> None:
+        """세션 종료 반영 (로컬)"""
+        key = str(session_id)
+        self._active.pop(key, None)
+        self._ended[key] = None
+        self._ended.move_to_end(key)
+        while len(self._ended) > self.max_ended:
+            self._ended.popitem(last=False)
+    
+    def get_stats(self) -> dict:
+        return {
+            "active": len(self._active),
+            "ended": len(self._ended),
+            "hits": self.hits,
+            "misses": self.misses,
+            "listening": self._listener_task is not None and not self._listener_task.done(),
+        }
+    
+    async def start_listener(self) -> None:
+        """다른 워커의 세션 종료 알림 구독 시작"""
+        if self._listener_task is None and engine.url.get_backend_name() == "postgresql":
+            self._listener_task = asyncio.create_task(self._listen())
+    
+    async def stop_listener(self) -> None:
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+    
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        self.mark_ended(payload)
+        get_token_cache().invalidate_session(payload)
+    
+    async def _listen(self) -> None:
+        import asyncpg
+        
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        channel = settings.session_invalidation_channel
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(channel, self._on_notify)
+                # 연결이 없던 동안 놓친 알림이 있을 수 있으므로 활성 캐시를 비움
+                self._active.clear()
+                await closed.wait()
+                logger.warning("Session invalidation listener disconnected")
+            except asyncio.CancelledError:
+                if connection is not None:
+                    await connection.close()
+                raise
+            except Exception as e:
+                logger.warning(f"Session invalidation listener error: {e}")
+            
+            self._active.clear()
+            await asyncio.sleep(5)
+
+
+_session_registry: Optional[SessionRegistry] = None
+
+
+def get_session_registry() -> SessionRegistry:
+    global _session_registry
+    if _session_registry is None:
+        _session_registry = SessionRegistry(settings.session_cache_ttl)
+    return _session_registry
@@ -1,30 +1,117 @@
 import asyncio
-from typing import Dict, List, Tuple, Optional
+import json
+import time
+from datetime import datetime, timezone
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Collection, Deque, Dict, List, Tuple, Optional
 from uuid import uuid4
+from app.core.config import get_settings
+
+settings = get_settings()
+
+SnapshotLoader = Callable[[], Awaitable[Any]]
+
+
+class SSEConnection:
+    """SSE 연결 레코드"""
+    
+    __slots__ = (
+        "connection_id", "store_id", "table_id", "queue",
+        "connected_at", "events_queued", "events_sent", "last_ack_id",
+    )
+    
+    def __init__(self, connection_id: str, store_id: int, table_id: Optional[int]):
+        self.connection_id = connection_id
+        self.store_id = store_id
+        self.table_id = table_id
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.connected_at = datetime.now(timezone.utc)
+        self.events_queued = 0
+        self.events_sent = 0
+        self.last_ack_id: Optional[int] = None
+    
+    def to_dict(self) -> dict:
+        return {
+            "connection_id": self.connection_id,
+            "store_id": self.store_id,
+            "table_id": self.table_id,
+            "connected_since": self.connected_at,
+            "events_queued": self.events_queued,
+            "events_sent": self.events_sent,
+            "queue_depth": self.queue.qsize(),
+            "last_ack_id": self.last_ack_id,
+        }
 
 
 class SSEService:
     """SSE 연결 관리 및 브로드캐스트 서비스"""
     
-    def __init__(self):
-        # connection_id -> {"store_id": int, "queue": asyncio.Queue}
-        self._connections: Dict[str, dict] = {}
-        # store_id -> [connection_id, ...]
-        self._store_connections: Dict[int, List[str]] = {}
+    def __init__(
+        self,
+        snapshot_ttl: float = settings.sse_snapshot_ttl,
+        replay_buffer_size: int = settings.sse_replay_buffer_size,
+        coalesce_window_ms: int = settings.sse_coalesce_window_ms,
+    ):
+        # connection_id -> SSEConnection
+        self._connections: Dict[str, SSEConnection] = {}
+        # store_id -> {connection_id: SSEConnection} (매장 전체 스트림)
+        self._store_connections: Dict[int, Dict[str, SSEConnection]] = {}
+        # table_id -> {connection_id: SSEConnection} (테이블 전용 스트림)
+        self._table_connections: Dict[int, Dict[str, SSEConnection]] = {}
+        
+        self._snapshot_ttl = snapshot_ttl
+        self._replay_buffer_size = replay_buffer_size
+        # store_id -> 마지막으로 발행한 이벤트 시퀀스
+        self._store_seq: Dict[int, int] = {}
+        # store_id -> 최근 이벤트 (스냅샷 이후 이벤트 재생용)
+        self._recent_events: Dict[int, Deque[dict]] = {}
+        # (store_id, table_id) -> (seq, data, built_at, scope)
+        self._snapshots: Dict[Tuple[int, Optional[int]], Tuple[int, Any, float, Any]] = {}
+        self._snapshot_locks: Dict[Tuple[int, Optional[int]], asyncio.Lock] = {}
+        
+        # 이벤트 병합 모드: 매장별로 window 동안 모은 이벤트를 한 프레임으로 전달
+        self._coalesce_window = coalesce_window_ms / 1000
+        self._pending_events: Dict[int, List[dict]] = {}
+    
+    async def register_connection(
+        self, store_id: int, table_id: Optional[int] = None
+    ) -> Tuple[str, asyncio.Queue]:
+        """새 SSE 연결 등록 (table_id 지정 시 해당 테이블 이벤트만 수신)"""
+        return self._add_connection(store_id, table_id)
     
-    async def register_connection(self, store_id: int) -> Tuple[str, asyncio.Queue]:
-        """새 SSE 연결 등록"""
-        connection_id = str(uuid4())
-        queue: asyncio.Queue = asyncio.Queue()
+    async def open_stream(
+        self,
+        store_id: int,
+        loader: SnapshotLoader,
+        table_id: Optional[int] = None,
+        scope: Any = None,
+    ) -> Tuple[str, asyncio.Queue]:
+        """초기 스냅샷과 함께 SSE 연결 등록
         
-        self._connections[connection_id] = {
-            "store_id": store_id,
-            "queue": queue,
-        }
+        큐의 첫 이벤트는 `initial` 스냅샷이며, 스냅샷 생성 이후 발행된 이벤트가
+        뒤이어 재생되므로 스냅샷과 실시간 이벤트 사이에 누락이 없다.
+        scope는 스냅샷 내용이 달라지는 기준 (테이블 스트림은 세션 ID)으로,
+        캐시된 스냅샷의 scope가 다르면 새로 조회한다.
+        """
+        seq, data = await self._get_snapshot(store_id, table_id, loader, scope)
         
-        if store_id not in self._store_connections:
-            self._store_connections[store_id] = []
-        self._store_connections[store_id].append(connection_id)
+        # 스냅샷 반환 이후 await 없이 등록/재생하여 사이에 이벤트가 끼어들지 않게 함
+        connection_id, queue = self._add_connection(store_id, table_id)
+        connection = self._connections[connection_id]
+        events = [{"id": seq, "event": "initial", "data": data}]
+        for event in self._recent_events.get(store_id, ()):
+            if event["id"] <= seq:
+                continue
+            if table_id is None:
+                events.append(event)
+            else:
+                events.extend(
+                    view for view_table_id, view in _table_events(event)
+                    if view_table_id == table_id
+                )
+        for event in events:
+            queue.put_nowait(event)
+        connection.events_queued += len(events)
         
         return connection_id, queue
     
@@ -33,14 +120,14 @@ class SSEService:
         if connection_id not in self._connections:
             return False
         
-        store_id = self._connections[connection_id]["store_id"]
-        del self._connections[connection_id]
+        connection = self._connections.pop(connection_id)
+        index, key = self._index_for(connection.store_id, connection.table_id)
         
-        if store_id in self._store_connections:
-            if connection_id in self._store_connections[store_id]:
-                self._store_connections[store_id].remove(connection_id)
-            if not self._store_connections[store_id]:
-                del self._store_connections[store_id]
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(connection_id, None)
+            if not bucket:
+                del index[key]
         
         return True
     
@@ -50,47 +137,54 @@ class SSEService:
         event_type: str, 
         data: dict
     ) -> bool:
-        """매장의 모든 연결에 이벤트 브로드캐스트"""
-        if store_id not in self._store_connections:
-            return False
+        """매장의 모든 연결 및 해당 테이블 연결에 이벤트 브로드캐스트
         
+        이벤트 id(매장 시퀀스)는 병합 후 전달 시점에 붙이므로 병합으로 버려진
+        이벤트 때문에 시퀀스에 빈 번호가 생기지 않는다.
+        """
         event = {
+            "id": None,
             "event": event_type,
             "data": data,
         }
         
-        failed_connections = []
-        
-        for connection_id in self._store_connections[store_id]:
-            try:
-                queue = self._connections[connection_id]["queue"]
-                await queue.put(event)
-            except Exception:
-                failed_connections.append(connection_id)
+        has_targets = store_id in self._store_connections or any(
+            table_id in self._table_connections
+            for table_id, _ in _table_events(event)
+        )
         
-        # 실패한 연결 정리
-        for conn_id in failed_connections:
-            self.unregister_connection(conn_id)
+        if self._coalesce_window > 0:
+            pending = self._pending_events.get(store_id)
+            if pending is None:
+                pending = self._pending_events[store_id] = []
+                asyncio.get_running_loop().call_later(
+                    self._coalesce_window, self._flush_pending, store_id
+                )
+            pending.append(event)
+        else:
+            self._deliver(store_id, [event])
         
-        return True
+        return has_targets
     
     async def send_initial_data(
-        self, 
-        connection_id: str, 
+        self,
+        connection_id: str,
         data: dict
     ) -> bool:
         """초기 데이터 전송"""
         if connection_id not in self._connections:
             return False
         
+        connection = self._connections[connection_id]
         event = {
+            "id": self._store_seq.get(connection.store_id, 0),
             "event": "initial",
             "data": data,
         }
         
         try:
-            queue = self._connections[connection_id]["queue"]
-            await queue.put(event)
+            await connection.queue.put(event)
+            connection.events_queued += 1
             return True
         except Exception:
             return False
@@ -101,9 +195,215 @@ class SSEService:
             return 0
         return len(self._store_connections[store_id])
     
+    def get_table_connection_count(self, table_id: int) -> int:
+        """테이블 전용 활성 연결 수 조회"""
+        if table_id not in self._table_connections:
+            return 0
+        return len(self._table_connections[table_id])
+    
     def get_total_connections(self) -> int:
         """전체 활성 연결 수 조회"""
         return len(self._connections)
+    
+    def get_connection_counts_by_store(self) -> Dict[int, int]:
+        """매장별 활성 연결 수 (테이블 전용 스트림 포함)"""
+        counts: Dict[int, int] = {}
+        for connection in self._connections.values():
+            counts[connection.store_id] = counts.get(connection.store_id, 0) + 1
+        return counts
+    
+    def get_queued_event_count(self) -> int:
+        """전체 연결 큐에 쌓인 미전송 프레임 수"""
+        return sum(connection.queue.qsize() for connection in self._connections.values())
+    
+    def get_connection(self, connection_id: str) -> Optional[SSEConnection]:
+        """연결 레코드 조회"""
+        return self._connections.get(connection_id)
+    
+    def get_connection_stats(self, store_id: Optional[int] = None) -> List[dict]:
+        """연결별 통계 (연결 시각, 전달/전송 이벤트 수, 큐 적체) 조회"""
+        return [
+            connection.to_dict()
+            for connection in self._connections.values()
+            if store_id is None or connection.store_id == store_id
+        ]
+    
+    def _flush_pending(self, store_id: int) -> None:
+        """병합 window 종료: 같은 주문의 반복 업데이트는 마지막 상태만 남겨 전달"""
+        events = self._pending_events.pop(store_id, [])
+        if events:
+            self._deliver(store_id, _coalesce(events))
+    
+    def _deliver(self, store_id: int, events: List[dict]) -> None:
+        """이벤트 묶음에 시퀀스를 붙여 재생 버퍼에 기록하고 대상 연결 큐에 한 번에 전달"""
+        seq = self._store_seq.get(store_id, 0)
+        for event in events:
+            seq += 1
+            event["id"] = seq
+        self._store_seq[store_id] = seq
+        
+        recent = self._recent_events.get(store_id)
+        if recent is None:
+            recent = self._recent_events[store_id] = deque(maxlen=self._replay_buffer_size)
+        recent.extend(events)
+        
+        batches: Dict[str, List[dict]] = {
+            connection_id: list(events)
+            for connection_id in self._store_connections.get(store_id, ())
+        }
+        for event in events:
+            for table_id, view in _table_events(event):
+                for connection_id in self._table_connections.get(table_id, ()):
+                    batches.setdefault(connection_id, []).append(view)
+        
+        failed_connections = []
+        
+        for connection_id, batch in batches.items():
+            try:
+                connection = self._connections[connection_id]
+                connection.queue.put_nowait(batch[0] if len(batch) == 1 else batch)
+                connection.events_queued += len(batch)
+            except Exception:
+                failed_connections.append(connection_id)
+        
+        # 실패한 연결 정리
+        for conn_id in failed_connections:
+            self.unregister_connection(conn_id)
+    
+    def _add_connection(
+        self, store_id: int, table_id: Optional[int] = None
+    ) -> Tuple[str, asyncio.Queue]:
+        connection = SSEConnection(str(uuid4()), store_id, table_id)
+        self._connections[connection.connection_id] = connection
+        
+        index, key = self._index_for(store_id, table_id)
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = {}
+        bucket[connection.connection_id] = connection
+        
+        return connection.connection_id, connection.queue
+    
+    def _index_for(
+        self, store_id: int, table_id: Optional[int]
+    ) -> Tuple[Dict[int, Dict[str, SSEConnection]], int]:
+        if table_id is None:
+            return self._store_connections, store_id
+        return self._table_connections, table_id
+    
+    async def _get_snapshot(
+        self, store_id: int, table_id: Optional[int], loader: SnapshotLoader, scope: Any = None
+    ) -> Tuple[int, Any]:
+        """TTL 내 같은 매장(또는 테이블)과 scope의 연결끼리 공유되는 스냅샷 조회"""
+        key = (store_id, table_id)
+        lock = self._snapshot_locks.get(key)
+        if lock is None:
+            lock = self._snapshot_locks[key] = asyncio.Lock()
+        
+        async with lock:
+            cached = self._snapshots.get(key)
+            if cached is not None:
+                seq, data, built_at, cached_scope = cached
+                if (
+                    cached_scope == scope
+                    and time.monotonic() - built_at < self._snapshot_ttl
+                    and self._can_replay_since(store_id, seq)
+                ):
+                    return seq, data
+            
+            # 조회 전에 시퀀스를 고정: 조회 중 발행된 이벤트는 재생으로 전달됨
+            seq = self._store_seq.get(store_id, 0)
+            data = await loader()
+            self._snapshots[key] = (seq, data, time.monotonic(), scope)
+            return seq, data
+    
+    def _can_replay_since(self, store_id: int, seq: int) -> bool:
+        """seq 이후 이벤트가 모두 재생 버퍼에 남아있는지 확인"""
+        if self._store_seq.get(store_id, 0) == seq:
+            return True
+        recent = self._recent_events.get(store_id)
+        return bool(recent) and recent[0]["id"] <= seq + 1
+
+
+def _coalesce(events: List[dict]) -> List[dict]:
+    """같은 주문의 order_updated 이벤트는 마지막 것만 남기고 나머지 순서는 유지"""
+    last_update: Dict[Any, int] = {}
+    for index, event in enumerate(events):
+        if event["event"] == "order_updated":
+            last_update[event["data"].get("order_id")] = index
+    
+    return [
+        event
+        for index, event in enumerate(events)
+        if event["event"] != "order_updated"
+        or last_update[event["data"].get("order_id")] == index
+    ]
+
+
+def _table_events(event: dict) -> List[Tuple[int, dict]]:
+    """테이블 스트림으로 보낼 (table_id, 이벤트) 목록
+    
+    일괄 종료 이벤트(sessions_ended)는 테이블별 session_ended로 나누어
+    다른 테이블의 세션 정보가 고객에게 노출되지 않게 한다.
+    """
+    data = event["data"]
+    if not isinstance(data, dict):
+        return []
+    if event["event"] == "sessions_ended":
+        return [
+            (
+                session["table_id"],
+                {"id": event["id"], "event": "session_ended", "data": session},
+            )
+            for session in data.get("sessions", ())
+        ]
+    table_id = data.get("table_id")
+    return [] if table_id is None else [(table_id, event)]
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_event(event: dict) -> str:
+    data = json.dumps(event["data"], ensure_ascii=False, default=_json_default)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
+async def event_generator(
+    connection_id: str,
+    queue: asyncio.Queue,
+    close_on: Collection[str] = (),
+) -> AsyncIterator[str]:
+    """큐의 이벤트를 SSE 형식으로 변환 (close_on 이벤트 전송 후 스트림 종료)"""
+    sse_service = get_sse_service()
+    connection = sse_service.get_connection(connection_id)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=30.0)
+                events = list(item) if isinstance(item, list) else [item]
+                # 이미 쌓인 이벤트는 한 청크로 묶어 전송
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    events.extend(item if isinstance(item, list) else [item])
+                
+                closing = [e for e in events if e["event"] in close_on]
+                if closing:
+                    events = events[:events.index(closing[0]) + 1]
+                yield "".join(_format_event(event) for event in events)
+                if connection is not None:
+                    connection.events_sent += len(events)
+                if closing:
+                    break
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+    except asyncio.CancelledError:
+        pass
+    finally:
+        sse_service.unregister_connection(connection_id)
 
 
 # 싱글톤 인스턴스
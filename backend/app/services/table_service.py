@@ -1,9 +1,13 @@
 from datetime import datetime
-from app.core.security import hash_password
+from typing import List, Optional
+from uuid import UUID
+from app.core.security import hash_password_async, get_token_cache
+from app.core.unit_of_work import after_commit
 from app.core.exceptions import NotFoundException, ConflictError, ForbiddenError
 from app.repositories import TableRepository, SessionRepository, OrderRepository, HistoryRepository
-from app.models import Table, TableSession, OrderHistory
+from app.models import Table
 from app.services.sse_service import get_sse_service
+from app.services.session_registry import get_session_registry
 
 
 class TableService:
@@ -31,7 +35,7 @@ class TableService:
         table = Table(
             store_id=store_id,
             table_number=table_number,
-            table_password_hash=hash_password(table_password),
+            table_password_hash=await hash_password_async(table_password),
         )
         return await self.table_repo.create(table)
     
@@ -49,44 +53,20 @@ class TableService:
         if not session or not session.is_active:
             raise ConflictError("Session already ended")
         
-        # 2. 주문 데이터 아카이브
-        orders = await self.order_repo.get_by_session(session.session_id)
+        # 2. 주문 데이터 아카이브 (DB 내 JSONB 집계, 세션 종료와 같은 트랜잭션)
+        archived = await self.history_repo.archive_session(session.session_id)
         
-        order_data = {"orders": [], "session_total": 0}
-        for order in orders:
-            order_dict = {
-                "order_id": order.order_id,
-                "order_time": order.order_time.isoformat(),
-                "total_amount": order.total_amount,
-                "status": order.status,
-                "items": [
-                    {
-                        "menu_id": item.menu_id,
-                        "quantity": item.quantity,
-                        "unit_price": item.unit_price,
-                    }
-                    for item in order.items
-                ]
-            }
-            order_data["orders"].append(order_dict)
-            order_data["session_total"] += order.total_amount
-        
-        # 3. OrderHistory 저장
-        history = OrderHistory(
-            session_id=session.session_id,
-            table_id=table_id,
-            store_id=store_id,
-            archived_order_data=order_data,
-        )
-        await self.history_repo.create(history)
-        
-        # 4. 세션 종료 (트리거가 table.current_session_id 자동 초기화)
+        # 3. 세션 종료 (트리거가 table.current_session_id 자동 초기화)
         session.is_active = False
         session.end_time = datetime.utcnow()
+        await self.session_repo.notify_ended([session.session_id])
         await self.session_repo.update(session)
+        after_commit(self.session_repo.db, _forget_sessions, [session.session_id])
         
-        # 5. SSE 브로드캐스트
-        await self.sse_service.broadcast_order_update(
+        # 4. SSE 브로드캐스트 (커밋 이후)
+        after_commit(
+            self.session_repo.db,
+            self.sse_service.broadcast_order_update,
             store_id,
             "session_ended",
             {
@@ -101,6 +81,72 @@ class TableService:
             "table_id": table_id,
             "table_number": table.table_number,
             "session_id": session.session_id,
-            "total_session_amount": order_data["session_total"],
-            "order_count": len(orders),
+            "total_session_amount": archived.session_total,
+            "order_count": archived.order_count,
+        }
+    
+    async def end_sessions(
+        self, store_id: int, table_ids: Optional[List[int]] = None
+    ) -> dict:
+        """매장 활성 세션 일괄 종료 (영업 종료용, 단일 트랜잭션)"""
+        # 1. 대상 세션 조회 및 잠금
+        targets = await self.session_repo.get_active_by_store(store_id, table_ids)
+        session_ids = [t.session_id for t in targets]
+        
+        # 2. 주문 데이터 일괄 아카이브
+        archived = {
+            row.session_id: row
+            for row in await self.history_repo.archive_sessions(session_ids)
+        }
+        
+        # 3. 세션 일괄 종료
+        if session_ids:
+            await self.session_repo.notify_ended(session_ids)
+            await self.session_repo.end_sessions(session_ids)
+            after_commit(self.session_repo.db, _forget_sessions, session_ids)
+        
+        sessions = [
+            {
+                "table_id": t.table_id,
+                "table_number": t.table_number,
+                "session_id": t.session_id,
+                "total_session_amount": archived[t.session_id].session_total,
+                "order_count": archived[t.session_id].order_count,
+            }
+            for t in targets
+        ]
+        
+        # 4. SSE 브로드캐스트 (단일 이벤트, 커밋 이후)
+        if sessions:
+            after_commit(
+                self.session_repo.db,
+                self.sse_service.broadcast_order_update,
+                store_id,
+                "sessions_ended",
+                {
+                    "sessions": [
+                        {
+                            "table_id": s["table_id"],
+                            "table_number": s["table_number"],
+                            "session_id": str(s["session_id"]),
+                        }
+                        for s in sessions
+                    ]
+                }
+            )
+        
+        return {
+            "message": "Sessions ended successfully",
+            "closed_count": len(sessions),
+            "total_amount": sum(s["total_session_amount"] for s in sessions),
+            "sessions": sessions,
         }
+
+
+def _forget_sessions(session_ids: List[UUID]) -> None:
+    """종료된 세션을 레지스트리/토큰 캐시에서 제거"""
+    registry = get_session_registry()
+    token_cache = get_token_cache()
+    for session_id in session_ids:
+        registry.mark_ended(session_id)
+        token_cache.invalidate_session(str(session_id))
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""종료 세션 주문 아카이브 1회 실행 스크립트 (cron/작업 스케줄러용)
+
+다른 워커나 작업이 실행 중이면 건너뛰고 종료 코드 1을 반환한다.
+"""
+import asyncio
+import json
+import logging
+import sys
+from app.core.config import settings
+from app.core.database import engine
+from app.services.order_archiver import get_order_archiver
+
+
+async def main() -> int:
+    try:
+        run = await get_order_archiver().run_once()
+    finally:
+        await engine.dispose()
+    
+    if run is None:
+        logging.warning("Order archive run skipped: another run holds the lock")
+        return 1
+    print(json.dumps(run.to_dict()))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.log_level.upper())
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,115 @@
+"""요청 로깅 미들웨어 처리량 벤치마크 (BaseHTTPMiddleware vs 순수 ASGI)
+
+    python -m benchmarks.request_logging [requests]
+
+네트워크 없이 ASGI 앱을 직접 호출하여 미들웨어 자체의 오버헤드만 비교한다.
+"""
+import asyncio
+import logging
+import sys
+import time
+import uuid
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.logging import RequestLoggingMiddleware
+
+CONCURRENCY = 50
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """변경 전 구현 (BaseHTTPMiddleware, INFO 로그 2회)"""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        request_id = str(uuid.uuid4())[:8]
+        request.state.request_id = request_id
+        start_time = time.time()
+        logger = logging.getLogger("app.middleware.logging")
+        logger.info(
+            f"Request started: {request.method} {request.url.path}",
+            extra={"request_id": request_id, "method": request.method, "path": request.url.path},
+        )
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(
+            f"Request completed: {response.status_code} in {round(process_time * 1000, 2)}ms",
+            extra={"request_id": request_id, "status_code": response.status_code},
+        )
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
+        return response
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/menus")
+    async def menus():
+        return {"store_id": 1, "categories": [{"category_id": i, "menus": []} for i in range(10)]}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def call(app: FastAPI) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/menus",
+        "raw_path": b"/menus",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            await call(app)
+
+    await asyncio.gather(*(one() for _ in range(200)))  # warm-up
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def run(requests: int) -> None:
+    # 로그는 INFO까지 생성하되 출력 비용은 제외
+    logging.getLogger().handlers[:] = [logging.NullHandler()]
+    logging.getLogger().setLevel(logging.INFO)
+
+    print(f"requests: {requests} (concurrency {CONCURRENCY})")
+    for name, middleware in (
+        ("no middleware", None),
+        ("BaseHTTPMiddleware", LegacyRequestLoggingMiddleware),
+        ("pure ASGI", RequestLoggingMiddleware),
+    ):
+        rate = await measure(build_app(middleware), requests)
+        print(f"{name:20} {rate:10,.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
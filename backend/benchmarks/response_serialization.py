@@ -0,0 +1,139 @@
+"""관리자 주문 보드 응답 직렬화 벤치마크 (response_model 검증 vs FastJSONResponse)
+
+    python -m benchmarks.response_serialization [iterations]
+
+50개 테이블 x 테이블당 20개 주문(주문당 3개 항목) 보드를 ASGI로 직접 호출하여
+비교한다. 두 경로의 응답 본문이 같은지도 확인한다.
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import FastAPI
+
+from app.core import responses
+from app.core.responses import FastJSONResponse
+from app.schemas import AdminOrdersResponse
+
+TABLES = 50
+ORDERS_PER_TABLE = 20
+ITEMS_PER_ORDER = 3
+
+
+def build_board() -> dict:
+    started = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    tables = []
+    order_id = item_id = 0
+    for table_no in range(1, TABLES + 1):
+        orders = []
+        for _ in range(ORDERS_PER_TABLE):
+            order_id += 1
+            items = []
+            for k in range(ITEMS_PER_ORDER):
+                item_id += 1
+                items.append({
+                    "order_item_id": item_id,
+                    "menu_id": k + 1,
+                    "menu_name": f"메뉴 {k + 1}",
+                    "quantity": 2,
+                    "unit_price": 9000,
+                    "subtotal": 18000,
+                })
+            orders.append({
+                "order_id": order_id,
+                "total_amount": 18000 * ITEMS_PER_ORDER,
+                "status": "대기중",
+                "order_time": started + timedelta(seconds=order_id),
+                "items": items,
+            })
+        tables.append({
+            "table_id": table_no,
+            "table_number": table_no,
+            "session_id": uuid4(),
+            "total_amount": sum(o["total_amount"] for o in orders),
+            "order_count": len(orders),
+            "orders": orders,
+        })
+    return {"store_id": 1, "tables": tables}
+
+
+def build_app(board: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/validated", response_model=AdminOrdersResponse)
+    async def validated():
+        return board
+
+    @app.get("/fast", response_model=AdminOrdersResponse)
+    async def fast():
+        return FastJSONResponse(board)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def measure(app: FastAPI, path: str, iterations: int) -> float:
+    for _ in range(5):  # warm-up
+        await call(app, path)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await call(app, path)
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+async def run(iterations: int) -> None:
+    board = build_board()
+    app = build_app(board)
+
+    validated_body = await call(app, "/validated")
+    fast_body = await call(app, "/fast")
+    assert json.loads(validated_body) == json.loads(fast_body), "response bodies differ"
+
+    print(
+        f"board: {TABLES} tables x {ORDERS_PER_TABLE} orders x {ITEMS_PER_ORDER} items, "
+        f"{len(fast_body):,} bytes, {iterations} iterations"
+    )
+    print(f"{'response_model':28} {await measure(app, '/validated', iterations):8.2f} ms/request")
+    print(f"{'FastJSONResponse':28} {await measure(app, '/fast', iterations):8.2f} ms/request")
+
+    # orjson 미설치 환경의 표준 json 경로
+    if responses.orjson is not None:
+        orjson, responses.orjson = responses.orjson, None
+        try:
+            print(f"{'FastJSONResponse (json)':28} {await measure(app, '/fast', iterations):8.2f} ms/request")
+        finally:
+            responses.orjson = orjson
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
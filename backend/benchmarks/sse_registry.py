@@ -0,0 +1,39 @@
+"""SSE 연결 등록/해제 벤치마크
+
+    python -m benchmarks.sse_registry [connections]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from app.services.sse_service import SSEService
+
+STORES = 20
+
+
+async def run(connections: int) -> None:
+    service = SSEService()
+    store_ids = [i % STORES for i in range(connections)]
+
+    started = time.perf_counter()
+    connection_ids = [
+        (await service.register_connection(store_id))[0] for store_id in store_ids
+    ]
+    register_elapsed = time.perf_counter() - started
+
+    # 재연결 폭주처럼 임의 순서로 해제
+    random.shuffle(connection_ids)
+    started = time.perf_counter()
+    for connection_id in connection_ids:
+        service.unregister_connection(connection_id)
+    unregister_elapsed = time.perf_counter() - started
+
+    assert service.get_total_connections() == 0
+    print(f"connections: {connections} ({STORES} stores)")
+    print(f"register:    {register_elapsed * 1000:8.2f} ms ({connections / register_elapsed:,.0f}/s)")
+    print(f"unregister:  {unregister_elapsed * 1000:8.2f} ms ({connections / unregister_elapsed:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
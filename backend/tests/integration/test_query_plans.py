@@ -0,0 +1,291 @@
+"""저장소 쿼리 실행 계획 회귀 테스트 (EXPLAIN)
+
+DATABASE_URL의 PostgreSQL(database/schema/schema.sql 적용)에 트랜잭션을 열고 샘플
+데이터를 대량으로 넣은 뒤 ANALYZE하고, 실제 저장소 메서드가 실행하는 SQL을 캡처하여
+EXPLAIN으로 기대한 인덱스를 사용하는지, 큰 테이블을 Seq Scan 하지 않는지, 파티션
+테이블(order_history)에서 기간 밖 파티션을 건너뛰는지 확인한다. 파티션과 파티션
+인덱스는 부모 이름으로 비교한다. 마지막에 롤백하므로 데이터는 남지 않는다.
+PostgreSQL에 연결할 수 없으면 건너뛴다.
+
+    pytest -m db tests/integration/test_query_plans.py
+"""
+import json
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.repositories import (
+    CategoryRepository, HistoryRepository, MenuRepository,
+    OrderRepository, SessionRepository, TableRepository,
+)
+
+pytestmark = [pytest.mark.db, pytest.mark.asyncio(loop_scope="module")]
+
+STORES = 200
+TABLES_PER_STORE = 10
+ACTIVE_TABLES_PER_STORE = 3
+CATEGORIES_PER_STORE = 5
+MENUS_PER_CATEGORY = 10
+SESSIONS_PER_TABLE = 5
+ORDERS_PER_SESSION = 3
+ITEMS_PER_ORDER = 2
+HISTORY_PER_TABLE = 20
+
+# Seq Scan이 나오면 안 되는 테이블
+LARGE_TABLES = {"orders", "order_items", "order_history", "table_sessions", "menus"}
+
+SEED_SQL = [
+    f"""
+    INSERT INTO stores (store_name, admin_username, admin_password_hash)
+    SELECT 'plan store ' || g, 'plan_admin_' || g, 'x'
+    FROM generate_series(1, {STORES}) g
+    """,
+    f"""
+    INSERT INTO categories (store_id, category_name, display_order)
+    SELECT s.store_id, 'category ' || g, g
+    FROM stores s, generate_series(1, {CATEGORIES_PER_STORE}) g
+    WHERE s.admin_username LIKE 'plan_admin_%'
+    """,
+    f"""
+    INSERT INTO menus (store_id, category_id, menu_name, price, display_order)
+    SELECT c.store_id, c.category_id, 'menu ' || g, 1000 * g, g
+    FROM categories c
+    JOIN stores s ON s.store_id = c.store_id AND s.admin_username LIKE 'plan_admin_%',
+    generate_series(1, {MENUS_PER_CATEGORY}) g
+    """,
+    f"""
+    INSERT INTO tables (store_id, table_number, table_password_hash)
+    SELECT s.store_id, g, 'x'
+    FROM stores s, generate_series(1, {TABLES_PER_STORE}) g
+    WHERE s.admin_username LIKE 'plan_admin_%'
+    """,
+    # 종료된 세션
+    f"""
+    INSERT INTO table_sessions (table_id, start_time, end_time, is_active)
+    SELECT t.table_id, now() - make_interval(days => g), now() - make_interval(days => g) + interval '1 hour', FALSE
+    FROM tables t
+    JOIN stores s ON s.store_id = t.store_id AND s.admin_username LIKE 'plan_admin_%',
+    generate_series(1, {SESSIONS_PER_TABLE - 1}) g
+    """,
+    # 일부 테이블만 활성 세션 (트리거가 tables.current_session_id 설정)
+    f"""
+    INSERT INTO table_sessions (table_id, is_active)
+    SELECT t.table_id, TRUE
+    FROM tables t
+    JOIN stores s ON s.store_id = t.store_id AND s.admin_username LIKE 'plan_admin_%'
+    WHERE t.table_number <= {ACTIVE_TABLES_PER_STORE}
+    """,
+    f"""
+    INSERT INTO orders (session_id, table_id, store_id, order_time, total_amount, status)
+    SELECT ts.session_id, t.table_id, t.store_id,
+           ts.start_time + make_interval(mins => g),
+           2000,
+           (ARRAY['대기중', '준비중', '완료'])[1 + g % 3]
+    FROM table_sessions ts
+    JOIN tables t ON t.table_id = ts.table_id
+    JOIN stores s ON s.store_id = t.store_id AND s.admin_username LIKE 'plan_admin_%',
+    generate_series(1, {ORDERS_PER_SESSION}) g
+    """,
+    f"""
+    INSERT INTO order_items (order_id, menu_id, quantity, unit_price)
+    SELECT o.order_id, m.menu_id, 1, 1000
+    FROM orders o
+    JOIN (SELECT store_id, min(menu_id) AS menu_id FROM menus GROUP BY store_id) m
+      ON m.store_id = o.store_id
+    JOIN stores s ON s.store_id = o.store_id AND s.admin_username LIKE 'plan_admin_%',
+    generate_series(1, {ITEMS_PER_ORDER}) g
+    """,
+    f"""
+    INSERT INTO order_history (session_id, table_id, store_id, completed_time, archived_order_data)
+    SELECT gen_random_uuid(), t.table_id, t.store_id, now() - make_interval(hours => g), '{{}}'::jsonb
+    FROM tables t
+    JOIN stores s ON s.store_id = t.store_id AND s.admin_username LIKE 'plan_admin_%',
+    generate_series(1, {HISTORY_PER_TABLE}) g
+    """,
+    "ANALYZE stores, categories, menus, tables, table_sessions, orders, order_items, order_history",
+]
+
+SAMPLE_SQL = """
+    SELECT t.store_id, t.table_id, t.table_number, t.current_session_id,
+           (SELECT min(category_id) FROM categories c WHERE c.store_id = t.store_id) AS category_id
+    FROM tables t
+    JOIN stores s ON s.store_id = t.store_id
+    WHERE s.admin_username = 'plan_admin_100' AND t.current_session_id IS NOT NULL
+    ORDER BY t.table_number
+    LIMIT 1
+"""
+
+PARENTS_SQL = """
+    SELECT child.relname AS child, parent.relname AS parent
+    FROM pg_inherits i
+    JOIN pg_class child ON child.oid = i.inhrelid
+    JOIN pg_class parent ON parent.oid = i.inhparent
+"""
+
+# 빈 파티션(미리 만든 다음 달 등)은 Seq Scan이 정상
+EMPTY_SQL = "SELECT relname FROM pg_class WHERE relkind = 'r' AND relpages = 0"
+
+def month_start(months_ahead: int = 0) -> date:
+    first = date.today().replace(day=1)
+    for _ in range(months_ahead):
+        first = (first + timedelta(days=32)).replace(day=1)
+    return first
+
+
+# (이름, 저장소 호출, 기대 인덱스, 스캔 허용 order_history 파티션 수)
+Check = Tuple[str, Callable[[AsyncSession, dict], Awaitable[object]], Set[str], Optional[int]]
+
+CHECKS: List[Check] = [
+    ("orders by session",
+     lambda db, s: OrderRepository(db).get_by_session(s["session_id"]),
+     {"idx_orders_session_time"}, None),
+    ("orders by store and status",
+     lambda db, s: OrderRepository(db).get_by_store(s["store_id"], "대기중"),
+     {"idx_orders_store_status_time"}, None),
+    ("admin board",
+     lambda db, s: OrderRepository(db).get_board_rows(s["store_id"]),
+     {"idx_tables_store_active", "idx_orders_session_time"}, None),
+    ("session total",
+     lambda db, s: OrderRepository(db).calculate_total_by_session(s["session_id"]),
+     {"idx_orders_session_time"}, None),
+    ("table history with count",
+     lambda db, s: HistoryRepository(db).get_page_by_table(s["table_id"], count_limit=10000),
+     {"idx_order_history_table_time"}, None),
+    ("table history keyset page",
+     lambda db, s: HistoryRepository(db).get_page_by_table(
+         s["table_id"], after=(datetime.utcnow() - timedelta(hours=10), 2 ** 31 - 1)
+     ),
+     {"idx_order_history_table_time"}, None),
+    # 이번 달 범위는 이번 달 파티션 하나만 스캔
+    ("table history month range",
+     lambda db, s: HistoryRepository(db).get_page_by_table(
+         s["table_id"], start_date=month_start(), end_date=month_start(1) - timedelta(days=1),
+         count_limit=10000,
+     ),
+     {"idx_order_history_table_time"}, 1),
+    ("menus by store",
+     lambda db, s: MenuRepository(db).get_by_store(s["store_id"]),
+     {"idx_menus_store_order"}, None),
+    ("menus by category",
+     lambda db, s: MenuRepository(db).get_by_category(s["category_id"]),
+     {"idx_menus_category_order"}, None),
+    ("categories by store",
+     lambda db, s: CategoryRepository(db).get_by_store(s["store_id"]),
+     {"idx_categories_store_order"}, None),
+    ("table by number",
+     lambda db, s: TableRepository(db).get_by_store_and_number(s["store_id"], s["table_number"]),
+     {"tables_store_id_table_number_key"}, None),
+    ("active session by table",
+     lambda db, s: SessionRepository(db).get_active_by_table(s["table_id"]),
+     {"idx_table_sessions_active_table"}, None),
+    ("active sessions by store",
+     lambda db, s: SessionRepository(db).get_active_by_store(s["store_id"]),
+     set(), None),
+]
+
+
+def walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from walk(child)
+
+
+async def explain(conn, statement: str, parameters) -> dict:
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    value = result.scalar()
+    return (json.loads(value) if isinstance(value, str) else value)[0]["Plan"]
+
+
+class PlanContext:
+    """시드 데이터가 들어간 트랜잭션과 SQL 캡처 상태"""
+
+    def __init__(self, conn: AsyncConnection, sample: dict, parents: Dict[str, str], empty: Set[str]):
+        self.conn = conn
+        self.sample = sample
+        self.parents = parents
+        self.empty = empty
+        self.captured: List[Tuple[str, object]] = []
+        self.capturing = False
+
+    def capture(self, conn, cursor, statement, parameters, context, executemany):
+        if self.capturing:
+            self.captured.append((statement, parameters))
+
+    async def plans(self, call: Callable[[AsyncSession, dict], Awaitable[object]]) -> List[dict]:
+        """저장소 호출이 실행한 모든 SQL의 실행 계획"""
+        db = AsyncSession(bind=self.conn)
+        self.captured.clear()
+        self.capturing = True
+        try:
+            await call(db, self.sample)
+        finally:
+            self.capturing = False
+            await db.close()
+        return [await explain(self.conn, statement, parameters) for statement, parameters in list(self.captured)]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def plan_context():
+    engine = create_async_engine(settings.database_url)
+    if engine.dialect.name != "postgresql":
+        await engine.dispose()
+        pytest.skip("EXPLAIN checks require PostgreSQL")
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 FROM orders LIMIT 1"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL with the schema is not available: {e}")
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            for sql in SEED_SQL:
+                await conn.execute(text(sql))
+            sample = dict((await conn.execute(text(SAMPLE_SQL))).mappings().one())
+            sample["session_id"] = sample.pop("current_session_id")
+            parents: Dict[str, str] = dict((await conn.execute(text(PARENTS_SQL))).all())
+            empty = set((await conn.execute(text(EMPTY_SQL))).scalars())
+
+            context = PlanContext(conn, sample, parents, empty)
+            event.listen(engine.sync_engine, "before_cursor_execute", context.capture)
+            try:
+                yield context
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", context.capture)
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "call, expected, max_partitions",
+    [check[1:] for check in CHECKS],
+    ids=[check[0] for check in CHECKS],
+)
+async def test_query_plan(plan_context: PlanContext, call, expected: Set[str], max_partitions: Optional[int]):
+    parents = plan_context.parents
+    used: Set[str] = set()
+    seq_scans: Set[str] = set()
+    partitions: Set[str] = set()
+    for plan in await plan_context.plans(call):
+        for node in walk(plan):
+            if "Index Name" in node:
+                used.add(parents.get(node["Index Name"], node["Index Name"]))
+            relation = node.get("Relation Name")
+            if relation and parents.get(relation) == "order_history":
+                partitions.add(relation)
+            if node["Node Type"] == "Seq Scan" and relation not in plan_context.empty:
+                seq_scans.add(relation)
+
+    assert used, "repository call executed no index scans"
+    assert expected <= used, f"missing indexes: {sorted(expected - used)} (used: {sorted(used)})"
+    bad_scans = {parents.get(r, r) for r in seq_scans} & LARGE_TABLES
+    assert not bad_scans, f"seq scan on large tables: {sorted(seq_scans)}"
+    if max_partitions is not None:
+        assert len(partitions) <= max_partitions, f"partitions not pruned: {sorted(partitions)}"
@@ -0,0 +1,105 @@
+"""WebSocket 프레임 인코딩/디코딩과 클라이언트 메시지 검증"""
+import json
+from datetime import datetime
+from uuid import UUID
+
+import msgpack
+import pytest
+
+from app.services import event_codec
+from app.services.event_codec import FrameError, decode, encode
+
+
+@pytest.fixture(params=event_codec.ENCODINGS)
+def encoding(request) -> str:
+    return request.param
+
+
+def _unpack(raw, encoding: str):
+    return msgpack.unpackb(raw, raw=False) if encoding == "msgpack" else json.loads(raw)
+
+
+def test_event_frame_round_trip(encoding):
+    event = {
+        "id": 3,
+        "event": "order_updated",
+        "data": {
+            "order_id": 10,
+            "table_id": 2,
+            "status": "준비중",
+            "session_id": UUID("12345678-1234-5678-1234-567812345678"),
+            "order_time": datetime(2024, 1, 2, 3, 4, 5),
+            "items": [{"menu_name": "김치찌개", "quantity": 2}],
+        },
+    }
+
+    raw = encode(event_codec.event_frame(event), encoding)
+    assert isinstance(raw, bytes if encoding == "msgpack" else str)
+    assert _unpack(raw, encoding) == [
+        event_codec.FRAME_EVENT,
+        3,
+        event_codec.EVENT_CODES["order_updated"],
+        {
+            "o": 10,
+            "t": 2,
+            "s": event_codec.STATUS_CODES["준비중"],
+            "ss": "12345678-1234-5678-1234-567812345678",
+            "tm": "2024-01-02T03:04:05",
+            "I": [{"mn": "김치찌개", "q": 2}],
+        },
+    ]
+
+
+@pytest.mark.parametrize("message", [
+    [event_codec.MSG_ACK, 5],
+    [event_codec.MSG_PING],
+    [event_codec.MSG_STATUS, "r1", 7, "완료"],
+    [event_codec.MSG_STATUS, 9, 7, "대기중"],
+])
+def test_decode_valid_messages(encoding, message):
+    assert decode(encode(message, encoding), encoding) == message
+
+
+def test_decode_normalizes_status_code(encoding):
+    message = [event_codec.MSG_STATUS, "r1", 7, event_codec.STATUS_CODES["준비중"]]
+
+    assert decode(encode(message, encoding), encoding) == [event_codec.MSG_STATUS, "r1", 7, "준비중"]
+
+
+@pytest.mark.parametrize("message", [
+    {},
+    [],
+    [event_codec.MSG_ACK],
+    [event_codec.MSG_ACK, "5"],
+    [event_codec.MSG_ACK, True],
+    [event_codec.MSG_PING, 1],
+    [9],
+    [event_codec.MSG_STATUS, {"ref": 1}, 7, "완료"],
+])
+def test_decode_rejects_unknown_shapes(encoding, message):
+    with pytest.raises(FrameError) as exc_info:
+        decode(encode(message, encoding), encoding)
+    assert exc_info.value.ref is None
+
+
+@pytest.mark.parametrize("message", [
+    [event_codec.MSG_STATUS, "r1", 7],
+    [event_codec.MSG_STATUS, "r1", 0, "완료"],
+    [event_codec.MSG_STATUS, "r1", "7", "완료"],
+    [event_codec.MSG_STATUS, "r1", event_codec.MAX_ORDER_ID + 1, "완료"],
+    [event_codec.MSG_STATUS, "r1", 7, "bogus"],
+    [event_codec.MSG_STATUS, "r1", 7, 99],
+])
+def test_decode_invalid_status_message_keeps_ref(encoding, message):
+    with pytest.raises(FrameError) as exc_info:
+        decode(encode(message, encoding), encoding)
+    assert exc_info.value.ref == "r1"
+
+
+@pytest.mark.parametrize("encoding, raw", [
+    ("msgpack", b"\xc1"),
+    ("json", "[1, "),
+])
+def test_decode_malformed_payload(encoding, raw):
+    with pytest.raises(FrameError):
+        decode(raw, encoding)
@@ -0,0 +1,44 @@
+"""keyset 커서 인코딩/디코딩"""
+import base64
+from datetime import datetime
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize("completed_at, row_id", [
+    (datetime(2024, 5, 1, 12, 30, 15), 42),
+    (datetime(2024, 5, 1, 12, 30, 15, 123456), 1),
+    (datetime(1999, 12, 31, 23, 59, 59), 2 ** 31 - 1),
+])
+def test_cursor_round_trip(completed_at, row_id):
+    cursor = encode_cursor(completed_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (completed_at, row_id)
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not a cursor",
+    "!!!!",
+    encode_cursor(datetime(2024, 5, 1), 42)[:-3],
+    _b64(b"2024-05-01T00:00:00"),
+    _b64(b"2024-05-01T00:00:00|abc"),
+    _b64(b"2024-05-01T00:00:00|1|2"),
+    _b64(b"2024-05-01T00:00:00|0"),
+    _b64(b"2024-05-01T00:00:00|-5"),
+    _b64(b"2024-05-01T00:00:00|99999999999"),
+    _b64(f"2024-05-01T00:00:00|{2 ** 31}".encode()),
+    _b64(b"yesterday|42"),
+    _b64(b"\xff\xfe|42"),
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
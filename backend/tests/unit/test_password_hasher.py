@@ -0,0 +1,54 @@
+"""bcrypt 전용 스레드 풀 실행과 통계"""
+import asyncio
+import threading
+
+import pytest
+
+from app.core.security import PasswordHasherPool, hash_password, verify_password
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHasherPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+async def test_hash_and_verify_in_pool(pool):
+    hashed = await pool.run(hash_password, "1234")
+
+    assert await pool.run(verify_password, "1234", hashed) is True
+    assert await pool.run(verify_password, "4321", hashed) is False
+
+
+async def test_runs_off_event_loop_thread(pool):
+    loop_thread = threading.get_ident()
+
+    assert await pool.run(threading.get_ident) != loop_thread
+
+
+async def test_excess_calls_wait_in_queue(pool):
+    release = threading.Event()
+    blocked = asyncio.ensure_future(pool.run(release.wait, 5))
+    queued = asyncio.ensure_future(pool.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+
+    stats = pool.get_stats()
+    assert (stats["submitted"], stats["running"], stats["queued"]) == (2, 1, 1)
+
+    release.set()
+    assert await queued == "done"
+    assert await blocked is True
+
+    stats = pool.get_stats()
+    assert (stats["completed"], stats["running"], stats["queued"]) == (2, 0, 0)
+    assert stats["queue_wait_max_ms"] >= 40
+
+
+async def test_exception_is_propagated_and_counted(pool):
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await pool.run(fail)
+    assert pool.get_stats()["completed"] == 1
@@ -0,0 +1,123 @@
+"""인메모리 토큰 버킷 충전과 로그인 제한 판정"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import rate_limit
+from app.core.exceptions import TooManyRequestsError
+from app.core.rate_limit import InMemoryTokenBucket, LoginThrottle
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    """rate_limit 모듈이 보는 시각만 수동으로 진행"""
+    fake = SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+async def _take(bucket: InMemoryTokenBucket, key: str, capacity: int, refill_per_sec: float):
+    """단일 버킷 소비 (허용 여부, 거부 시 남은 토큰)"""
+    rejected, tokens = await bucket.consume([(key, capacity, refill_per_sec)])
+    return rejected < 0, tokens
+
+
+async def test_bucket_allows_burst_up_to_capacity(clock):
+    bucket = InMemoryTokenBucket()
+
+    results = [await _take(bucket, "ip:1", 3, 1.0) for _ in range(4)]
+
+    assert [allowed for allowed, _ in results] == [True, True, True, False]
+    assert results[-1][1] == 0
+
+
+async def test_bucket_refills_over_time(clock):
+    bucket = InMemoryTokenBucket()
+    for _ in range(2):
+        await _take(bucket, "ip:1", 2, 0.5)
+
+    clock.now += 1
+    assert await _take(bucket, "ip:1", 2, 0.5) == (False, 0.5)
+
+    clock.now += 1
+    assert (await _take(bucket, "ip:1", 2, 0.5))[0] is True
+    assert (await _take(bucket, "ip:1", 2, 0.5))[0] is False
+
+
+async def test_bucket_refill_is_capped_at_capacity(clock):
+    bucket = InMemoryTokenBucket()
+    await _take(bucket, "ip:1", 2, 1.0)
+
+    clock.now += 3600
+    assert [(await _take(bucket, "ip:1", 2, 1.0))[0] for _ in range(3)] == [True, True, False]
+
+
+async def test_bucket_evicts_least_recently_used_key(clock):
+    bucket = InMemoryTokenBucket(max_keys=2)
+    await _take(bucket, "a", 1, 0.1)
+    await _take(bucket, "b", 1, 0.1)
+    await _take(bucket, "a", 1, 0.1)
+    await _take(bucket, "c", 1, 0.1)
+
+    # b가 제거되어 새 버킷으로 시작
+    assert (await _take(bucket, "b", 1, 0.1))[0] is True
+    assert (await _take(bucket, "c", 1, 0.1))[0] is False
+
+
+async def test_rejected_request_consumes_no_tokens(clock):
+    bucket = InMemoryTokenBucket()
+    await _take(bucket, "username:admin", 1, 0.1)
+
+    buckets = [("ip:1", 2, 0.1), ("username:admin", 1, 0.1)]
+    for _ in range(3):
+        assert await bucket.consume(buckets) == (1, 0)
+
+    # ip 버킷은 거부된 요청에 소비되지 않아 그대로 2개
+    assert [(await _take(bucket, "ip:1", 2, 0.1))[0] for _ in range(3)] == [True, True, False]
+
+
+async def test_login_throttle_rejects_with_retry_after(clock):
+    throttle = LoginThrottle(InMemoryTokenBucket(), {"ip": 2, "username": 60})
+
+    await throttle.check(ip="10.0.0.1", username="admin")
+    await throttle.check(ip="10.0.0.1", username="admin")
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await throttle.check(ip="10.0.0.1", username="admin")
+
+    assert exc_info.value.details == {"scope": "ip", "retry_after": 30}
+    await throttle.check(ip="10.0.0.2", username=None)
+
+    stats = throttle.get_stats()
+    assert stats["allowed"] == {"ip": 3, "username": 2}
+    assert stats["rejected"] == {"ip": 1, "username": 0}
+
+
+async def test_login_throttle_ignores_backend_errors():
+    class BrokenBackend:
+        async def consume(self, buckets):
+            raise ConnectionError("redis down")
+
+    throttle = LoginThrottle(BrokenBackend(), {"ip": 1})
+    await throttle.check(ip="10.0.0.1")
+    await throttle.check(ip="10.0.0.1")
+
+    assert throttle.get_stats()["backend_errors"] == 2
+
+
+async def test_login_throttle_records_decision_metrics(clock):
+    from app.core.metrics import LOGIN_THROTTLE_DECISIONS
+
+    def count(scope: str, decision: str) -> float:
+        return LOGIN_THROTTLE_DECISIONS._values.get((scope, decision), 0.0)
+
+    before = (count("store", "allowed"), count("username", "allowed"), count("username", "rejected"))
+    throttle = LoginThrottle(InMemoryTokenBucket(), {"store": 100, "username": 1})
+    await throttle.check(store=1, username="1:1")
+    with pytest.raises(TooManyRequestsError):
+        await throttle.check(store=1, username="1:1")
+
+    after = (count("store", "allowed"), count("username", "allowed"), count("username", "rejected"))
+    assert [a - b for a, b in zip(after, before)] == [1, 1, 1]
+    assert LOGIN_THROTTLE_DECISIONS.name == "login_throttle_decisions_total"
@@ -0,0 +1,67 @@
+"""쓰기 시각 쿠키 기반 read-your-writes 판정"""
+import time
+from typing import Optional
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+
+from app.core import database
+from app.core.database import WRITE_MARKER_COOKIE, mark_write, wrote_recently
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """복제본이 설정된 것처럼 read_engine을 교체"""
+    monkeypatch.setattr(database, "read_engine", object())
+    monkeypatch.setattr(database.settings, "db_read_after_write_window", 5.0)
+
+
+def _request(cookie: Optional[str] = None) -> Request:
+    headers = []
+    if cookie is not None:
+        headers.append((b"cookie", f"{WRITE_MARKER_COOKIE}={cookie}".encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _set_cookie(response: Response) -> str:
+    return response.headers.get("set-cookie", "")
+
+
+def test_write_response_sets_marker_cookie(replica):
+    response = Response()
+    mark_write(response)
+
+    cookie = _set_cookie(response)
+    assert cookie.startswith(f"{WRITE_MARKER_COOKIE}=")
+    assert "Max-Age=5" in cookie
+    assert "HttpOnly" in cookie
+
+    value = cookie.split(";")[0].split("=", 1)[1]
+    assert wrote_recently(_request(value))
+
+
+def test_no_cookie_without_replica():
+    response = Response()
+    mark_write(response)
+
+    assert _set_cookie(response) == ""
+
+
+@pytest.mark.parametrize("cookie, expected", [
+    (None, False),
+    ("", False),
+    ("abc", False),
+    ("nan", False),
+])
+def test_invalid_marker_is_ignored(replica, cookie, expected):
+    assert wrote_recently(_request(cookie)) is expected
+
+
+@pytest.mark.parametrize("age, expected", [
+    (1, True),
+    (60, False),
+    (-3600, False),
+])
+def test_marker_expires_after_window(replica, age, expected):
+    assert wrote_recently(_request(str(time.time() - age))) is expected
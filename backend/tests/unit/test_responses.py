@@ -0,0 +1,138 @@
+"""FastJSONResponse 출력이 response_model 직렬화 결과와 같은지 확인"""
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.v1.endpoints.customer import _format_session_orders
+from app.core import responses
+from app.core.responses import FastJSONResponse, render_json
+from app.schemas import AdminOrdersResponse, CustomerOrdersResponse
+
+SESSION_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def _items(count: int) -> list:
+    return [
+        {
+            "order_item_id": k,
+            "menu_id": k,
+            "menu_name": f"메뉴 \"{k}\"",
+            "quantity": 2,
+            "unit_price": 9000,
+            "subtotal": 18000,
+        }
+        for k in range(1, count + 1)
+    ]
+
+
+def _board() -> dict:
+    return {
+        "store_id": 1,
+        "tables": [
+            {
+                "table_id": 1,
+                "table_number": 1,
+                "session_id": SESSION_ID,
+                "total_amount": 54000,
+                "order_count": 1,
+                "orders": [{
+                    "order_id": 10,
+                    "total_amount": 54000,
+                    "status": "대기중",
+                    "order_time": datetime(2024, 1, 1, 12, 0, 0, 123456),
+                    "items": _items(3),
+                }],
+            },
+            # 세션이 없는 테이블
+            {
+                "table_id": 2,
+                "table_number": 2,
+                "session_id": None,
+                "total_amount": 0,
+                "order_count": 0,
+                "orders": [],
+            },
+        ],
+    }
+
+
+def _session_orders() -> dict:
+    menu = SimpleNamespace(menu_name="김치찌개")
+    orders = [
+        SimpleNamespace(
+            order_id=order_id,
+            total_amount=9000,
+            status="완료",
+            order_time=datetime(2024, 1, 1, 12, order_id),
+            items=[SimpleNamespace(
+                order_item_id=order_id, menu_id=1, menu=menu if order_id == 1 else None,
+                quantity=1, unit_price=9000, subtotal=9000,
+            )],
+        )
+        for order_id in (1, 2)
+    ]
+    return _format_session_orders({
+        "session_id": SESSION_ID,
+        "table_number": 3,
+        "total_session_amount": 18000,
+        "orders": orders,
+    })
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch) -> str:
+    if request.param == "orjson":
+        if responses.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    return request.param
+
+
+def _app(response_model, payload: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/validated", response_model=response_model)
+    async def validated():
+        return payload
+
+    @app.get("/fast", response_model=response_model)
+    async def fast():
+        return FastJSONResponse(payload)
+
+    return app
+
+
+@pytest.mark.parametrize("response_model, build", [
+    (AdminOrdersResponse, _board),
+    (CustomerOrdersResponse, _session_orders),
+])
+async def test_fast_response_matches_response_model(json_backend, response_model, build):
+    app = _app(response_model, build())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        validated = await client.get("/validated")
+        fast = await client.get("/fast")
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == validated.headers["content-type"]
+    assert fast.json() == validated.json()
+
+
+def test_render_json_fallback_matches_starlette_format(monkeypatch):
+    monkeypatch.setattr(responses, "orjson", None)
+    content = {"name": "김치찌개", "price": 9000, "tags": [], "note": None}
+
+    assert render_json(content) == json.dumps(
+        content, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_render_json_rejects_unknown_types(json_backend):
+    with pytest.raises(TypeError):
+        render_json({"value": object()})
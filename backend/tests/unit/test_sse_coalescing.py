@@ -0,0 +1,67 @@
+"""SSE 이벤트 병합 (coalesce window 동안 모아 한 프레임으로 전달)"""
+import asyncio
+
+from app.services.sse_service import SSEService, _coalesce
+
+
+def _event(seq: int, event_type: str, order_id: int, status: str = "PENDING") -> dict:
+    return {"id": seq, "event": event_type, "data": {"order_id": order_id, "status": status}}
+
+
+def test_coalesce_keeps_last_update_per_order():
+    events = [
+        _event(1, "order_created", 1),
+        _event(2, "order_updated", 1, "PREPARING"),
+        _event(3, "order_updated", 2, "PREPARING"),
+        _event(4, "order_updated", 1, "COMPLETED"),
+        _event(5, "order_deleted", 2),
+    ]
+
+    assert [e["id"] for e in _coalesce(events)] == [1, 3, 4, 5]
+
+
+def test_coalesce_without_updates_is_unchanged():
+    events = [_event(1, "order_created", 1), _event(2, "order_created", 2)]
+
+    assert _coalesce(events) == events
+
+
+async def test_window_delivers_single_frame():
+    service = SSEService(snapshot_ttl=60, replay_buffer_size=100, coalesce_window_ms=20)
+    _, queue = await service.register_connection(1)
+
+    await service.broadcast_order_update(1, "order_updated", {"order_id": 1, "status": "PREPARING"})
+    await service.broadcast_order_update(1, "order_updated", {"order_id": 1, "status": "COMPLETED"})
+    await service.broadcast_order_update(1, "order_created", {"order_id": 2})
+    assert queue.empty()
+
+    frame = await asyncio.wait_for(queue.get(), timeout=1)
+    # 시퀀스는 병합 후에 붙으므로 빈 번호가 없음
+    assert [(e["id"], e["event"]) for e in frame] == [(1, "order_updated"), (2, "order_created")]
+    assert frame[0]["data"]["status"] == "COMPLETED"
+    assert queue.empty()
+
+    # window가 끝난 뒤의 이벤트는 새 window로 모음
+    await service.broadcast_order_update(1, "order_created", {"order_id": 3})
+    frame = await asyncio.wait_for(queue.get(), timeout=1)
+    assert frame["id"] == 3
+
+
+async def test_coalesced_events_are_replayed_without_snapshot_reload():
+    service = SSEService(snapshot_ttl=60, replay_buffer_size=100, coalesce_window_ms=10)
+    calls = []
+
+    async def loader():
+        calls.append(len(calls))
+        return calls[-1]
+
+    _, first = await service.open_stream(1, loader)
+    for status in ("PREPARING", "COMPLETED"):
+        await service.broadcast_order_update(1, "order_updated", {"order_id": 1, "status": status})
+    await asyncio.wait_for(first.get(), timeout=1)
+    await asyncio.wait_for(first.get(), timeout=1)
+
+    _, queue = await service.open_stream(1, loader)
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert calls == [0]
+    assert [(e["id"], e["event"]) for e in events] == [(0, "initial"), (1, "order_updated")]
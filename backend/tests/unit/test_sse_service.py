@@ -0,0 +1,121 @@
+"""SSEService 연결 등록/해제와 초기 스냅샷 이후 이벤트 재생"""
+from app.services.sse_service import SSEService
+
+
+def _drain(queue) -> list:
+    events = []
+    while not queue.empty():
+        item = queue.get_nowait()
+        events.extend(item if isinstance(item, list) else [item])
+    return events
+
+
+def _service(**kwargs) -> SSEService:
+    kwargs.setdefault("snapshot_ttl", 60)
+    kwargs.setdefault("replay_buffer_size", 100)
+    kwargs.setdefault("coalesce_window_ms", 0)
+    return SSEService(**kwargs)
+
+
+async def test_register_and_unregister_connection():
+    service = _service()
+    store_conn, _ = await service.register_connection(1)
+    table_conn, _ = await service.register_connection(1, table_id=7)
+
+    assert service.get_total_connections() == 2
+    assert service.get_connection_count(1) == 1
+    assert service.get_table_connection_count(7) == 1
+    assert service.get_connection_counts_by_store() == {1: 2}
+
+    assert service.unregister_connection(table_conn) is True
+    assert service.unregister_connection(table_conn) is False
+    assert service.get_table_connection_count(7) == 0
+
+    service.unregister_connection(store_conn)
+    assert service.get_total_connections() == 0
+    assert service.get_connection_count(1) == 0
+
+
+async def test_broadcast_routes_store_and_table_events():
+    service = _service()
+    _, store_queue = await service.register_connection(1)
+    _, table_queue = await service.register_connection(1, table_id=7)
+    _, other_queue = await service.register_connection(1, table_id=8)
+
+    assert await service.broadcast_order_update(1, "order_created", {"order_id": 1, "table_id": 7})
+
+    assert [e["data"]["order_id"] for e in _drain(store_queue)] == [1]
+    assert [e["data"]["order_id"] for e in _drain(table_queue)] == [1]
+    assert _drain(other_queue) == []
+
+
+async def test_sessions_ended_is_split_per_table():
+    service = _service()
+    _, table_queue = await service.register_connection(1, table_id=7)
+
+    await service.broadcast_order_update(1, "sessions_ended", {"sessions": [
+        {"table_id": 7, "session_id": "a"},
+        {"table_id": 8, "session_id": "b"},
+    ]})
+
+    events = _drain(table_queue)
+    assert [(e["event"], e["data"]["session_id"]) for e in events] == [("session_ended", "a")]
+
+
+async def test_open_stream_replays_events_after_snapshot():
+    service = _service()
+    await service.broadcast_order_update(1, "order_created", {"order_id": 1, "table_id": 7})
+
+    async def loader():
+        return ["snapshot"]
+
+    # 스냅샷은 seq 1 시점 (TTL 동안 재사용)
+    _, first_queue = await service.open_stream(1, loader)
+    await service.broadcast_order_update(1, "order_created", {"order_id": 2, "table_id": 7})
+    await service.broadcast_order_update(1, "order_created", {"order_id": 3, "table_id": 8})
+
+    _, queue = await service.open_stream(1, loader)
+    events = _drain(queue)
+    assert [e["id"] for e in events] == [1, 2, 3]
+    assert events[0]["event"] == "initial"
+    assert [e["data"]["order_id"] for e in events[1:]] == [2, 3]
+
+    _, table_queue = await service.open_stream(1, loader, table_id=7)
+    table_events = _drain(table_queue)
+    assert [e["event"] for e in table_events] == ["initial"]
+
+    assert [e["id"] for e in _drain(first_queue)] == [1, 2, 3]
+
+
+async def test_snapshot_is_rebuilt_when_replay_buffer_overflowed():
+    service = _service(replay_buffer_size=2)
+    calls = []
+
+    async def loader():
+        calls.append(len(calls))
+        return calls[-1]
+
+    await service.open_stream(1, loader)
+    for order_id in range(3):
+        await service.broadcast_order_update(1, "order_created", {"order_id": order_id})
+
+    _, queue = await service.open_stream(1, loader)
+    events = _drain(queue)
+    assert calls == [0, 1]
+    assert [(e["id"], e["event"]) for e in events] == [(3, "initial")]
+
+
+async def test_table_snapshot_is_not_shared_across_sessions():
+    service = _service()
+
+    async def old_session():
+        return ["old"]
+
+    async def new_session():
+        return ["new"]
+
+    _, queue = await service.open_stream(1, old_session, table_id=7, scope="session-a")
+    assert _drain(queue)[0]["data"] == ["old"]
+
+    _, queue = await service.open_stream(1, new_session, table_id=7, scope="session-b")
+    assert _drain(queue)[0]["data"] == ["new"]
@@ -0,0 +1,87 @@
+"""JWT 검증 캐시 (만료, LRU 제거, 세션별 정리)"""
+import time
+from typing import Optional
+from datetime import timedelta
+
+from app.core.security import TokenCache, create_access_token, get_token_cache, verify_token
+
+
+def _payload(exp_in: float, session_id: Optional[str] = None) -> dict:
+    payload = {"sub": "1", "exp": time.time() + exp_in}
+    if session_id:
+        payload["session_id"] = session_id
+    return payload
+
+
+def test_get_returns_cached_payload():
+    cache = TokenCache(max_size=10)
+    digest = cache.digest("token")
+    payload = _payload(60)
+
+    assert cache.get(digest) is None
+    cache.put(digest, payload)
+    assert cache.get(digest) == payload
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entry_is_removed():
+    cache = TokenCache(max_size=10)
+    digest = cache.digest("token")
+    cache.put(digest, _payload(-1, session_id="s1"))
+
+    assert cache.get(digest) is None
+    assert cache.get_stats()["size"] == 0
+    assert cache.invalidate_session("s1") == 0
+
+
+def test_payload_without_exp_is_not_cached():
+    cache = TokenCache(max_size=10)
+    cache.put(cache.digest("token"), {"sub": "1"})
+
+    assert cache.get_stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TokenCache(max_size=2)
+    a, b, c = (cache.digest(token) for token in "abc")
+    cache.put(a, _payload(60))
+    cache.put(b, _payload(60))
+
+    # a를 조회하면 b가 가장 오래 사용되지 않은 항목이 됨
+    assert cache.get(a) is not None
+    cache.put(c, _payload(60))
+
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+    assert cache.get(c) is not None
+    assert cache.evictions == 1
+
+
+def test_invalidate_session_removes_only_its_tokens():
+    cache = TokenCache(max_size=10)
+    first, second, other = (cache.digest(token) for token in ("t1", "t2", "t3"))
+    cache.put(first, _payload(60, session_id="s1"))
+    cache.put(second, _payload(60, session_id="s1"))
+    cache.put(other, _payload(60, session_id="s2"))
+
+    assert cache.invalidate_session("s1") == 2
+    assert cache.get(first) is None
+    assert cache.get(second) is None
+    assert cache.get(other) is not None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TokenCache(max_size=0)
+    cache.put(cache.digest("token"), _payload(60))
+
+    assert cache.get_stats()["size"] == 0
+
+
+def test_verify_token_returns_copy_of_cached_payload():
+    token = create_access_token({"sub": "1", "user_type": "admin"}, timedelta(minutes=5))
+
+    first = verify_token(token)
+    first["user_type"] = "table"
+
+    assert verify_token(token)["user_type"] == "admin"
+    assert get_token_cache().get(TokenCache.digest(token)) is not None
@@ -4,6 +4,8 @@ import { getAuthToken } from '@/utils/auth';
 const axiosInstance = axios.create({
   baseURL: import.meta.env.VITE_API_URL + '/api/v1',
   timeout: 10000,
+  // 쓰기 직후 읽기를 primary DB로 보내는 쿠키 전달
+  withCredentials: true,
 });
 
 // 요청 인터셉터
@@ -0,0 +1,76 @@
+"""Replace single-column indexes with composite/partial indexes matching query shapes"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '003_composite_indexes'
+down_revision = '002_add_indexes'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, where) - 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성
+NEW_INDEXES = [
+    # 세션 주문 목록 / 관리자 보드 (order_time DESC, order_id DESC 정렬)
+    ('idx_orders_session_time', 'orders',
+     ['session_id', sa.text('order_time DESC'), sa.text('order_id DESC')], None),
+    # 매장 주문 목록 (상태 필터 + 최신순)
+    ('idx_orders_store_status_time', 'orders',
+     ['store_id', 'status', sa.text('order_time DESC')], None),
+    # 테이블 과거 이력 (기간 필터 + 최신순, history_id는 동일 시각 정렬 기준)
+    ('idx_order_history_table_time', 'order_history',
+     ['table_id', sa.text('completed_time DESC'), sa.text('history_id DESC')], None),
+    ('idx_menus_category_order', 'menus', ['category_id', 'display_order'], None),
+    ('idx_menus_store_order', 'menus', ['store_id', 'display_order'], None),
+    ('idx_categories_store_order', 'categories', ['store_id', 'display_order'], None),
+    # 관리자 보드: 세션이 있는 테이블만 (store_id, table_number 순)
+    ('idx_tables_store_active', 'tables', ['store_id', 'table_number'],
+     'current_session_id IS NOT NULL'),
+    # 테이블의 활성 세션 조회
+    ('idx_table_sessions_active_table', 'table_sessions', ['table_id'], 'is_active = TRUE'),
+]
+
+# 새 복합 인덱스(또는 UNIQUE 제약 인덱스)의 선행 컬럼과 겹치는 인덱스
+REPLACED_INDEXES = [
+    ('idx_orders_session_id', 'orders', ['session_id'], None),
+    ('idx_orders_store_id', 'orders', ['store_id'], None),
+    ('idx_order_history_table_id', 'order_history', ['table_id'], None),
+    ('idx_menus_category_id', 'menus', ['category_id'], None),
+    ('idx_menus_store_id', 'menus', ['store_id'], None),
+    ('idx_categories_store_id', 'categories', ['store_id'], None),
+    # UNIQUE(store_id, table_number)가 같은 역할
+    ('idx_tables_store_id', 'tables', ['store_id'], None),
+    ('idx_table_sessions_active', 'table_sessions', ['is_active'], 'is_active = TRUE'),
+]
+
+
+def _create(name, table, columns, where):
+    op.create_index(
+        name, table, columns,
+        postgresql_where=sa.text(where) if where else None,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+
+
+def _drop(name):
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade():
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        for index in NEW_INDEXES:
+            _create(*index)
+        for name, *_ in REPLACED_INDEXES:
+            _drop(name)
+
+    op.execute("ANALYZE orders, order_history, menus, categories, tables, table_sessions")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index in REPLACED_INDEXES:
+            _create(*index)
+        for name, *_ in NEW_INDEXES:
+            _drop(name)
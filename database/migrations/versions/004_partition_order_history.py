@@ -0,0 +1,136 @@
+"""Convert order_history into a monthly range-partitioned table on completed_time
+
+기존 행을 새 파티션 테이블로 복사하므로 이력이 많으면 실행 중 order_history
+쓰기가 잠긴다 (세션 종료 시 보관 INSERT가 대기). 트래픽이 적은 시간에 실행할 것.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '004_partition_order_history'
+down_revision = '003_composite_indexes'
+branch_labels = None
+depends_on = None
+
+# 월별 파티션을 from_month부터 현재 월 + months_ahead까지 생성 (애플리케이션이 주기적으로 호출)
+ENSURE_PARTITIONS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION ensure_order_history_partitions(from_month DATE, months_ahead INTEGER)
+    RETURNS INTEGER AS $$
+    DECLARE
+        month_start DATE := date_trunc('month', from_month)::date;
+        last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => months_ahead))::date;
+        partition_name TEXT;
+        created INTEGER := 0;
+    BEGIN
+        -- 여러 워커가 동시에 호출해도 한 번씩만 생성
+        PERFORM pg_advisory_xact_lock(hashtext('ensure_order_history_partitions'));
+
+        WHILE month_start <= last_month LOOP
+            partition_name := 'order_history_' || to_char(month_start, 'YYYY_MM');
+            IF to_regclass(partition_name) IS NULL THEN
+                -- 기본 파티션에 이미 들어간 해당 월 행은 새 파티션으로 옮김
+                CREATE TEMP TABLE IF NOT EXISTS order_history_moved
+                    (LIKE order_history) ON COMMIT DROP;
+                WITH moved AS (
+                    DELETE FROM order_history_default
+                    WHERE completed_time >= month_start
+                      AND completed_time < month_start + interval '1 month'
+                    RETURNING *
+                )
+                INSERT INTO order_history_moved SELECT * FROM moved;
+
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF order_history FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, (month_start + interval '1 month')::date
+                );
+
+                INSERT INTO order_history SELECT * FROM order_history_moved;
+                TRUNCATE order_history_moved;
+                created := created + 1;
+            END IF;
+            month_start := (month_start + interval '1 month')::date;
+        END LOOP;
+
+        RETURN created;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+INDEXES = """
+    CREATE INDEX idx_order_history_store_id ON order_history(store_id);
+    CREATE INDEX idx_order_history_table_time ON order_history(table_id, completed_time DESC, history_id DESC);
+    CREATE INDEX idx_order_history_time ON order_history(completed_time);
+"""
+
+
+def upgrade():
+    op.execute("ALTER TABLE order_history RENAME TO order_history_legacy")
+    op.execute("""
+        DROP INDEX IF EXISTS idx_order_history_store_id;
+        DROP INDEX IF EXISTS idx_order_history_table_time;
+        DROP INDEX IF EXISTS idx_order_history_time;
+        ALTER TABLE order_history_legacy RENAME CONSTRAINT order_history_pkey TO order_history_legacy_pkey;
+        ALTER SEQUENCE order_history_history_id_seq OWNED BY NONE;
+    """)
+
+    # 파티션 키는 기본 키에 포함되어야 하고 NULL일 수 없음
+    op.execute("""
+        CREATE TABLE order_history (
+            history_id INTEGER NOT NULL DEFAULT nextval('order_history_history_id_seq'),
+            session_id UUID NOT NULL,
+            table_id INTEGER NOT NULL,
+            store_id INTEGER NOT NULL,
+            completed_time TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            archived_order_data JSONB NOT NULL,
+            PRIMARY KEY (history_id, completed_time)
+        ) PARTITION BY RANGE (completed_time);
+
+        CREATE TABLE order_history_default PARTITION OF order_history DEFAULT;
+    """)
+    op.execute(INDEXES)
+    op.execute(ENSURE_PARTITIONS_FUNCTION)
+    op.execute("""
+        SELECT ensure_order_history_partitions(
+            COALESCE((SELECT min(completed_time) FROM order_history_legacy), CURRENT_TIMESTAMP)::date,
+            3
+        );
+    """)
+
+    op.execute("""
+        INSERT INTO order_history (history_id, session_id, table_id, store_id, completed_time, archived_order_data)
+        SELECT history_id, session_id, table_id, store_id,
+               COALESCE(completed_time, CURRENT_TIMESTAMP), archived_order_data
+        FROM order_history_legacy;
+
+        DROP TABLE order_history_legacy;
+        ALTER SEQUENCE order_history_history_id_seq OWNED BY order_history.history_id;
+        ANALYZE order_history;
+    """)
+
+
+def downgrade():
+    op.execute("""
+        ALTER TABLE order_history RENAME TO order_history_partitioned;
+        DROP INDEX IF EXISTS idx_order_history_store_id;
+        DROP INDEX IF EXISTS idx_order_history_table_time;
+        DROP INDEX IF EXISTS idx_order_history_time;
+        ALTER SEQUENCE order_history_history_id_seq OWNED BY NONE;
+
+        CREATE TABLE order_history (
+            history_id INTEGER PRIMARY KEY DEFAULT nextval('order_history_history_id_seq'),
+            session_id UUID NOT NULL,
+            table_id INTEGER NOT NULL,
+            store_id INTEGER NOT NULL,
+            completed_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            archived_order_data JSONB NOT NULL
+        );
+
+        INSERT INTO order_history
+        SELECT history_id, session_id, table_id, store_id, completed_time, archived_order_data
+        FROM order_history_partitioned;
+
+        DROP TABLE order_history_partitioned;
+        DROP FUNCTION IF EXISTS ensure_order_history_partitions(DATE, INTEGER);
+        ALTER SEQUENCE order_history_history_id_seq OWNED BY order_history.history_id;
+    """)
+    op.execute(INDEXES)
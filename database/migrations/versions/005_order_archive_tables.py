@@ -0,0 +1,56 @@
+"""Add cold tables for orders and order items of closed sessions"""
+
+from alembic import op
+
+# revision identifiers
+revision = '005_order_archive_tables'
+down_revision = '004_partition_order_history'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 라이브 테이블과 같은 컬럼 + 이동 시각. 메뉴/세션 삭제를 막지 않도록 FK는 두지 않음
+    op.execute("""
+        CREATE TABLE orders_archive (
+            order_id INTEGER PRIMARY KEY,
+            session_id UUID NOT NULL,
+            table_id INTEGER NOT NULL,
+            store_id INTEGER NOT NULL,
+            order_time TIMESTAMP,
+            total_amount INTEGER NOT NULL,
+            status VARCHAR(20),
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE order_items_archive (
+            order_item_id INTEGER PRIMARY KEY,
+            order_id INTEGER NOT NULL,
+            menu_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL,
+            unit_price INTEGER NOT NULL,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE INDEX idx_orders_archive_session ON orders_archive(session_id);
+        CREATE INDEX idx_order_items_archive_order ON order_items_archive(order_id);
+    """)
+
+
+def downgrade():
+    # 콜드 테이블에 남은 행을 라이브 테이블로 되돌린 뒤 삭제
+    op.execute("""
+        INSERT INTO orders (order_id, session_id, table_id, store_id, order_time, total_amount, status)
+        SELECT a.order_id, a.session_id, a.table_id, a.store_id, a.order_time, a.total_amount, a.status
+        FROM orders_archive a
+        JOIN table_sessions s ON s.session_id = a.session_id;
+
+        INSERT INTO order_items (order_item_id, order_id, menu_id, quantity, unit_price)
+        SELECT a.order_item_id, a.order_id, a.menu_id, a.quantity, a.unit_price
+        FROM order_items_archive a
+        JOIN orders o ON o.order_id = a.order_id
+        JOIN menus m ON m.menu_id = a.menu_id;
+
+        DROP TABLE order_items_archive;
+        DROP TABLE orders_archive;
+    """)
@@ -75,31 +75,58 @@ CREATE TABLE order_items (
     unit_price INTEGER NOT NULL CHECK (unit_price > 0)
 );
 
--- OrderHistory table - 주문 이력
-CREATE TABLE order_history (
-    history_id SERIAL PRIMARY KEY,
+-- 종료된 세션의 주문/항목 콜드 테이블 (백엔드 아카이버가 라이브 테이블에서 옮김, FK 없음)
+CREATE TABLE orders_archive (
+    order_id INTEGER PRIMARY KEY,
     session_id UUID NOT NULL,
     table_id INTEGER NOT NULL,
     store_id INTEGER NOT NULL,
-    completed_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    archived_order_data JSONB NOT NULL
+    order_time TIMESTAMP,
+    total_amount INTEGER NOT NULL,
+    status VARCHAR(20),
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE order_items_archive (
+    order_item_id INTEGER PRIMARY KEY,
+    order_id INTEGER NOT NULL,
+    menu_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    unit_price INTEGER NOT NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- Indexes for performance
-CREATE INDEX idx_categories_store_id ON categories(store_id);
-CREATE INDEX idx_menus_store_id ON menus(store_id);
-CREATE INDEX idx_menus_category_id ON menus(category_id);
-CREATE INDEX idx_tables_store_id ON tables(store_id);
+-- OrderHistory table - 주문 이력 (completed_time 월별 범위 파티션)
+CREATE TABLE order_history (
+    history_id SERIAL,
+    session_id UUID NOT NULL,
+    table_id INTEGER NOT NULL,
+    store_id INTEGER NOT NULL,
+    completed_time TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archived_order_data JSONB NOT NULL,
+    PRIMARY KEY (history_id, completed_time)
+) PARTITION BY RANGE (completed_time);
+
+-- 월 파티션이 없는 시각의 행을 받는 기본 파티션
+CREATE TABLE order_history_default PARTITION OF order_history DEFAULT;
+
+-- Indexes for performance (composite indexes follow repository query shapes)
+CREATE INDEX idx_categories_store_order ON categories(store_id, display_order);
+CREATE INDEX idx_menus_store_order ON menus(store_id, display_order);
+CREATE INDEX idx_menus_category_order ON menus(category_id, display_order);
+CREATE INDEX idx_tables_store_active ON tables(store_id, table_number) WHERE current_session_id IS NOT NULL;
 CREATE INDEX idx_table_sessions_table_id ON table_sessions(table_id);
-CREATE INDEX idx_table_sessions_active ON table_sessions(is_active) WHERE is_active = TRUE;
-CREATE INDEX idx_orders_session_id ON orders(session_id);
+CREATE INDEX idx_table_sessions_active_table ON table_sessions(table_id) WHERE is_active = TRUE;
+CREATE INDEX idx_orders_session_time ON orders(session_id, order_time DESC, order_id DESC);
 CREATE INDEX idx_orders_table_id ON orders(table_id);
-CREATE INDEX idx_orders_store_id ON orders(store_id);
+CREATE INDEX idx_orders_store_status_time ON orders(store_id, status, order_time DESC);
 CREATE INDEX idx_orders_time ON orders(order_time);
 CREATE INDEX idx_order_items_order_id ON order_items(order_id);
 CREATE INDEX idx_order_history_store_id ON order_history(store_id);
-CREATE INDEX idx_order_history_table_id ON order_history(table_id);
+CREATE INDEX idx_order_history_table_time ON order_history(table_id, completed_time DESC, history_id DESC);
 CREATE INDEX idx_order_history_time ON order_history(completed_time);
+CREATE INDEX idx_orders_archive_session ON orders_archive(session_id);
+CREATE INDEX idx_order_items_archive_order ON order_items_archive(order_id);
 
 -- Update current_session_id when new session is created
 CREATE OR REPLACE FUNCTION update_table_current_session()
@@ -132,3 +159,48 @@ CREATE TRIGGER trigger_clear_table_current_session
     AFTER UPDATE ON table_sessions
     FOR EACH ROW
     EXECUTE FUNCTION clear_table_current_session();
+
+-- 월별 order_history 파티션을 from_month부터 현재 월 + months_ahead까지 생성
+-- (애플리케이션이 시작 시와 주기적으로 호출)
+CREATE OR REPLACE FUNCTION ensure_order_history_partitions(from_month DATE, months_ahead INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::date;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => months_ahead))::date;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    -- 여러 워커가 동시에 호출해도 한 번씩만 생성
+    PERFORM pg_advisory_xact_lock(hashtext('ensure_order_history_partitions'));
+
+    WHILE month_start <= last_month LOOP
+        partition_name := 'order_history_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            -- 기본 파티션에 이미 들어간 해당 월 행은 새 파티션으로 옮김
+            CREATE TEMP TABLE IF NOT EXISTS order_history_moved
+                (LIKE order_history) ON COMMIT DROP;
+            WITH moved AS (
+                DELETE FROM order_history_default
+                WHERE completed_time >= month_start
+                  AND completed_time < month_start + interval '1 month'
+                RETURNING *
+            )
+            INSERT INTO order_history_moved SELECT * FROM moved;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF order_history FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + interval '1 month')::date
+            );
+
+            INSERT INTO order_history SELECT * FROM order_history_moved;
+            TRUNCATE order_history_moved;
+            created := created + 1;
+        END IF;
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT ensure_order_history_partitions(CURRENT_DATE, 3);
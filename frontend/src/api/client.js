@@ -3,6 +3,8 @@ import axios from 'axios';
 const apiClient = axios.create({
   baseURL: import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000',
   timeout: 10000,
+  // 쓰기 직후 읽기를 primary DB로 보내는 쿠키 전달
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },